@@ -0,0 +1,77 @@
+from contextlib import contextmanager
+
+import mock.GPIO as GPIO
+
+
+class ActuatorBank:
+    """
+    Write-coalescing layer in front of GPIO.output: it remembers the last value committed to each
+    output pin and drops the writes that would not change it.
+    Inside batch(), the writes are collected and the real changes are issued with a single GPIO call
+    when the batch ends. The remembered values are dropped after a GPIO.cleanup(), which resets the pins.
+    """
+
+    def __init__(self):
+        self.committed = {}  # pin -> last value written to the GPIO
+        self.pending = {}    # pin -> value requested during the current batch
+        self.batching = False
+        self.writes_requested = 0
+        self.writes_issued = 0
+        self.cleanups = GPIO.cleanups  # value of GPIO.cleanups when committed was last valid
+
+    @property
+    def writes_suppressed(self) -> int:
+        return self.writes_requested - self.writes_issued
+
+    def write(self, pin: int, value: int) -> None:
+        """
+        Requests an output pin to be set to the given value.
+        """
+        self.writes_requested += 1
+        if self.batching:
+            self.pending[pin] = value
+            return
+        if self.cleanups != GPIO.cleanups:
+            self.invalidate()
+        if self.committed.get(pin) != value:
+            GPIO.output(pin, value)
+            self.committed[pin] = value
+            self.writes_issued += 1
+
+    def flush(self) -> None:
+        """
+        Issues the pending writes that change the value of their pins, all with one GPIO call.
+        """
+        if self.cleanups != GPIO.cleanups:
+            self.invalidate()
+        changed = [(pin, value) for pin, value in self.pending.items() if self.committed.get(pin) != value]
+        self.pending.clear()
+        if not changed:
+            return
+        pins = [pin for pin, _ in changed]
+        values = [value for _, value in changed]
+        GPIO.output_many(pins, values)
+        self.committed.update(changed)
+        self.writes_issued += len(changed)
+
+    @contextmanager
+    def batch(self):
+        """
+        Collects the writes issued in the with block and flushes them when the block ends.
+        """
+        if self.batching:
+            yield self
+            return
+        self.batching = True
+        try:
+            yield self
+        finally:
+            self.batching = False
+            self.flush()
+
+    def invalidate(self) -> None:
+        """
+        Forgets the committed values, so the next writes are always issued; done automatically after GPIO.cleanup().
+        """
+        self.committed.clear()
+        self.cleanups = GPIO.cleanups
@@ -0,0 +1,103 @@
+import asyncio
+from collections import deque
+from typing import Iterable
+
+import mock.GPIO as GPIO
+from mock.RTC import RTC
+from BlindsSchedule import BlindsSchedule
+from IntelligentOffice import IntelligentOffice
+
+
+class AsyncRuntime:
+    """
+    asyncio control loop hosting many offices in one event loop.
+    Each concern of each office runs as its own task: occupancy and light at a fast period,
+    air quality at a slow period, blinds driven by the next transition of their schedule.
+    """
+    LATENESS_SAMPLES = 100000
+
+    def __init__(self, offices: Iterable[IntelligentOffice] = (), light_period: float = 1.0, air_period: float = 10.0):
+        """
+        Constructor
+        :param offices: the offices to control.
+        :param light_period: seconds between two checks of occupancy and light level.
+        :param air_period: seconds between two checks of the air quality.
+        """
+        self.offices = list(offices)
+        self.light_period = light_period
+        self.air_period = air_period
+        self.tasks = []
+        self.stopped = None
+        # How late (in seconds) the periodic tasks woke up with respect to their schedule
+        self.lateness = deque(maxlen=self.LATENESS_SAMPLES)
+
+    async def every(self, period: float, action) -> None:
+        """
+        Runs action every period seconds; the schedule does not drift when an action takes time.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            action()
+            deadline += period
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            self.lateness.append(loop.time() - deadline)
+
+    async def blinds(self, office: IntelligentOffice) -> None:
+        """
+        Brings the blinds in the right position and then sleeps until the next transition of their schedule.
+        """
+        await office.manage_blinds_async(asyncio.sleep)
+        while True:
+            now = RTC.get_current_datetime()
+            when, _ = office.effective_blinds_schedule.next_transition(now)
+            await asyncio.sleep(BlindsSchedule.seconds_until(now, when))
+            await office.manage_blinds_async(asyncio.sleep)
+
+    def start(self) -> None:
+        """
+        Creates the tasks of every office; must be called from the event loop.
+        """
+        self.stopped = asyncio.Event()
+        for office in self.offices:
+            office.blinds_polling = False
+            self.tasks.append(asyncio.create_task(self.every(self.light_period, office.manage_light_level)))
+            self.tasks.append(asyncio.create_task(self.every(self.air_period, office.monitor_air_quality)))
+            self.tasks.append(asyncio.create_task(self.blinds(office)))
+
+    async def run(self, duration: float = None) -> None:
+        """
+        Runs the offices until stop() is called or, if given, for duration seconds, then shuts down.
+        """
+        self.start()
+        try:
+            if duration is None:
+                await self.stopped.wait()
+            else:
+                try:
+                    await asyncio.wait_for(self.stopped.wait(), duration)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self.shutdown()
+
+    def stop(self) -> None:
+        if self.stopped is not None:
+            self.stopped.set()
+
+    async def shutdown(self) -> None:
+        """
+        Cancels every task, stops the PWM of the servos and cleans up the GPIO channels of the offices;
+        the other channels of the board are left as they are.
+        """
+        for task in self.tasks:
+            task.cancel()
+        results = await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        for office in self.offices:
+            office.pwm.stop()
+            office.blinds_polling = True
+            office.cleanup()
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise errors[0]
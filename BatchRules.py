@@ -0,0 +1,38 @@
+"""
+Vectorized versions of the light level and air quality rules of IntelligentOffice.
+
+Each function evaluates the rule for many offices at once, taking NumPy arrays that hold
+one element per office, and applies exactly the same hysteresis as the scalar methods.
+"""
+import numpy as np
+
+from IntelligentOffice import IntelligentOffice
+
+
+def batch_light_level(occupancy, lux, light_on,
+                      lux_min: int = IntelligentOffice.LUX_MIN, lux_max: int = IntelligentOffice.LUX_MAX) -> np.ndarray:
+    """
+    Batch version of IntelligentOffice.manage_light_level.
+    :param occupancy: raw infrared sensor readings (0 means that someone is in the office).
+    :param lux: photoresistor readings.
+    :param light_on: current state of the smart light bulbs.
+    :return: the new state of the smart light bulbs.
+    """
+    occupied = np.asarray(occupancy) == 0
+    lux = np.asarray(lux)
+    light_on = np.asarray(light_on, dtype=bool)
+    regulated = np.where(lux < lux_min, True, np.where(lux > lux_max, False, light_on))
+    return occupied & regulated
+
+
+def batch_air_quality(co2, fan_switch_on,
+                      co2_max: int = IntelligentOffice.CO2_MAX, co2_min: int = IntelligentOffice.CO2_MIN) -> np.ndarray:
+    """
+    Batch version of IntelligentOffice.monitor_air_quality.
+    :param co2: carbon dioxide sensor readings (PPM).
+    :param fan_switch_on: current state of the exhaust fan switches.
+    :return: the new state of the exhaust fan switches.
+    """
+    co2 = np.asarray(co2)
+    fan_switch_on = np.asarray(fan_switch_on, dtype=bool)
+    return np.where(co2 >= co2_max, True, np.where(co2 < co2_min, False, fan_switch_on))
@@ -0,0 +1,159 @@
+import threading
+from datetime import date, datetime, time, timedelta, timezone
+from functools import cached_property
+from typing import Callable, Iterable, Optional, Tuple
+
+from IntelligentOfficeError import IntelligentOfficeError
+from mock.RTC import RTC
+
+MINUTES_PER_DAY = 24 * 60
+DAYS_PER_WEEK = 7
+
+
+class BlindsSchedule:
+    """
+    Weekly blinds rules compiled into a sorted list of transitions and a lookup table with one entry
+    per minute of the week.
+    """
+
+    def __init__(self, open_time: time = time(8, 0), close_time: time = time(20, 0),
+                 working_days: Iterable[int] = (0, 1, 2, 3, 4), holidays: Iterable[date] = ()):
+        """
+        Constructor
+        :param open_time: time at which the blinds are fully opened on working days.
+        :param close_time: time at which the blinds are fully closed on working days.
+        :param working_days: days of the week (MONDAY is 0) on which the blinds are managed.
+        :param holidays: dates on which the blinds are not managed, even if they are working days.
+        """
+        # The blinds are open between the two times of the same day
+        if open_time >= close_time:
+            raise IntelligentOfficeError("The blinds must open before they close")
+        self.open_minute = open_time.hour * 60 + open_time.minute
+        self.close_minute = close_time.hour * 60 + close_time.minute
+        self.working_days = frozenset(working_days)
+        self.holidays = frozenset(holidays)
+        self.transitions = sorted(
+            [(day * MINUTES_PER_DAY + self.open_minute, True) for day in self.working_days] +
+            [(day * MINUTES_PER_DAY + self.close_minute, False) for day in self.working_days])
+
+    @cached_property
+    def table(self) -> tuple:
+        """
+        What the blinds have to do at every minute of the week; built on the first lookup, so that
+        schedules created at import time (e.g. IntelligentOffice.DEFAULT_BLINDS_SCHEDULE) cost nothing until used.
+        """
+        return tuple(self.compute_action(day, minute)
+                     for day in range(DAYS_PER_WEEK) for minute in range(MINUTES_PER_DAY))
+
+    def compute_action(self, weekday: int, minute: int) -> Optional[bool]:
+        """
+        :return: True if the blinds have to be open at the given minute of the day, False if they have
+        to be closed and None if they have to be left as they are.
+        """
+        if weekday not in self.working_days:
+            return None
+        return self.open_minute <= minute < self.close_minute
+
+    def action(self, weekday: int, hour: int, minute: int) -> Optional[bool]:
+        """
+        O(1) lookup of what the blinds have to do at the given time of the week (holidays excluded).
+        """
+        return self.table[weekday * MINUTES_PER_DAY + hour * 60 + minute]
+
+    def action_at(self, moment: datetime) -> Optional[bool]:
+        """
+        Same as action(), but also takes the holidays into account.
+        """
+        action = self.action(moment.weekday(), moment.hour, moment.minute)
+        if action is not None and self.holidays and moment.date() in self.holidays:
+            return None
+        return action
+
+    def next_transition(self, moment: datetime) -> Tuple[datetime, bool]:
+        """
+        Finds the first transition strictly after the given moment.
+        Transitions are computed on the local wall clock, so with an aware moment the blinds keep moving
+        at 8:00 and 20:00 across DST changes.
+        :param moment: the current date and time (naive or timezone-aware).
+        :return: the date and time of the next transition and True if the blinds are opened, False otherwise.
+        """
+        if not self.transitions:
+            raise ValueError("The schedule has no transitions")
+        day = moment.date()
+        # Every holiday can delay the next working day by one day at most
+        for _ in range(len(self.holidays) + DAYS_PER_WEEK + 1):
+            if day.weekday() in self.working_days and day not in self.holidays:
+                for minute, is_open in ((self.open_minute, True), (self.close_minute, False)):
+                    when = datetime.combine(day, time(minute // 60, minute % 60), tzinfo=moment.tzinfo)
+                    if when > moment:
+                        return when, is_open
+            day += timedelta(days=1)
+        raise ValueError("The schedule has no transitions after {}".format(moment))
+
+    @staticmethod
+    def seconds_until(moment: datetime, when: datetime) -> float:
+        """
+        Elapsed time between two moments, computed in UTC so that DST changes are accounted for.
+        Naive moments (e.g., the ones of the RTC) are taken as local time.
+        """
+        return (when.astimezone(timezone.utc) - moment.astimezone(timezone.utc)).total_seconds()
+
+
+class BlindsScheduler:
+    """
+    Drives the blinds of an office from its schedule: instead of polling the RTC on every tick,
+    it sleeps until the next transition.
+    """
+
+    def __init__(self, office, clock: Callable[[], datetime] = RTC.get_current_datetime,
+                 sleep: Callable[[float], None] = None):
+        """
+        Constructor
+        :param office: the IntelligentOffice whose blinds are managed; its effective_blinds_schedule is used.
+        :param clock: returns the current date and time, naive (local time) or timezone-aware.
+        :param sleep: waits for the given number of seconds; by default the wait is interrupted by stop().
+        """
+        self.office = office
+        self.clock = clock
+        self.sleep = sleep if sleep is not None else self.wait
+        self.stopped = threading.Event()
+        self.checks = 0
+
+    def wait(self, seconds: float) -> None:
+        self.stopped.wait(seconds)
+
+    def apply(self, moment: datetime) -> None:
+        """
+        Moves the blinds to the position required by the schedule at the given moment.
+        """
+        self.checks += 1
+        is_open = self.office.effective_blinds_schedule.action_at(moment)
+        if is_open is True:
+            self.office.open_blinds()
+        elif is_open is False:
+            self.office.close_blinds()
+
+    def run(self, transitions: int = None) -> None:
+        """
+        Brings the blinds in the right position and then follows the schedule until stop() is called.
+        While running, the office stops polling the blinds in its tick().
+        :param transitions: optional number of transitions after which the scheduler returns.
+        """
+        self.office.blinds_polling = False
+        try:
+            self.apply(self.clock())
+            done = 0
+            while not self.stopped.is_set() and (transitions is None or done < transitions):
+                now = self.clock()
+                when, _ = self.office.effective_blinds_schedule.next_transition(now)
+                self.sleep(BlindsSchedule.seconds_until(now, when))
+                if self.stopped.is_set():
+                    break
+                now = self.clock()
+                self.apply(now if now > when else when)
+                done += 1
+        finally:
+            self.office.blinds_polling = True
+
+    def stop(self) -> None:
+        self.stopped.set()
@@ -0,0 +1,81 @@
+from typing import TYPE_CHECKING
+
+from IntelligentOffice import IntelligentOffice
+from mock.RTC import RTC
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+
+class BuildingController:
+    """
+    Owns the offices of a building and runs their control cycles on a pool of workers.
+    """
+    # Each simulated office gets its own 40-pin board, so pin numbers never collide
+    PINS_PER_BOARD = 40
+
+    def __init__(self, max_workers: int = None, executor: 'Executor' = None):
+        """
+        Constructor
+        :param max_workers: number of worker threads used to run the offices' control cycles.
+        :param executor: optional executor to use instead of the default ThreadPoolExecutor.
+        """
+        self.offices = []
+        self.owns_executor = executor is None
+        if executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.executor = executor
+
+    @classmethod
+    def pin_map(cls, index: int) -> dict:
+        """
+        Computes the pin map of the index-th office of the building.
+        :param index: position of the office in the building (starting from 0).
+        :return: a pin map that can be passed to IntelligentOffice.
+        """
+        offset = index * cls.PINS_PER_BOARD
+        return {name: getattr(IntelligentOffice, name) + offset for name in IntelligentOffice.PIN_NAMES}
+
+    def add_office(self, pins: dict = None, **kwargs) -> IntelligentOffice:
+        """
+        Creates a new office and adds it to the building.
+        :param pins: the pin map of the office; if missing, a free board is assigned to it.
+        :return: the new office.
+        """
+        if pins is None:
+            pins = self.pin_map(len(self.offices))
+        office = IntelligentOffice(pins=pins, **kwargs)
+        self.offices.append(office)
+        return office
+
+    def tick(self, chunk_size: int = 64) -> None:
+        """
+        Runs one control cycle on every office of the building and waits for all of them to finish.
+        Offices are handed to the workers in chunks to keep the scheduling overhead low, and all of them
+        share a single RTC snapshot taken at the beginning of the tick.
+        :param chunk_size: number of offices processed by a worker in a single task.
+        """
+        chunks = [self.offices[i:i + chunk_size] for i in range(0, len(self.offices), chunk_size)]
+        with RTC.frozen() as snapshot:
+            for future in [self.executor.submit(self.tick_offices, chunk, snapshot) for chunk in chunks]:
+                future.result()
+
+    @staticmethod
+    def tick_offices(offices: list, snapshot=None) -> None:
+        """
+        :param snapshot: optional RTC snapshot of the building tick, installed in the worker thread.
+        """
+        with RTC.frozen(snapshot):
+            for office in offices:
+                office.tick()
+
+    def close(self) -> None:
+        if self.owns_executor:
+            self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,9 +1,19 @@
-import time
+import threading
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional, Tuple
 
+from ActuatorBank import ActuatorBank
+from BlindsSchedule import BlindsSchedule
 from IntelligentOfficeError import IntelligentOfficeError
+from Lighting import LightingStateMachine
+from RuleEngine import RuleEngine, RuleSet, compile_air_quality_rule, compile_light_rule
+from Ventilation import PredictiveVentilation
 import mock.GPIO as GPIO
 from mock.RTC import RTC
 
+if TYPE_CHECKING:
+    # concurrent.futures is only imported when an office actually moves its servo on a timer (async_servo)
+    from concurrent.futures import Future
+
 
 class IntelligentOffice:
     # Pin number definition
@@ -14,19 +24,47 @@ class IntelligentOffice:
     LED_PIN = 29
     CO2_PIN = 31
     FAN_PIN = 32
+    PIN_NAMES = ("INFRARED_PIN", "RTC_PIN", "SERVO_PIN", "PHOTO_PIN", "LED_PIN", "CO2_PIN", "FAN_PIN")
 
     LUX_MIN = 500
     LUX_MAX = 550
 
+    CO2_MAX = 800  # PPM, the fan is turned on at or above this level
+    CO2_MIN = 500  # PPM, the fan is turned off below this level
+
+    # Opens the blinds at 8:00 and closes them at 20:00 from MONDAY to FRIDAY
+    DEFAULT_BLINDS_SCHEDULE = BlindsSchedule()
+
     DC_OPEN = (180 / 18) + 2
     DC_CLOSED = (0 / 18) + 2
 
-    def __init__(self):
+    SERVO_MOVE_TIME = 1  # seconds needed by the servo to complete a move
+    OCCUPANCY_BOUNCETIME = 200  # ms, edges of the infrared sensor closer than this are ignored
+
+    def __init__(self, async_servo: bool = False, pins: dict = None, blinds_schedule: BlindsSchedule = None,
+                 event_driven_occupancy: bool = False, rules: RuleEngine = None,
+                 ventilation: PredictiveVentilation = None, lighting: LightingStateMachine = None):
         """
         Constructor
+        :param async_servo: if True, servo moves are scheduled on a timer and do not block the caller.
+        :param pins: optional pin map (e.g., {"LED_PIN": 40}) overriding the default pin numbers of this office.
+        :param blinds_schedule: optional schedule of the blinds of this office (DEFAULT_BLINDS_SCHEDULE otherwise).
+        :param event_driven_occupancy: if True, the occupancy is updated by the edges of the infrared sensor
+        instead of being read from it every time it is checked.
+        :param rules: optional RuleEngine whose current rules replace the built-in light, air quality and blinds rules.
+        :param ventilation: optional predictive controller of the fan; the air quality rule is used as its fallback.
+        :param lighting: optional state machine that delays the light switches (vacancy grace period, dwell times).
         """
-        GPIO.setmode(GPIO.BOARD)
-        GPIO.setwarnings(False)
+        if pins is not None:
+            for name, pin in pins.items():
+                if name not in self.PIN_NAMES:
+                    raise IntelligentOfficeError("Unknown pin name: {}".format(name))
+                setattr(self, name, pin)
+
+        # The numbering mode is shared by every office of the board, so it is set only once
+        if GPIO.getmode() != GPIO.BOARD:
+            GPIO.setmode(GPIO.BOARD)
+            GPIO.setwarnings(False)
         GPIO.setup(self.INFRARED_PIN, GPIO.IN)
         GPIO.setup(self.PHOTO_PIN, GPIO.IN)
         GPIO.setup(self.SERVO_PIN, GPIO.OUT)
@@ -41,48 +79,230 @@ class IntelligentOffice:
         self.blinds_open = False
         self.light_on = False
         self.fan_switch_on = False
+        self.actuators = ActuatorBank()  # LED and fan writes go through it, so no-op writes are dropped
+
+        self.async_servo = async_servo
+        self.servo_move = None  # Future of the servo move in progress, if any
+        self.servo_target = None  # whether the move in progress opens the blinds
+        self.next_move = None  # Future of the move queued after the one in progress, if any
+        self.next_target = None  # whether the queued move opens the blinds
+        self.servo_lock = threading.Lock()
+
+        # The built-in rules, compiled like the ones of a rule engine
+        self.builtin_rules = RuleSet(
+            compile_light_rule(self.LUX_MIN, self.LUX_MAX), compile_air_quality_rule(self.CO2_MAX, self.CO2_MIN),
+            blinds_schedule if blinds_schedule is not None else self.DEFAULT_BLINDS_SCHEDULE,
+            {"light": {"lux_min": self.LUX_MIN, "lux_max": self.LUX_MAX},
+             "air_quality": {"co2_on": self.CO2_MAX, "co2_off": self.CO2_MIN}})
+        self.blinds_polling = True  # False while a BlindsScheduler drives the blinds
+        self.rules = rules
+        self.ventilation = ventilation
+        self.lighting = lighting
+
+        self.event_driven_occupancy = event_driven_occupancy
+        self.occupied = False
+        if event_driven_occupancy:
+            GPIO.add_event_detect(self.INFRARED_PIN, GPIO.BOTH, callback=self.on_occupancy_edge,
+                                  bouncetime=self.OCCUPANCY_BOUNCETIME)
+            self.occupied = self.read_occupancy()
+
+    def cleanup(self) -> None:
+        """
+        Cleans up the GPIO channels of this office only, unlike GPIO.cleanup(), which resets every channel
+        of the board. The outputs are reset to LOW, so the light and the fan are off afterwards.
+        """
+        GPIO.cleanup([getattr(self, name) for name in self.PIN_NAMES if name != "RTC_PIN"])
+        self.actuators.invalidate()
+        self.light_on = self.fan_switch_on = False
 
     def check_occupancy(self) -> bool:
         """
         Checks if the infrared distance sensor on the ceiling detects something in front of it.
-        :param pin: The data pin of the sensor that is being checked (e.g., INFRARED_PIN1).
+        In event-driven mode, the occupancy cached by the last edge of the sensor is returned without reading it.
         :return: True if the infrared sensor detects something, False otherwise.
         """
+        if self.event_driven_occupancy:
+            return self.occupied
+        return self.read_occupancy()
+
+    def on_occupancy_edge(self, channel: int) -> None:
+        """
+        GPIO callback invoked when the output of the infrared sensor changes.
+        """
+        self.occupied = self.read_occupancy()
+
+    def read_occupancy(self) -> bool:
         result = GPIO.input(self.INFRARED_PIN)
         if result == 0:
             return True
         else:
             return False
 
-    def manage_blinds_based_on_time(self) -> None:
+    def manage_blinds_based_on_time(self, rules: RuleSet = None) -> Optional['Future']:
         """
         Uses the RTC and servo motor to open/close the blinds based on current time and day.
         The system fully opens the blinds at 8:00 and fully closes them at 20:00
-        each day except for Saturday and Sunday.
+        each day except for Saturday and Sunday (or as stated by the blinds_schedule of the office).
+        :param rules: the rules to apply (see effective_rules), read by tick() once per control cycle.
+        :return: the Future of the servo move when async_servo is enabled and the blinds are moving, None otherwise.
         """
-        current_time = time.strptime(RTC.get_current_time_string(), "%H:%M:%S")
-        hour = current_time.tm_hour
-        day = RTC.get_current_day()
-
-        if day in ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY"]:
-            if 8 <= hour < 20:
-                self.open_blinds()
-            else:
-                self.close_blinds()
-        elif day in ["SATURDAY", "SUNDAY"]:
-            pass
+        action = self.blinds_action(rules)
+        if action is None:
+            return None
+        elif action:
+            return self.open_blinds()
         else:
-            raise IntelligentOfficeError
+            return self.close_blinds()
+
+    @property
+    def blinds_schedule(self) -> BlindsSchedule:
+        """
+        The schedule of the blinds of this office (DEFAULT_BLINDS_SCHEDULE unless given); see effective_blinds_schedule.
+        """
+        return self.builtin_rules.blinds
+
+    @blinds_schedule.setter
+    def blinds_schedule(self, schedule: BlindsSchedule) -> None:
+        self.builtin_rules.blinds = schedule
+
+    @property
+    def effective_rules(self) -> RuleSet:
+        """
+        The rules in force: the current ones of the rule engine, if any, otherwise the built-in ones of the office.
+        A control cycle reads them once, so a reload of the rule engine never mixes old and new rules in it.
+        """
+        return self.builtin_rules if self.rules is None else self.rules.current
+
+    @property
+    def effective_blinds_schedule(self) -> BlindsSchedule:
+        """
+        The schedule that drives the blinds: the one of the rule engine, if any, otherwise the one of the office.
+        """
+        return self.effective_rules.blinds
 
-    def open_blinds(self) -> None:
-        if not self.blinds_open:
-            self.change_servo_angle(self.DC_OPEN)
-            self.blinds_open = True
+    @property
+    def effective_co2_thresholds(self) -> Tuple[int, int]:
+        """
+        The CO2 levels (PPM) at which the fan is turned on and below which it is turned off: the ones of the rule
+        engine, if any, otherwise the ones of the office (CO2_MAX, CO2_MIN).
+        """
+        return self.effective_rules.co2_thresholds
 
-    def close_blinds(self) -> None:
-        if self.blinds_open:
-            self.change_servo_angle(self.DC_CLOSED)
-            self.blinds_open = False
+    def blinds_action(self, rules: RuleSet = None) -> Optional[bool]:
+        """
+        Looks up in the blinds schedule what the blinds have to do at the current time of the RTC.
+        :param rules: the rules to apply, the effective ones if missing.
+        :return: True if the blinds have to be open, False if they have to be closed, None if they have to be left as
+        they are.
+        """
+        if rules is None:
+            rules = self.effective_rules
+        # The RTC is read once: the day, the time and the date all come from the same reading
+        return rules.blinds.action_at(RTC.get_current_datetime())
+
+    async def manage_blinds_async(self, sleep: Callable[[float], Awaitable[None]]) -> None:
+        """
+        Awaitable version of manage_blinds_based_on_time: the servo wait is a sleep of the event loop,
+        so the other tasks of the event loop keep running while the blinds move.
+        :param sleep: the sleep coroutine function of the event loop running the office (e.g., asyncio.sleep).
+        """
+        action = self.blinds_action()
+        if action is None or action == self.blinds_open:
+            return
+        duty_cycle = self.DC_OPEN if action else self.DC_CLOSED
+        await self.change_servo_angle_async(duty_cycle, sleep, lambda: setattr(self, "blinds_open", action))
+
+    async def change_servo_angle_async(self, duty_cycle: float, sleep: Callable[[float], Awaitable[None]],
+                                       on_done: Callable[[], None] = None) -> None:
+        """
+        Awaitable version of change_servo_angle.
+        :param sleep: the sleep coroutine function of the event loop running the office (e.g., asyncio.sleep).
+        """
+        GPIO.output(self.SERVO_PIN, GPIO.HIGH)
+        self.pwm.ChangeDutyCycle(duty_cycle)
+        await sleep(self.SERVO_MOVE_TIME)
+        self.end_servo_pulse(on_done)
+
+    def tick(self) -> None:
+        """
+        Runs one control cycle of the office: light level (which also checks the occupancy),
+        blinds and air quality. All the sensors are read at once at the beginning of the cycle
+        and the changes of the light and fan outputs are written at once at the end of it.
+        The RTC is read at most once per cycle (or once per building tick, see BuildingController.tick),
+        and so are the rules.
+        """
+        occupied, light_level, c02_level = self.read_sensors()
+        rules = self.start_cycle()
+        with RTC.frozen(), self.actuators.batch():
+            self.apply_light_level(occupied, light_level, rules)
+            if self.blinds_polling:
+                self.manage_blinds_based_on_time(rules)
+            self.apply_air_quality(c02_level, occupied, rules)
+
+    def start_cycle(self) -> RuleSet:
+        """
+        Starts a control cycle. After a GPIO.cleanup(), which resets the outputs to LOW, the light and the fan are
+        off and the values committed to the outputs are forgotten, so the next changes are written again.
+        :return: the effective rules, read once for the whole cycle.
+        """
+        if self.actuators.cleanups != GPIO.cleanups:
+            self.actuators.invalidate()
+            self.light_on = self.fan_switch_on = False
+        return self.effective_rules
+
+    def read_sensors(self) -> tuple:
+        """
+        Reads the infrared sensor, the photoresistor and the carbon dioxide sensor with a single GPIO call.
+        In event-driven mode, the cached occupancy is used instead of reading the infrared sensor.
+        :return: the occupancy, the light level and the amount of CO2 (PPM).
+        """
+        if self.event_driven_occupancy:
+            light_level, c02_level = GPIO.input_many((self.PHOTO_PIN, self.CO2_PIN))
+            return self.occupied, light_level, c02_level
+        infrared, light_level, c02_level = GPIO.input_many((self.INFRARED_PIN, self.PHOTO_PIN, self.CO2_PIN))
+        return infrared == 0, light_level, c02_level
+
+    def open_blinds(self) -> Optional['Future']:
+        return self.move_blinds(True)
+
+    def close_blinds(self) -> Optional['Future']:
+        return self.move_blinds(False)
+
+    def move_blinds(self, blinds_open: bool) -> Optional['Future']:
+        """
+        Opens or closes the blinds. With async_servo, a move in progress is never interrupted: asking for the
+        position it goes to returns its Future, asking for the other one queues a move after it. Only the last
+        queued position is kept, and the queued move is skipped if the blinds are already there.
+        :param blinds_open: True to open the blinds, False to close them.
+        :return: the Future of the move that takes the blinds to the position with async_servo, None otherwise
+        or if the blinds are already there.
+        """
+        with self.servo_lock:
+            if self.servo_move is not None:
+                if self.next_move is None:
+                    if blinds_open == self.servo_target:
+                        return self.servo_move
+                    from concurrent.futures import Future
+                    self.next_move = Future()
+                    self.next_move.set_running_or_notify_cancel()
+                self.next_target = blinds_open
+                return self.next_move
+            if blinds_open == self.blinds_open:
+                return None
+            self.servo_target = blinds_open
+            return self.change_servo_angle(self.DC_OPEN if blinds_open else self.DC_CLOSED,
+                                           lambda: setattr(self, "blinds_open", blinds_open))
+
+    def restore_state(self, blinds_open: bool, light_on: bool, fan_switch_on: bool) -> None:
+        """
+        Takes over the state saved before a restart (see StateSnapshot). The light and the fan are driven
+        again, while the blinds are known to be where they were left, so no servo move is needed.
+        """
+        self.blinds_open = blinds_open
+        self.actuators.write(self.LED_PIN, GPIO.HIGH if light_on else GPIO.LOW)
+        self.light_on = light_on
+        self.actuators.write(self.FAN_PIN, GPIO.HIGH if fan_switch_on else GPIO.LOW)
+        self.fan_switch_on = fan_switch_on
 
     def manage_light_level(self) -> None:
         """
@@ -96,20 +316,35 @@ class IntelligentOffice:
         When the worker goes back into the office, the system resumes regulating the light level
         """
         if self.check_occupancy():
-            light_level = GPIO.input(self.PHOTO_PIN)
-            if light_level < self.LUX_MIN:
+            self.apply_light_level(True, GPIO.input(self.PHOTO_PIN))
+        else:
+            self.apply_light_level(False, None)
+
+    def apply_light_level(self, occupied: bool, light_level: Optional[int], rules: RuleSet = None) -> None:
+        """
+        Light level rule of manage_light_level, applied to readings that have already been taken.
+        The lighting state machine, if any, then decides when the wanted state is applied.
+        :param occupied: True if someone is in the office.
+        :param light_level: the light level measured by the photoresistor (not used when the office is vacant).
+        :param rules: the rules of the control cycle, a new cycle is started if missing.
+        """
+        if rules is None:
+            rules = self.start_cycle()
+        light_on = rules.light(occupied, light_level, self.light_on)
+        if self.lighting is not None:
+            light_on = self.lighting.decide(RTC.get_current_datetime(), occupied, light_on, self.light_on)
+        if light_on != self.light_on:
+            if light_on:
                 self.turn_on_light()
-            elif light_level > self.LUX_MAX:
+            else:
                 self.turn_off_light()
-        else:
-            self.turn_off_light()
 
     def turn_on_light(self) -> None:
-        GPIO.output(self.LED_PIN, GPIO.HIGH)
+        self.actuators.write(self.LED_PIN, GPIO.HIGH)
         self.light_on = True
 
     def turn_off_light(self) -> None:
-        GPIO.output(self.LED_PIN, GPIO.LOW)
+        self.actuators.write(self.LED_PIN, GPIO.LOW)
         self.light_on = False
 
     def monitor_air_quality(self) -> None:
@@ -118,21 +353,73 @@ class IntelligentOffice:
         If the amount of detected CO2 is greater than or equal to 800 PPM, the system turns on the
         switch of the exhaust fan until the amount of CO2 is lower than 500 PPM.
         """
-        c02_level = GPIO.input(self.CO2_PIN)
-        if c02_level >= 800:
-            GPIO.output(self.FAN_PIN, GPIO.HIGH)
-            self.fan_switch_on = True
-        elif c02_level < 500:
-            GPIO.output(self.FAN_PIN, GPIO.LOW)
-            self.fan_switch_on = False
+        self.apply_air_quality(GPIO.input(self.CO2_PIN))
 
-    def change_servo_angle(self, duty_cycle: float) -> None:
+    def apply_air_quality(self, c02_level: int, occupied: bool = None, rules: RuleSet = None) -> None:
+        """
+        Air quality rule of monitor_air_quality, applied to a reading that has already been taken.
+        :param c02_level: the amount of CO2 (PPM) measured by the carbon dioxide sensor.
+        :param occupied: True if someone is in the office; only used by the predictive ventilation,
+        which checks the occupancy itself if missing.
+        :param rules: the rules of the control cycle, a new cycle is started if missing.
+        """
+        if rules is None:
+            rules = self.start_cycle()
+        if self.ventilation is None:
+            fan_switch_on = rules.air_quality(c02_level, self.fan_switch_on)
+        else:
+            if occupied is None:
+                occupied = self.check_occupancy()
+            fan_switch_on = self.ventilation.decide(RTC.get_current_datetime(), c02_level, occupied,
+                                                    self.fan_switch_on, *rules.co2_thresholds)
+            if fan_switch_on is None:
+                fan_switch_on = rules.air_quality(c02_level, self.fan_switch_on)
+        if fan_switch_on != self.fan_switch_on:
+            self.switch_fan(fan_switch_on)
+
+    def switch_fan(self, fan_switch_on: bool) -> None:
+        self.actuators.write(self.FAN_PIN, GPIO.HIGH if fan_switch_on else GPIO.LOW)
+        self.fan_switch_on = fan_switch_on
+
+    def change_servo_angle(self, duty_cycle: float, on_done: Callable[[], None] = None) -> Optional['Future']:
         """
         Changes the servo motor's angle by passing to it the corresponding PWM duty cycle signal
         :param duty_cycle: the length of the duty cycle
+        :param on_done: optional callback invoked once the move is completed
+        :return: None in blocking mode, otherwise a Future that is resolved when the move is completed.
         """
         GPIO.output(self.SERVO_PIN, GPIO.HIGH)
         self.pwm.ChangeDutyCycle(duty_cycle)
-        time.sleep(1)
+        if not self.async_servo:
+            RTC.sleep(self.SERVO_MOVE_TIME)
+            self.end_servo_pulse(on_done)
+            return None
+
+        from concurrent.futures import Future
+        move = Future()
+        move.set_running_or_notify_cancel()
+        self.servo_move = move
+        timer = threading.Timer(self.SERVO_MOVE_TIME, self.end_servo_pulse, args=(on_done, move))
+        timer.daemon = True
+        timer.start()
+        return move
+
+    def end_servo_pulse(self, on_done: Callable[[], None] = None, move: 'Future' = None) -> None:
+        """
+        Stops the PWM signal at the end of a servo move and notifies whoever is waiting for it.
+        """
         GPIO.output(self.SERVO_PIN, GPIO.LOW)
         self.pwm.ChangeDutyCycle(0)
+        if on_done is not None:
+            on_done()
+        if move is not None:
+            with self.servo_lock:
+                self.servo_move = None
+                queued, target, self.next_move = self.next_move, self.next_target, None
+            move.set_result(None)
+            if queued is not None:
+                follow = self.move_blinds(target)
+                if follow is None:
+                    queued.set_result(None)
+                else:
+                    follow.add_done_callback(lambda _: queued.set_result(None))
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+
+class LightingStateMachine:
+    """
+    Occupancy-aware control of the light of an office, driven by the timestamps of its control cycles.
+    States: OFF, ON, and HOLD, where the office looks vacant but the light stays on for a grace period,
+    since the infrared sensor misses people who barely move. Besides, the light never switches again
+    before a minimum dwell time in its current state has elapsed.
+    """
+    OFF = "OFF"
+    ON = "ON"
+    HOLD = "HOLD"
+
+    def __init__(self, vacancy_timeout: timedelta = timedelta(minutes=10), min_on: timedelta = timedelta(minutes=5),
+                 min_off: timedelta = timedelta(minutes=1)):
+        """
+        Constructor
+        :param vacancy_timeout: how long the office must look vacant before the light is turned off.
+        :param min_on: minimum time the light stays on once turned on.
+        :param min_off: minimum time the light stays off once turned off.
+        """
+        self.vacancy_timeout = vacancy_timeout
+        self.min_on = min_on
+        self.min_off = min_off
+        self.state = self.OFF
+        self.vacant_since = None
+        self.last_switch = None
+
+    def dwelt(self, now: datetime, dwell: timedelta) -> bool:
+        """
+        :return: True if the light has been in its current state for at least the given time.
+        """
+        return self.last_switch is None or now - self.last_switch >= dwell
+
+    def switch(self, now: datetime, state: str) -> None:
+        self.state = state
+        self.last_switch = now
+
+    def decide(self, now: datetime, occupied: bool, light_target: bool, light_on: bool) -> bool:
+        """
+        Runs the transitions of the current state:
+        OFF -> ON (or HOLD if vacant) when the light level rule wants the light and min_off has elapsed;
+        ON -> HOLD when the office looks vacant; ON -> OFF when the rule does not want the light and min_on has elapsed;
+        HOLD -> ON when someone is detected; HOLD -> OFF once vacant for vacancy_timeout, if min_on has elapsed.
+        :param now: the time of the control cycle.
+        :param occupied: True if the infrared sensor detects someone.
+        :param light_target: the state of the light wanted by the light level rule.
+        :param light_on: the current state of the light; if it was switched by someone else, the state follows it.
+        :return: the new state of the light.
+        """
+        if occupied:
+            self.vacant_since = None
+        elif self.vacant_since is None:
+            self.vacant_since = now
+        if self.last_switch is not None and now < self.last_switch:
+            self.last_switch = None  # the clock went backwards: the dwell times restart
+        if light_on != (self.state != self.OFF):
+            self.state = self.ON if light_on else self.OFF
+
+        if self.state == self.OFF:
+            if light_target and self.dwelt(now, self.min_off):
+                self.switch(now, self.ON if occupied else self.HOLD)
+        elif occupied:
+            self.state = self.ON
+            if not light_target and self.dwelt(now, self.min_on):
+                self.switch(now, self.OFF)
+        else:
+            self.state = self.HOLD
+            if now - self.vacant_since >= self.vacancy_timeout and not light_target and self.dwelt(now, self.min_on):
+                self.switch(now, self.OFF)
+        return self.state != self.OFF
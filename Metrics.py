@@ -0,0 +1,234 @@
+"""
+Instrumentation of IntelligentOffice and mock.GPIO, exported in the Prometheus text format.
+
+Nothing is measured until instrumentation is attached: OfficeInstrumentation wraps the methods of one
+office and instrument_gpio() wraps the GPIO functions, so offices without it pay no overhead.
+"""
+import bisect
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Tuple
+
+import mock.GPIO as GPIO
+
+DEFAULT_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0)
+
+
+def format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join('{}="{}"'.format(name, value) for name, value in labels) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self.values = {}  # labels -> value
+        self.lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        return self.values.get(tuple(sorted(labels.items())), 0)
+
+    def render(self) -> list:
+        lines = ["# HELP {} {}".format(self.name, self.help_text), "# TYPE {} counter".format(self.name)]
+        for key, value in sorted(self.values.items()):
+            lines.append("{}{} {}".format(self.name, format_labels(key), value))
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self.values = {}  # labels -> [bucket counts..., sum, count]
+        self.lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            data = self.values.get(key)
+            if data is None:
+                data = self.values[key] = [0] * (len(self.buckets) + 2)
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                data[index] += 1
+            data[-2] += value
+            data[-1] += 1
+
+    def count(self, **labels) -> int:
+        data = self.values.get(tuple(sorted(labels.items())))
+        return 0 if data is None else data[-1]
+
+    def render(self) -> list:
+        lines = ["# HELP {} {}".format(self.name, self.help_text), "# TYPE {} histogram".format(self.name)]
+        for key, data in sorted(self.values.items()):
+            cumulative = 0
+            for bound, bucket in zip(self.buckets, data):
+                cumulative += bucket
+                lines.append("{}_bucket{} {}".format(self.name, format_labels(key + (("le", repr(bound)),)),
+                                                     cumulative))
+            lines.append("{}_bucket{} {}".format(self.name, format_labels(key + (("le", "+Inf"),)), data[-1]))
+            lines.append("{}_sum{} {}".format(self.name, format_labels(key), data[-2]))
+            lines.append("{}_count{} {}".format(self.name, format_labels(key), data[-1]))
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.method_duration = Histogram("office_method_duration_seconds",
+                                         "Duration of the IntelligentOffice methods.")
+        self.gpio_operations = Counter("gpio_operations_total", "GPIO reads and writes, by operation.")
+        self.transitions = Counter("office_actuator_transitions_total", "Switches of the office actuators.")
+        self.on_time = Counter("office_actuator_on_seconds_total", "Time spent on by the office actuators.")
+        self.metrics = [self.method_duration, self.gpio_operations, self.transitions, self.on_time]
+
+    def render(self) -> str:
+        """
+        :return: every metric in the Prometheus text exposition format.
+        """
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> None:
+        """
+        Writes the metrics to a file (e.g., for the node exporter textfile collector), atomically.
+        """
+        temporary = path + ".tmp"
+        with open(temporary, "w") as file:
+            file.write(self.render())
+        os.replace(temporary, path)
+
+    def serve(self, port: int = 9100, address: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Serves the metrics at /metrics from a background thread.
+        :return: the server; call shutdown() on it to stop serving.
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((address, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+class OfficeInstrumentation:
+    """
+    Measures the methods of one office and tracks the transitions and on time of its actuators.
+    """
+    METHODS = ("tick", "check_occupancy", "manage_light_level", "apply_light_level", "monitor_air_quality",
+               "apply_air_quality", "manage_blinds_based_on_time")
+    ACTUATORS = ("light_on", "fan_switch_on", "blinds_open")
+
+    def __init__(self, office, registry: MetricsRegistry, name: str = "office",
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Constructor
+        :param office: the IntelligentOffice to instrument.
+        :param registry: where the measures are stored.
+        :param name: value of the office label of the measures.
+        :param clock: monotonic clock (in seconds) used for the on time of the actuators.
+        """
+        self.office = office
+        self.registry = registry
+        self.name = name
+        self.clock = clock
+        self.state = {}
+        self.since = None
+
+    def attach(self) -> "OfficeInstrumentation":
+        self.state = {actuator: getattr(self.office, actuator) for actuator in self.ACTUATORS}
+        self.since = self.clock()
+        for method in self.METHODS:
+            setattr(self.office, method, self.wrap(method, getattr(self.office, method)))
+        return self
+
+    def detach(self) -> None:
+        for method in self.METHODS:
+            self.office.__dict__.pop(method, None)
+
+    def wrap(self, method: str, function: Callable) -> Callable:
+        histogram = self.registry.method_duration
+        office = self.name
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start, office=office, method=method)
+                self.observe_actuators()
+
+        return timed
+
+    def observe_actuators(self) -> None:
+        now = self.clock()
+        elapsed = now - self.since
+        self.since = now
+        for actuator, previous in self.state.items():
+            if previous:
+                self.registry.on_time.inc(elapsed, office=self.name, actuator=actuator)
+            current = getattr(self.office, actuator)
+            if current != previous:
+                self.state[actuator] = current
+                self.registry.transitions.inc(office=self.name, actuator=actuator)
+
+
+GPIO_FUNCTIONS = {"input": "read", "input_many": "read", "output": "write", "output_many": "write"}
+original_gpio_functions = {}
+
+
+def instrument_gpio(registry: MetricsRegistry) -> None:
+    """
+    Counts the GPIO reads and writes (one per channel) into the registry, until uninstrument_gpio() is called.
+    """
+    uninstrument_gpio()
+    counter = registry.gpio_operations
+    for name, operation in GPIO_FUNCTIONS.items():
+        function = getattr(GPIO, name)
+        original_gpio_functions[name] = function
+        setattr(GPIO, name, count_calls(function, counter, name, operation))
+
+
+def count_calls(function: Callable, counter: Counter, name: str, operation: str) -> Callable:
+    bulk = name.endswith("_many")
+
+    def counted(channel, *args):
+        if bulk:
+            counter.inc(len(channel), operation=operation)
+        elif not isinstance(channel, (list, tuple)):
+            # output() on a list of channels is counted by the output_many() call it makes
+            counter.inc(1, operation=operation)
+        return function(channel, *args)
+
+    return counted
+
+
+def uninstrument_gpio() -> None:
+    for name, function in original_gpio_functions.items():
+        setattr(GPIO, name, function)
+    original_gpio_functions.clear()
@@ -0,0 +1,189 @@
+import heapq
+import random
+from datetime import datetime, timedelta
+from typing import Iterable, Tuple
+
+import mock.GPIO as GPIO
+from mock.Clock import VirtualClock
+from mock.RTC import RTC
+from IntelligentOffice import IntelligentOffice
+
+# Actuators whose switches and on time are reported, by IntelligentOffice state attribute
+ACTUATORS = ("light_on", "fan_switch_on", "blinds_open")
+
+
+class RoomAir:
+    """
+    Closed-loop CO2 model of an office: occupants emit CO2, which leaks out slowly and is removed
+    much faster while the fan runs, both in proportion to the excess over the outdoor level.
+    """
+
+    def __init__(self, co2: float = 450, outdoor: float = 400, emission: float = 5.0, leak: float = 0.005,
+                 ventilation: float = 0.04):
+        """
+        Constructor
+        :param co2: initial CO2 level (PPM).
+        :param outdoor: outdoor CO2 level (PPM).
+        :param emission: CO2 added per minute (PPM) while the office is occupied.
+        :param leak: fraction of the excess CO2 removed per minute with the fan off.
+        :param ventilation: fraction of the excess CO2 removed per minute by the fan.
+        """
+        self.co2 = co2
+        self.outdoor = outdoor
+        self.emission = emission
+        self.leak = leak
+        self.ventilation = ventilation
+
+    def step(self, minutes: float, occupied: bool, fan_switch_on: bool) -> int:
+        """
+        Advances the model.
+        :return: the CO2 level (PPM) read by the sensor at the end of the step.
+        """
+        removal = self.leak + (self.ventilation if fan_switch_on else 0)
+        self.co2 += minutes * ((self.emission if occupied else 0) - removal * (self.co2 - self.outdoor))
+        return round(self.co2)
+
+
+class SimulationSummary:
+    """
+    Outcome of a simulation: number of switches and total on time (in seconds) of every actuator,
+    plus the light and fan writes requested by the office and the ones actually issued to the GPIO.
+    When the CO2 comes from a RoomAir model, the peak CO2 level is reported as well.
+    """
+
+    def __init__(self):
+        self.ticks = 0
+        self.sensor_events = 0
+        self.switches = {actuator: 0 for actuator in ACTUATORS}
+        self.on_time = {actuator: 0.0 for actuator in ACTUATORS}
+        self.writes_requested = 0
+        self.writes_issued = 0
+        self.peak_co2 = 0
+
+    def __eq__(self, other):
+        return isinstance(other, SimulationSummary) and vars(self) == vars(other)
+
+    def __repr__(self):
+        return "SimulationSummary(ticks={}, sensor_events={}, switches={}, on_time={}, writes_requested={}, " \
+               "writes_issued={}, peak_co2={})".format(self.ticks, self.sensor_events, self.switches, self.on_time,
+                                                       self.writes_requested, self.writes_issued, self.peak_co2)
+
+
+class OfficeSimulator:
+    """
+    Deterministic discrete-event simulation of an IntelligentOffice.
+    Sensor readings come from a trace of timestamped events and the office runs its control cycle
+    at a fixed period; the RTC and the servo run on a VirtualClock, so a week is simulated in well under
+    a second. The office must use blocking servo moves (the default), which advance the virtual clock.
+    """
+    # Event kinds, in the order in which simultaneous events are processed
+    SENSOR = 0
+    TICK = 1
+
+    def __init__(self, start: datetime, office: IntelligentOffice = None, tick_period: timedelta = timedelta(minutes=1),
+                 air: RoomAir = None):
+        """
+        Constructor
+        :param start: simulated date and time at which the simulation starts.
+        :param office: the simulated office; a new one is created if missing.
+        :param tick_period: simulated time between two control cycles of the office.
+        :param air: optional CO2 model that drives the CO2 sensor before every tick, from the occupancy
+        of the trace and the state of the fan (CO2 readings of the trace should then be left out).
+        """
+        self.clock = VirtualClock(start)
+        self.office = office if office is not None else IntelligentOffice()
+        self.tick_period = tick_period
+        self.air = air
+        self.events = []
+        self.sequence = 0  # keeps simultaneous events in insertion order
+        # Carried over from one run() to the next, so that a simulation can be resumed
+        self.push(start, self.TICK)
+        self.occupied = False
+        self.last_tick = start
+        self.summarized_until = start  # end of the period covered by the summary of the previous run
+
+    def push(self, moment: datetime, kind: int, payload=None) -> None:
+        heapq.heappush(self.events, (moment, kind, self.sequence, payload))
+        self.sequence += 1
+
+    def load_trace(self, trace: Iterable[Tuple[datetime, str, int]]) -> None:
+        """
+        Schedules sensor readings.
+        :param trace: (moment, pin name, value) tuples, e.g. (datetime(2026, 10, 12, 9, 0), "INFRARED_PIN", 0).
+        """
+        for moment, pin_name, value in trace:
+            self.push(moment, self.SENSOR, (getattr(self.office, pin_name), value))
+
+    def run(self, until: datetime) -> SimulationSummary:
+        """
+        Runs the simulation up to the given moment; a later call resumes it from there.
+        Sensor events scheduled at the same moment as a tick are applied before it.
+        :return: the summary of the actuators' activity during this run.
+        """
+        summary = SimulationSummary()
+        actuators = self.office.actuators
+        requested, issued = actuators.writes_requested, actuators.writes_issued
+        previous_clock = RTC.clock
+        RTC.set_clock(self.clock)
+        try:
+            last = self.summarized_until
+            state = {actuator: getattr(self.office, actuator) for actuator in ACTUATORS}
+            while self.events and self.events[0][0] < until:
+                moment, kind, _, payload = heapq.heappop(self.events)
+                self.clock.advance_to(moment)
+                if kind == self.SENSOR:
+                    GPIO.set_input(*payload)
+                    if payload[0] == self.office.INFRARED_PIN:
+                        self.occupied = payload[1] == 0
+                    summary.sensor_events += 1
+                    continue
+                if self.air is not None:
+                    minutes = (moment - self.last_tick).total_seconds() / 60
+                    co2 = self.air.step(minutes, self.occupied, self.office.fan_switch_on)
+                    GPIO.set_input(self.office.CO2_PIN, co2)
+                    summary.peak_co2 = max(summary.peak_co2, co2)
+                self.office.tick()
+                summary.ticks += 1
+                now = self.clock.now()
+                for actuator in ACTUATORS:
+                    if state[actuator]:
+                        summary.on_time[actuator] += (now - last).total_seconds()
+                    if getattr(self.office, actuator) != state[actuator]:
+                        state[actuator] = not state[actuator]
+                        summary.switches[actuator] += 1
+                last = self.last_tick = now
+                self.push(moment + self.tick_period, self.TICK)
+            for actuator in ACTUATORS:
+                if state[actuator]:
+                    summary.on_time[actuator] += (max(until, last) - last).total_seconds()
+            self.summarized_until = max(until, last)
+            summary.writes_requested = actuators.writes_requested - requested
+            summary.writes_issued = actuators.writes_issued - issued
+        finally:
+            RTC.set_clock(previous_clock)
+        return summary
+
+
+def synthetic_trace(start: datetime, days: int = 7, seed: int = 0) -> list:
+    """
+    Generates a reproducible trace of occupancy, light level and CO2 readings, one every 5 minutes:
+    on working days the worker is in from about 9:00 to 18:00 with a lunch break, the daylight follows
+    the hour of the day and the CO2 builds up while the office is occupied.
+    :return: (moment, pin name, value) tuples sorted by moment.
+    """
+    rnd = random.Random(seed)
+    step = timedelta(minutes=5)
+    trace = []
+    co2 = 450
+    moment = start
+    while moment < start + timedelta(days=days):
+        hour = moment.hour + moment.minute / 60
+        working = moment.weekday() < 5 and (9 <= hour < 12.5 or 13.5 <= hour < 18)
+        occupied = working and rnd.random() < 0.9
+        daylight = max(0, 700 - abs(hour - 13) * 120)
+        co2 = max(400, co2 + (rnd.randint(15, 35) if occupied else -rnd.randint(10, 30)))
+        trace.append((moment, "INFRARED_PIN", 0 if occupied else 1))
+        trace.append((moment, "PHOTO_PIN", int(daylight + rnd.randint(-30, 30))))
+        trace.append((moment, "CO2_PIN", co2))
+        moment += step
+    return trace
@@ -0,0 +1,214 @@
+import os
+import threading
+from datetime import date, time
+from typing import Callable
+
+from BlindsSchedule import BlindsSchedule
+from IntelligentOfficeError import IntelligentOfficeError
+from mock.RTC import RTC
+
+# The rules hard-coded in IntelligentOffice, as a declarative config
+DEFAULT_RULES = {
+    "light": {"lux_min": 500, "lux_max": 550},
+    "air_quality": {"co2_on": 800, "co2_off": 500},
+    "blinds": {"open": "08:00", "close": "20:00", "days": ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY"],
+               "holidays": []},
+}
+
+
+class RuleSet:
+    """
+    Rules compiled from a config: closures for the light and air quality rules and a lookup table
+    (a BlindsSchedule) for the blinds.
+    """
+
+    def __init__(self, light: Callable[[bool, int, bool], bool], air_quality: Callable[[int, bool], bool],
+                 blinds: BlindsSchedule, config: dict):
+        self.light = light
+        self.air_quality = air_quality
+        self.blinds = blinds
+        self.config = config
+        # The levels (PPM) at which the fan is turned on and below which it is turned off
+        self.co2_thresholds = (config["air_quality"]["co2_on"], config["air_quality"]["co2_off"])
+
+
+def compile_light_rule(lux_min: int, lux_max: int) -> Callable[[bool, int, bool], bool]:
+    def light(occupied: bool, light_level: int, light_on: bool) -> bool:
+        if not occupied:
+            return False
+        if light_level < lux_min:
+            return True
+        if light_level > lux_max:
+            return False
+        return light_on
+    return light
+
+
+def compile_air_quality_rule(co2_on: int, co2_off: int) -> Callable[[int, bool], bool]:
+    def air_quality(co2_level: int, fan_switch_on: bool) -> bool:
+        if co2_level >= co2_on:
+            return True
+        if co2_level < co2_off:
+            return False
+        return fan_switch_on
+    return air_quality
+
+
+def parse_time(text: str) -> time:
+    if not isinstance(text, str):
+        raise IntelligentOfficeError("Invalid time: {!r}".format(text))
+    try:
+        hour, minute = text.split(":")
+        return time(int(hour), int(minute))
+    except ValueError:
+        raise IntelligentOfficeError("Invalid time: {}".format(text))
+
+
+def check_number(section: str, key: str, value) -> None:
+    # bool is an int, but a switch is never a threshold
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise IntelligentOfficeError("{}.{} must be a number, not {!r}".format(section, key, value))
+
+
+def check_strings(section: str, key: str, value) -> None:
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise IntelligentOfficeError("{}.{} must be a list of strings, not {!r}".format(section, key, value))
+
+
+def merge_section(config: dict, section: str) -> dict:
+    """
+    :return: the rules of a section of the config over the default ones, after checking their names.
+    """
+    rules = config.get(section, {})
+    if not isinstance(rules, dict):
+        raise IntelligentOfficeError("Rule section {} must be a mapping, not {!r}".format(section, rules))
+    unknown = set(rules) - set(DEFAULT_RULES[section])
+    if unknown:
+        raise IntelligentOfficeError("Unknown {} rules: {}".format(section, ", ".join(sorted(map(str, unknown)))))
+    return dict(DEFAULT_RULES[section], **rules)
+
+
+def compile_rules(config: dict) -> RuleSet:
+    """
+    Validates a rules config and compiles it; sections missing from the config take the default rules.
+    Any invalid config raises IntelligentOfficeError.
+    """
+    if not isinstance(config, dict):
+        raise IntelligentOfficeError("Invalid rules config: {!r}".format(config))
+    unknown = set(config) - set(DEFAULT_RULES)
+    if unknown:
+        raise IntelligentOfficeError("Unknown rule sections: {}".format(", ".join(sorted(map(str, unknown)))))
+    merged = {section: merge_section(config, section) for section in DEFAULT_RULES}
+
+    light = merged["light"]
+    for key in ("lux_min", "lux_max"):
+        check_number("light", key, light[key])
+    if light["lux_min"] > light["lux_max"]:
+        raise IntelligentOfficeError("lux_min must not be greater than lux_max")
+    air_quality = merged["air_quality"]
+    for key in ("co2_on", "co2_off"):
+        check_number("air_quality", key, air_quality[key])
+    if air_quality["co2_off"] > air_quality["co2_on"]:
+        raise IntelligentOfficeError("co2_off must not be greater than co2_on")
+    blinds = merged["blinds"]
+    for key in ("days", "holidays"):
+        check_strings("blinds", key, blinds[key])
+    try:
+        days = [RTC.DAYS.index(day) for day in blinds["days"]]
+        holidays = [date.fromisoformat(day) for day in blinds["holidays"]]
+    except ValueError as error:
+        raise IntelligentOfficeError("Invalid blinds rules: {}".format(error))
+    open_time, close_time = parse_time(blinds["open"]), parse_time(blinds["close"])
+    if open_time >= close_time:
+        raise IntelligentOfficeError("blinds.open must be earlier than blinds.close")
+
+    return RuleSet(compile_light_rule(light["lux_min"], light["lux_max"]),
+                   compile_air_quality_rule(air_quality["co2_on"], air_quality["co2_off"]),
+                   BlindsSchedule(open_time, close_time, days, holidays),
+                   merged)
+
+
+def load_config(path: str) -> dict:
+    """
+    Reads a rules config from a JSON file or, if PyYAML is installed, from a YAML file.
+    """
+    with open(path) as file:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise IntelligentOfficeError("PyYAML is needed to load {}".format(path))
+            try:
+                config = yaml.safe_load(file)
+            except yaml.YAMLError as error:
+                raise IntelligentOfficeError("Invalid rules config {}: {}".format(path, error))
+        else:
+            import json
+            try:
+                config = json.load(file)
+            except ValueError as error:
+                raise IntelligentOfficeError("Invalid rules config {}: {}".format(path, error))
+    if not isinstance(config, dict):
+        raise IntelligentOfficeError("Invalid rules config: {}".format(path))
+    return config
+
+
+class RuleEngine:
+    """
+    Holds the current RuleSet shared by many offices. Reloading compiles the new rules first and then
+    swaps a single reference, so offices always see either the old or the new rules and never wait.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Constructor
+        :param path: optional rules config file; the default rules are used if missing.
+        """
+        self.path = path
+        self.mtime = None
+        self.current = compile_rules({})
+        self.watcher = None
+        self.stopped = threading.Event()
+        if path is not None:
+            self.reload()
+
+    def reload(self) -> RuleSet:
+        """
+        Loads and compiles the rules config again; on errors, the current rules are kept and the error is raised.
+        """
+        mtime = os.stat(self.path).st_mtime_ns
+        rules = compile_rules(load_config(self.path))
+        self.current = rules
+        self.mtime = mtime
+        return rules
+
+    def reload_if_changed(self) -> bool:
+        """
+        :return: True if the config file has changed since the last load and has been reloaded.
+        """
+        if os.stat(self.path).st_mtime_ns == self.mtime:
+            return False
+        self.reload()
+        return True
+
+    def watch(self, period: float = 1.0) -> None:
+        """
+        Starts a background thread that reloads the rules whenever the config file changes.
+        Invalid configs are ignored, and the current rules kept, until they are fixed.
+        """
+        def run():
+            while not self.stopped.wait(period):
+                try:
+                    self.reload_if_changed()
+                except (IntelligentOfficeError, OSError):
+                    pass
+
+        self.stopped.clear()
+        self.watcher = threading.Thread(target=run, daemon=True)
+        self.watcher.start()
+
+    def stop_watching(self) -> None:
+        self.stopped.set()
+        if self.watcher is not None:
+            self.watcher.join()
+            self.watcher = None
@@ -0,0 +1,124 @@
+"""
+Generator-based streaming pipeline between the sensors of an IntelligentOffice and its decision rules.
+
+A pipeline is a chain of generators, e.g.:
+
+    readings = sample(office.read_sensors, period=1)
+    readings = smooth_readings(readings, size=5)
+    drive(office, changes(readings))
+
+so the light and fan rules act on smoothed values instead of single noisy samples.
+"""
+from collections import deque
+from typing import Callable, Iterable, Iterator
+
+from mock.RTC import RTC
+
+
+class RingBuffer:
+    """
+    Fixed-size window over the last values of a stream, with O(1) mean.
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("The size of a ring buffer must be at least 1")
+        self.values = deque(maxlen=size)
+        self.total = 0
+
+    def append(self, value) -> None:
+        if len(self.values) == self.values.maxlen:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+
+    def mean(self) -> float:
+        return self.total / len(self.values)
+
+    def median(self):
+        ordered = sorted(self.values)
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            return ordered[middle]
+        return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def sample(read: Callable[[], object], period: float = 1.0, count: int = None,
+           sleep: Callable[[float], None] = RTC.sleep) -> Iterator:
+    """
+    Reads a sensor (or a group of sensors) at a fixed rate.
+    :param read: the function that takes a sample, e.g. IntelligentOffice.read_sensors.
+    :param period: seconds between two samples (the sampling rate is 1 / period).
+    :param count: number of samples to take; endless if missing.
+    :param sleep: the function used to wait between samples (the RTC clock by default).
+    """
+    taken = 0
+    while count is None or taken < count:
+        if taken:
+            sleep(period)
+        yield read()
+        taken += 1
+
+
+def rolling_mean(stream: Iterable, size: int) -> Iterator[float]:
+    """
+    Mean of the last size values of the stream.
+    """
+    window = RingBuffer(size)
+    for value in stream:
+        window.append(value)
+        yield window.mean()
+
+
+def rolling_median(stream: Iterable, size: int) -> Iterator:
+    """
+    Median of the last size values of the stream, less sensitive than the mean to single spikes.
+    """
+    window = RingBuffer(size)
+    for value in stream:
+        window.append(value)
+        yield window.median()
+
+
+def changes(stream: Iterable) -> Iterator:
+    """
+    Drops the values that are equal to the previous one.
+    """
+    previous = object()
+    for value in stream:
+        if value != previous:
+            previous = value
+            yield value
+
+
+def smooth_readings(readings: Iterable[tuple], size: int, statistic: str = "median") -> Iterator[tuple]:
+    """
+    Smooths the light level and the CO2 of (occupancy, light level, CO2) readings, as returned by
+    IntelligentOffice.read_sensors; the occupancy is passed through unchanged.
+    :param size: number of samples in the smoothing windows.
+    :param statistic: "median" or "mean".
+    """
+    if statistic not in ("median", "mean"):
+        raise ValueError("Unknown statistic: {}".format(statistic))
+    light_window = RingBuffer(size)
+    co2_window = RingBuffer(size)
+    for occupied, light_level, co2_level in readings:
+        light_window.append(light_level)
+        co2_window.append(co2_level)
+        if statistic == "median":
+            yield occupied, light_window.median(), co2_window.median()
+        else:
+            yield occupied, light_window.mean(), co2_window.mean()
+
+
+def drive(office, readings: Iterable[tuple]) -> int:
+    """
+    Feeds (occupancy, light level, CO2) readings to the light and air quality rules of the office.
+    :return: the number of readings consumed.
+    """
+    consumed = 0
+    for occupied, light_level, co2_level in readings:
+        office.apply_light_level(occupied, light_level)
+        office.apply_air_quality(co2_level, occupied)
+        consumed += 1
+    return consumed
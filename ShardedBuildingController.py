@@ -0,0 +1,181 @@
+import multiprocessing
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+
+import mock.GPIO as GPIO
+from mock.RTC import RTC
+from BuildingController import BuildingController
+from IntelligentOffice import IntelligentOffice
+from IntelligentOfficeError import IntelligentOfficeError
+from Lighting import LightingStateMachine
+from Ventilation import PredictiveVentilation
+
+# Layout of the row of an office in the shared state block: one int32 per field
+OCCUPANCY = 0  # infrared sensor reading (0 means occupied)
+LUX = 1
+CO2 = 2
+LIGHT_ON = 3
+FAN_ON = 4
+BLINDS_OPEN = 5
+FIELDS = 6
+
+# Collaborators that keep per-office state: they must be passed as factories, called once per office
+STATEFUL = (PredictiveVentilation, LightingStateMachine)
+
+
+def office_arguments(office_kwargs: dict) -> dict:
+    """
+    :return: the constructor arguments of one office: callable values are factories, called for every office.
+    """
+    return {key: value() if callable(value) else value for key, value in office_kwargs.items()}
+
+
+def run_shard(name: str, start: int, stop: int, clock, office_kwargs: dict, connection: Connection) -> None:
+    """
+    Worker process: owns the offices [start, stop) of the building. For each requested tick, the sensor
+    readings are taken from the shared state block and the actuator states are written back to it.
+    """
+    GPIO.set_timing(GPIO.TIMING_INSTANT)  # the board setup delay of every worker is not part of the simulation
+    if clock is not None:
+        RTC.set_clock(clock)
+    block = shared_memory.SharedMemory(name=name)
+    state = block.buf.cast("i")
+    try:
+        # Built once the block is mapped, so that a failing office still releases it
+        offices = [(index * FIELDS, IntelligentOffice(pins=BuildingController.pin_map(index),
+                                                      **office_arguments(office_kwargs)))
+                   for index in range(start, stop)]
+        connection.send(None)  # ready
+        while True:
+            ticks = connection.recv()
+            if ticks is None:
+                break
+            for _ in range(ticks):
+                with RTC.frozen():
+                    for row, office in offices:
+                        GPIO.set_input(office.INFRARED_PIN, state[row + OCCUPANCY])
+                        GPIO.set_input(office.PHOTO_PIN, state[row + LUX])
+                        GPIO.set_input(office.CO2_PIN, state[row + CO2])
+                        office.tick()
+                        state[row + LIGHT_ON] = office.light_on
+                        state[row + FAN_ON] = office.fan_switch_on
+                        state[row + BLINDS_OPEN] = office.blinds_open
+            connection.send(ticks)
+    finally:
+        state.release()
+        block.close()
+        connection.close()
+
+
+class ShardedBuildingController:
+    """
+    Runs the offices of a building on worker processes, each owning a contiguous slice of them, so that
+    the control cycles are not bound to a single interpreter. Sensor readings and actuator states of all
+    the offices live in one shared memory block that the supervisor reads and writes without copies.
+    """
+
+    def __init__(self, offices: int, workers: int = None, clock=None, **office_kwargs):
+        """
+        Constructor
+        :param offices: number of offices of the building.
+        :param workers: number of worker processes (the number of CPUs by default, at most one per office).
+        :param clock: optional clock installed in the RTC of every worker (it must be picklable).
+        :param office_kwargs: arguments of the IntelligentOffice constructor but pins, applied to every office. Callable
+        values are factories called once per office: stateful collaborators must be passed this way
+        (e.g. ventilation=PredictiveVentilation), so that offices never share their history.
+        """
+        if "pins" in office_kwargs:
+            raise IntelligentOfficeError("The pins of every office are given by BuildingController.pin_map")
+        for key, value in office_kwargs.items():
+            if isinstance(value, STATEFUL):
+                raise IntelligentOfficeError("{} keeps per-office state: pass a factory instead".format(key))
+        self.offices = offices
+        workers = min(workers or multiprocessing.cpu_count(), offices)
+        self.block = shared_memory.SharedMemory(create=True, size=max(offices, 1) * FIELDS * 4)
+        self.state = self.block.buf.cast("i")
+        self.closed = False
+        self.workers = []
+        try:
+            for index in range(offices):
+                self.state[index * FIELDS + OCCUPANCY] = GPIO.HIGH  # vacant until told otherwise
+            bounds = [offices * shard // workers for shard in range(workers + 1)]
+            for start, stop in zip(bounds, bounds[1:]):
+                connection, worker_connection = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=run_shard, daemon=True, args=(
+                    self.block.name, start, stop, clock, office_kwargs, worker_connection))
+                try:
+                    process.start()
+                finally:
+                    worker_connection.close()
+                self.workers.append((process, connection))
+            for _, connection in self.workers:
+                connection.recv()
+        except BaseException:
+            self.close()
+            raise
+
+    def set_readings(self, index: int, occupancy: int, lux: int, co2: int) -> None:
+        """
+        Sets the sensor readings of an office, used by its next tick.
+        :param occupancy: infrared sensor reading (GPIO.LOW if someone is in the office).
+        """
+        row = index * FIELDS
+        self.state[row + OCCUPANCY] = occupancy
+        self.state[row + LUX] = lux
+        self.state[row + CO2] = co2
+
+    def office_state(self, index: int) -> tuple:
+        """
+        :return: a copy of the row of an office in the shared state block; see FIELDS.
+        A view would keep the block from being closed.
+        """
+        return tuple(self.state[index * FIELDS:(index + 1) * FIELDS])
+
+    def status(self) -> dict:
+        """
+        :return: the number of offices with the light on, the fan on and the blinds open.
+        """
+        return {"light_on": sum(self.state[LIGHT_ON::FIELDS]), "fan_on": sum(self.state[FAN_ON::FIELDS]),
+                "blinds_open": sum(self.state[BLINDS_OPEN::FIELDS])}
+
+    def tick(self, ticks: int = 1) -> None:
+        """
+        Runs control cycles on every office of the building and waits for all the workers to finish.
+        :param ticks: number of cycles run by each worker before reporting back.
+        """
+        for _, connection in self.workers:
+            connection.send(ticks)
+        for _, connection in self.workers:
+            connection.recv()
+
+    def close(self) -> None:
+        """
+        Stops the workers and frees the shared state block, even if some workers have died.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            for process, connection in self.workers:
+                try:
+                    connection.send(None)
+                except OSError:
+                    pass  # the worker is already gone
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+                connection.close()
+            self.workers = []
+        finally:
+            try:
+                self.state.release()
+                self.block.close()
+            finally:
+                self.block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,104 @@
+import mmap
+import os
+import struct
+from datetime import timedelta
+
+from IntelligentOfficeError import IntelligentOfficeError
+from mock.RTC import RTC
+
+# File layout: a header, then one fixed-size record per office, at the position of the office in the building
+HEADER = struct.Struct('<4sHHI')  # magic, version, record size, number of offices
+RECORD = struct.Struct('<B3xI')   # flags, time of the save (seconds since the epoch)
+MAGIC = b'IOSS'
+VERSION = 1
+
+# Flags of a record
+SAVED = 0x01
+BLINDS_OPEN = 0x02
+LIGHT_ON = 0x04
+FAN_ON = 0x08
+
+
+def pack_flags(office) -> int:
+    return SAVED | (BLINDS_OPEN if office.blinds_open else 0) | (LIGHT_ON if office.light_on else 0) | \
+        (FAN_ON if office.fan_switch_on else 0)
+
+
+class StateSnapshot:
+    """
+    Checkpoints of the state of every office of a building in a memory-mapped file with a fixed layout,
+    so that the state of one office is saved in place and the whole building is restored in one pass.
+    """
+
+    def __init__(self, path: str, offices: int):
+        """
+        Opens the snapshot file, creating it if missing.
+        :param path: the snapshot file.
+        :param offices: number of offices of the building; it must match the one of an existing file.
+        """
+        size = HEADER.size + offices * RECORD.size
+        if not os.path.exists(path):
+            with open(path, 'wb') as file:
+                file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, offices))
+                file.truncate(size)
+        self.file = open(path, 'r+b')
+        if os.fstat(self.file.fileno()).st_size != size:
+            self.file.close()
+            raise IntelligentOfficeError("Snapshot {} does not hold {} offices".format(path, offices))
+        self.map = mmap.mmap(self.file.fileno(), size)
+        if HEADER.unpack_from(self.map) != (MAGIC, VERSION, RECORD.size, offices):
+            self.close()
+            raise IntelligentOfficeError("Invalid snapshot: {}".format(path))
+        self.offices = offices
+
+    def offset(self, index: int) -> int:
+        if not 0 <= index < self.offices:
+            raise IntelligentOfficeError("No office {} in a snapshot of {} offices".format(index, self.offices))
+        return HEADER.size + index * RECORD.size
+
+    def save(self, index: int, office) -> None:
+        """
+        Records the state of the index-th office of the building.
+        """
+        RECORD.pack_into(self.map, self.offset(index), pack_flags(office),
+                         int(RTC.get_current_datetime().timestamp()))
+
+    def save_all(self, offices: list) -> None:
+        if len(offices) > self.offices:
+            raise IntelligentOfficeError("{} offices in a snapshot of {}".format(len(offices), self.offices))
+        saved_at = int(RTC.get_current_datetime().timestamp())
+        for index, office in enumerate(offices):
+            RECORD.pack_into(self.map, HEADER.size + index * RECORD.size, pack_flags(office), saved_at)
+
+    def restore_all(self, offices: list, max_age: timedelta = None) -> int:
+        """
+        Hands the saved state to the offices (see IntelligentOffice.restore_state); offices never saved are left alone.
+        :param max_age: optional age beyond which a saved state is stale and is not restored either.
+        :return: the number of offices restored.
+        """
+        if len(offices) > self.offices:
+            raise IntelligentOfficeError("{} offices in a snapshot of {}".format(len(offices), self.offices))
+        oldest = 0 if max_age is None else (RTC.get_current_datetime() - max_age).timestamp()
+        restored = 0
+        # The view is released even if an office fails to restore, so that the map can still be closed
+        with memoryview(self.map) as view:
+            for office, (flags, saved_at) in zip(offices, RECORD.iter_unpack(
+                    view[HEADER.size:HEADER.size + len(offices) * RECORD.size])):
+                if flags & SAVED and saved_at >= oldest:
+                    office.restore_state(bool(flags & BLINDS_OPEN), bool(flags & LIGHT_ON), bool(flags & FAN_ON))
+                    restored += 1
+        return restored
+
+    def flush(self) -> None:
+        self.map.flush()
+
+    def close(self) -> None:
+        if not self.map.closed:
+            self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,159 @@
+import math
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Iterable
+
+import mock.GPIO as GPIO
+from mock.Clock import VirtualClock
+from mock.RTC import RTC
+from IntelligentOffice import IntelligentOffice
+
+
+class ReplayStats:
+    def __init__(self, events: int, ticks: int, seconds: float):
+        self.events = events
+        self.ticks = ticks
+        self.seconds = seconds
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.seconds if self.seconds else math.inf
+
+    def __repr__(self):
+        return "ReplayStats(events={}, ticks={}, seconds={:.3f}, events_per_second={:.0f})".format(
+            self.events, self.ticks, self.seconds, self.events_per_second)
+
+
+class ActionRecorder:
+    """
+    Marks in the GPIO traffic log (see mock.GPIO.start_recording) the end of every control action run by
+    some offices, with the time of the RTC when it started, so that TrafficReplayer can run the same actions
+    at the same time. It wraps the methods of the offices, whatever runs them: tick loops, BuildingController
+    or AsyncRuntime. Actions run by other recorded actions (e.g. the blinds by tick) are not marked.
+    """
+    ACTIONS = {"tick": GPIO.TRACE_MARK, "manage_light_level": GPIO.TRACE_MARK_LIGHT,
+               "monitor_air_quality": GPIO.TRACE_MARK_AIR, "manage_blinds_based_on_time": GPIO.TRACE_MARK_BLINDS}
+
+    def __init__(self, offices: Iterable[IntelligentOffice]):
+        self.offices = list(offices)
+        self.running = threading.local()  # whether the current thread is inside a recorded action
+
+    def attach(self) -> "ActionRecorder":
+        for office in self.offices:
+            for method, operation in self.ACTIONS.items():
+                setattr(office, method, self.wrap(office, operation, getattr(office, method)))
+            office.manage_blinds_async = self.wrap_async(office, office.manage_blinds_async)
+        return self
+
+    def detach(self) -> None:
+        for office in self.offices:
+            for method in list(self.ACTIONS) + ["manage_blinds_async"]:
+                office.__dict__.pop(method, None)
+
+    def wrap(self, office: IntelligentOffice, operation: int, function: Callable) -> Callable:
+        running = self.running
+
+        def recorded(*args, **kwargs):
+            if getattr(running, "action", False):
+                return function(*args, **kwargs)
+            moment = RTC.get_current_datetime().timestamp()
+            running.action = True
+            try:
+                return function(*args, **kwargs)
+            finally:
+                running.action = False
+                GPIO.mark(office.INFRARED_PIN, moment, operation)
+        return recorded
+
+    @staticmethod
+    def wrap_async(office: IntelligentOffice, function: Callable) -> Callable:
+        async def recorded(*args, **kwargs):
+            moment = RTC.get_current_datetime().timestamp()
+            try:
+                return await function(*args, **kwargs)
+            finally:
+                GPIO.mark(office.INFRARED_PIN, moment, GPIO.TRACE_MARK_BLINDS)
+        return recorded
+
+
+class TrafficReplayer:
+    """
+    Feeds a GPIO traffic log (see mock.GPIO.start_recording and ActionRecorder) back into offices:
+    the recorded sensor values are applied to the input pins and each office runs the control actions
+    marked in the log, with the RTC on a VirtualClock set to the recorded time of each action.
+    The log is streamed, so its size is not limited by the available memory. The offices should use
+    blocking servo moves (the default), which advance the virtual clock instead of waiting.
+    """
+    MARKS = (GPIO.TRACE_MARK, GPIO.TRACE_MARK_LIGHT, GPIO.TRACE_MARK_AIR, GPIO.TRACE_MARK_BLINDS)
+
+    def __init__(self, offices: Iterable[IntelligentOffice], realtime: bool = False,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Constructor
+        :param offices: the offices to drive; they must use the pin maps of the recorded ones.
+        :param realtime: if True, the original timing of the log is reproduced, otherwise it is replayed at max speed.
+        :param sleep: the function used to wait in realtime mode.
+        """
+        self.offices = {office.INFRARED_PIN: office for office in offices}
+        self.realtime = realtime
+        self.sleep = sleep
+        self.clock = None
+
+    @staticmethod
+    def value(value: float):
+        """
+        :return: a recorded value as it was given (the log stores all of them as floats).
+        """
+        if math.isnan(value):
+            return None
+        return int(value) if value.is_integer() else value
+
+    def run_action(self, office: IntelligentOffice, operation: int, moment: float) -> None:
+        """
+        Runs a marked action of an office, once the RTC has reached the time at which it was recorded.
+        """
+        if not math.isnan(moment):
+            moment = datetime.fromtimestamp(moment)
+            if self.clock is None:
+                self.clock = VirtualClock(moment)
+                RTC.set_clock(self.clock)
+            self.clock.advance_to(moment)
+        if operation == GPIO.TRACE_MARK:
+            office.tick()
+        elif operation == GPIO.TRACE_MARK_LIGHT:
+            office.manage_light_level()
+        elif operation == GPIO.TRACE_MARK_AIR:
+            office.monitor_air_quality()
+        else:
+            office.manage_blinds_based_on_time()
+
+    def replay(self, path: str) -> ReplayStats:
+        """
+        Replays a log; the clock of the RTC is restored afterwards.
+        :return: the number of events read and of actions run, and the time taken.
+        """
+        events = ticks = 0
+        first = None
+        start = time.perf_counter()
+        previous_clock = RTC.clock
+        self.clock = None
+        try:
+            for timestamp, channel, operation, value in GPIO.read_log(path):
+                events += 1
+                if self.realtime:
+                    if first is None:
+                        first = timestamp
+                    delay = (timestamp - first) - (time.perf_counter() - start)
+                    if delay > 0:
+                        self.sleep(delay)
+                if operation == GPIO.TRACE_INPUT or operation == GPIO.TRACE_SET_INPUT:
+                    GPIO.set_input(channel, self.value(value))
+                elif operation in self.MARKS:
+                    office = self.offices.get(channel)
+                    if office is not None:
+                        self.run_action(office, operation, value)
+                        ticks += 1
+        finally:
+            RTC.set_clock(previous_clock)
+        return ReplayStats(events, ticks, time.perf_counter() - start)
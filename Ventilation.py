@@ -0,0 +1,109 @@
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+
+class PredictiveVentilation:
+    """
+    Predictive CO2 controller of the fan of an office. It keeps the recent CO2 readings of the office,
+    estimates how fast the CO2 builds up (at least occupied_rise while the office is occupied) and starts
+    ventilating as soon as the CO2 threshold of the office would be reached within the horizon, then stops
+    at a target between its two thresholds: the fan runs in short, early bursts instead of long, late ones.
+    Once switched, the fan is kept on for min_on and off for min_off (unless the threshold is reached),
+    so the bursts cannot get shorter than that.
+    The hysteresis of IntelligentOffice stays the fallback: decide() returns None when no prediction is possible.
+    """
+
+    def __init__(self, co2_max: int = None, co2_target: int = None, horizon: timedelta = timedelta(minutes=10),
+                 history: int = 6, occupied_rise: float = 5.0, min_on: timedelta = timedelta(minutes=15),
+                 min_off: timedelta = timedelta(minutes=15)):
+        """
+        Constructor
+        :param co2_max: CO2 level (PPM) that must not be reached; the fan is always on above it.
+        By default, the threshold at which the office turns its fan on (see IntelligentOffice.effective_co2_thresholds).
+        :param co2_target: CO2 level (PPM) at which a ventilation burst stops.
+        By default, halfway between the two thresholds of the office.
+        :param horizon: how far ahead the CO2 level is predicted.
+        :param history: number of readings used to estimate the rate of rise.
+        :param occupied_rise: minimum rate of rise (PPM per minute) assumed while the office is occupied.
+        :param min_on: minimum time the fan is kept on once turned on.
+        :param min_off: minimum time the fan is kept off once turned off, unless co2_max is reached.
+        """
+        self.co2_max = co2_max
+        self.co2_target = co2_target
+        self.horizon = horizon.total_seconds() / 60
+        self.occupied_rise = occupied_rise
+        self.min_on = min_on
+        self.min_off = min_off
+        self.samples = deque(maxlen=history)  # (minutes since the first sample, PPM) with the fan in its current state
+        self.origin = None
+        self.fan_switch_on = None
+        self.switched = None  # when the fan was last seen switching
+
+    def thresholds(self, co2_on: int, co2_off: int) -> Tuple[int, int]:
+        """
+        :return: co2_max and co2_target, given the thresholds of the office where they are not set.
+        """
+        co2_max = self.co2_max if self.co2_max is not None else co2_on
+        co2_target = self.co2_target if self.co2_target is not None else (co2_on + co2_off) / 2
+        return co2_max, min(co2_target, co2_max)
+
+    def rate(self) -> Optional[float]:
+        """
+        :return: the least squares slope (PPM per minute) of the readings, None if there are less than two of them.
+        """
+        count = len(self.samples)
+        if count < 2:
+            return None
+        mean_t = sum(t for t, _ in self.samples) / count
+        mean_ppm = sum(ppm for _, ppm in self.samples) / count
+        variance = sum((t - mean_t) ** 2 for t, _ in self.samples)
+        if variance == 0:
+            return None
+        return sum((t - mean_t) * (ppm - mean_ppm) for t, ppm in self.samples) / variance
+
+    def record(self, now: datetime, co2_level: int, fan_switch_on: bool) -> bool:
+        """
+        Adds a reading to the history, which only keeps the readings taken with the fan in its current state.
+        :return: False if the clock went backwards and the history had to be dropped.
+        """
+        if fan_switch_on != self.fan_switch_on or self.origin is None:
+            if self.fan_switch_on is not None and fan_switch_on != self.fan_switch_on:
+                self.switched = now
+            self.samples.clear()
+            self.origin = now
+            self.fan_switch_on = fan_switch_on
+        minutes = (now - self.origin).total_seconds() / 60
+        if self.samples and minutes < self.samples[-1][0]:
+            self.samples.clear()
+            self.origin = None
+            return False
+        self.samples.append((minutes, co2_level))
+        return True
+
+    def decide(self, now: datetime, co2_level: int, occupied: bool, fan_switch_on: bool,
+               co2_on: int, co2_off: int) -> Optional[bool]:
+        """
+        :param now: the time of the reading.
+        :param co2_level: the amount of CO2 (PPM) measured by the carbon dioxide sensor.
+        :param occupied: True if someone is in the office.
+        :param fan_switch_on: the current state of the fan.
+        :param co2_on: the CO2 level (PPM) at which the office turns its fan on (see effective_co2_thresholds).
+        :param co2_off: the CO2 level (PPM) below which the office turns its fan off.
+        :return: the new state of the fan, or None to fall back on the hysteresis.
+        """
+        if not self.record(now, co2_level, fan_switch_on):
+            return None
+        co2_max, co2_target = self.thresholds(co2_on, co2_off)
+        if co2_level >= co2_max:
+            return True
+        if self.switched is not None and now - self.switched < (self.min_on if fan_switch_on else self.min_off):
+            return fan_switch_on
+        if fan_switch_on:
+            return co2_level > co2_target
+        rate = self.rate()
+        if occupied:
+            rate = self.occupied_rise if rate is None else max(rate, self.occupied_rise)
+        elif rate is None:
+            return None
+        return co2_level + rate * self.horizon >= co2_max
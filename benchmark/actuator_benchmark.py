@@ -0,0 +1,25 @@
+"""
+Counts the light and fan writes requested by an office over simulated days and the ones
+actually issued to the GPIO once the no-op writes are suppressed.
+
+Usage: python -m benchmark.actuator_benchmark [number of days]
+"""
+import sys
+from datetime import datetime, timedelta
+
+from OfficeSimulator import OfficeSimulator, synthetic_trace
+
+MONDAY = datetime(2026, 10, 12)
+
+
+def main(days: int) -> None:
+    simulator = OfficeSimulator(MONDAY)
+    simulator.load_trace(synthetic_trace(MONDAY, days=days))
+    summary = simulator.run(until=MONDAY + timedelta(days=days))
+    print("{} day(s), {} ticks: {} writes requested, {} issued ({:.1f}% suppressed)".format(
+        days, summary.ticks, summary.writes_requested, summary.writes_issued,
+        100 * (1 - summary.writes_issued / summary.writes_requested)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1)
@@ -0,0 +1,41 @@
+"""
+Runs many offices in one asyncio event loop and reports the lateness (jitter) of the periodic
+tasks and the CPU time used.
+
+Usage: python -m benchmark.async_benchmark [number of offices] [seconds]
+"""
+import asyncio
+import statistics
+import sys
+import time
+
+import mock.GPIO as GPIO
+from AsyncRuntime import AsyncRuntime
+from BuildingController import BuildingController
+
+DEFAULT_SIZE = 1000
+DEFAULT_DURATION = 5.0
+
+
+def main(size: int, duration: float) -> None:
+    GPIO.set_timing(GPIO.TIMING_INSTANT)
+    with BuildingController() as building:
+        for _ in range(size):
+            office = building.add_office()
+            GPIO.set_input(office.INFRARED_PIN, 0)
+            GPIO.set_input(office.PHOTO_PIN, 525)
+            GPIO.set_input(office.CO2_PIN, 600)
+        runtime = AsyncRuntime(building.offices, light_period=0.1, air_period=1.0)
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        asyncio.run(runtime.run(duration=duration))
+        cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+    lateness = sorted(runtime.lateness)
+    print("{} offices, {} tasks, {:.1f} s".format(size, 3 * size, wall))
+    print("jitter: mean {:.2f} ms, p99 {:.2f} ms, max {:.2f} ms".format(
+        statistics.mean(lateness) * 1000, lateness[int(len(lateness) * 0.99)] * 1000, lateness[-1] * 1000))
+    print("CPU: {:.1f}% of one core".format(100 * cpu / wall))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE,
+         float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_DURATION)
@@ -0,0 +1,52 @@
+"""
+Compares the vectorized rules of BatchRules with looping the scalar IntelligentOffice methods.
+
+Usage: python -m benchmark.batch_benchmark [number of offices]
+"""
+import random
+import sys
+import time
+from unittest.mock import patch
+
+import numpy as np
+
+import mock.GPIO as GPIO
+from IntelligentOffice import IntelligentOffice
+from BatchRules import batch_light_level, batch_air_quality
+
+DEFAULT_SIZE = 100000
+
+
+def scalar_time(office: IntelligentOffice, occupancy, lux, co2) -> float:
+    readings = [value for sample in zip(occupancy, lux, co2) for value in sample]
+    with patch.object(GPIO, "input", side_effect=readings):
+        start = time.perf_counter()
+        for _ in range(len(occupancy)):
+            office.manage_light_level()
+            office.monitor_air_quality()
+        return time.perf_counter() - start
+
+
+def batch_time(occupancy, lux, co2) -> float:
+    occupancy, lux, co2 = np.array(occupancy), np.array(lux), np.array(co2)
+    light_on = np.zeros(len(occupancy), dtype=bool)
+    fan_switch_on = np.zeros(len(occupancy), dtype=bool)
+    start = time.perf_counter()
+    batch_light_level(occupancy, lux, light_on)
+    batch_air_quality(co2, fan_switch_on)
+    return time.perf_counter() - start
+
+
+def main(size: int) -> None:
+    rnd = random.Random(0)
+    # Only occupied samples, so that manage_light_level always reads both sensors
+    occupancy = [0] * size
+    lux = [rnd.randint(400, 650) for _ in range(size)]
+    co2 = [rnd.randint(400, 900) for _ in range(size)]
+    scalar = scalar_time(IntelligentOffice(), occupancy, lux, co2)
+    batch = batch_time(occupancy, lux, co2)
+    print("{} offices: scalar {:.4f} s, batch {:.4f} s, speedup x{:.0f}".format(size, scalar, batch, scalar / batch))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE)
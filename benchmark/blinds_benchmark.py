@@ -0,0 +1,37 @@
+"""
+Compares the blinds decision based on the RTC time string with the weekly schedule table lookup.
+
+Usage: python -m benchmark.blinds_benchmark [number of decisions]
+"""
+import sys
+import time
+import timeit
+
+from mock.RTC import RTC
+from IntelligentOffice import IntelligentOffice
+
+DEFAULT_CALLS = 200000
+
+
+def string_decision():
+    current_time = time.strptime(RTC.get_current_time_string(), "%H:%M:%S")
+    hour = current_time.tm_hour
+    day = RTC.get_current_day()
+    if day in ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY"]:
+        return 8 <= hour < 20
+    return None
+
+
+def table_decision():
+    schedule = IntelligentOffice.DEFAULT_BLINDS_SCHEDULE
+    return schedule.action_at(RTC.get_current_datetime())
+
+
+def main(calls: int) -> None:
+    for name, decision in (("string path", string_decision), ("table path", table_decision)):
+        elapsed = timeit.timeit(decision, number=calls)
+        print("{:<12} {:8.3f} us/decision".format(name, elapsed / calls * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CALLS)
@@ -0,0 +1,43 @@
+"""
+Measures how many building control ticks per second the BuildingController sustains.
+
+Usage: python -m benchmark.building_benchmark [number of offices ...]
+"""
+import sys
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import mock.GPIO as GPIO
+from mock.RTC import RTC
+from BuildingController import BuildingController
+
+DEFAULT_SIZES = (10, 1000, 10000)
+TICKS = 20
+
+
+def ticks_per_second(size: int, ticks: int = TICKS) -> float:
+    # Monday night: the blinds are already closed, so no servo move slows down the ticks
+    with patch.object(RTC, "get_current_datetime", return_value=datetime(2026, 10, 12, 22, 0)):
+        with BuildingController() as building:
+            for _ in range(size):
+                office = building.add_office()
+                GPIO.set_input(office.INFRARED_PIN, 0)
+                GPIO.set_input(office.PHOTO_PIN, 450)
+                GPIO.set_input(office.CO2_PIN, 600)
+            building.tick()
+            start = time.perf_counter()
+            for _ in range(ticks):
+                building.tick()
+            elapsed = time.perf_counter() - start
+    GPIO.cleanup()
+    return ticks / elapsed
+
+
+def main(sizes) -> None:
+    for size in sizes:
+        print("{:>6} offices: {:10.2f} ticks/s".format(size, ticks_per_second(size)))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
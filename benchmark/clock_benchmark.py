@@ -0,0 +1,45 @@
+"""
+Counts the clock reads of a building tick, with and without the RTC tick snapshot.
+
+Usage: python -m benchmark.clock_benchmark [number of offices]
+"""
+import sys
+from datetime import datetime
+
+import mock.GPIO as GPIO
+from mock.Clock import SystemClock
+from mock.RTC import RTC
+from BuildingController import BuildingController
+
+
+class CountingClock(SystemClock):
+    reads = 0
+
+    @classmethod
+    def now(cls) -> datetime:
+        cls.reads += 1
+        return datetime(2026, 10, 12, 22, 0)  # Monday at 22:00: the blinds do not move
+
+
+def unsnapshotted_tick(building: BuildingController) -> None:
+    # What every office paid before the snapshot: its own clock reads for the blinds decision
+    for office in building.offices:
+        office.manage_blinds_based_on_time()
+
+
+def main(offices: int) -> None:
+    RTC.set_clock(CountingClock())
+    with BuildingController() as building:
+        for _ in range(offices):
+            office = building.add_office()
+            GPIO.set_input(office.INFRARED_PIN, 1)
+            GPIO.set_input(office.CO2_PIN, 600)
+        for name, tick in (("per office", lambda: unsnapshotted_tick(building)), ("snapshot", building.tick)):
+            CountingClock.reads = 0
+            tick()
+            print("{:<10} {:6d} clock reads per building tick".format(name, CountingClock.reads))
+    RTC.set_clock(SystemClock())
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
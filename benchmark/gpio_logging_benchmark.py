@@ -0,0 +1,42 @@
+"""
+Measures the cost of a million GPIO.output() calls with logging off, with logging on
+and with the pin trace enabled.
+
+Usage: python -m benchmark.gpio_logging_benchmark [number of calls]
+"""
+import logging
+import os
+import sys
+import time
+
+import mock.GPIO as GPIO
+
+DEFAULT_CALLS = 1000000
+
+
+def output_time(calls: int) -> float:
+    output = GPIO.output
+    start = time.perf_counter()
+    for i in range(calls):
+        output(29, i & 1)
+    return time.perf_counter() - start
+
+
+def main(calls: int) -> None:
+    GPIO.set_log_level(logging.ERROR)
+    print("logging off   {:8.3f} s".format(output_time(calls)))
+
+    GPIO.enable_trace()
+    print("trace on      {:8.3f} s".format(output_time(calls)))
+    GPIO.disable_trace()
+
+    with open(os.devnull, "w") as devnull:
+        GPIO.stream_handler.setStream(devnull)
+        GPIO.set_log_level(logging.INFO)
+        print("logging on    {:8.3f} s".format(output_time(calls)))
+        GPIO.set_log_level(logging.ERROR)
+        GPIO.stream_handler.setStream(sys.stderr)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CALLS)
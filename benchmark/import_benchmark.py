@@ -0,0 +1,45 @@
+"""
+Measures the cold start of worker processes: the cumulative import time of the main modules,
+as reported by python -X importtime in a fresh interpreter, and the time to spawn an interpreter
+that imports them.
+
+Usage: python -m benchmark.import_benchmark [number of runs]
+"""
+import os
+import subprocess
+import sys
+import time
+
+MODULES = ("mock.GPIO", "IntelligentOffice", "BuildingController", "ShardedBuildingController")
+DEFAULT_RUNS = 5
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time(module: str) -> float:
+    """
+    :return: the cumulative import time of the module (seconds) in a fresh interpreter.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + module], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    for line in reversed(result.stderr.splitlines()):
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1e6
+    raise ValueError("No import time reported for " + module)
+
+
+def spawn_time(module: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "import " + module], cwd=ROOT, check=True)
+    return time.perf_counter() - start
+
+
+def main(runs: int) -> None:
+    for module in MODULES:
+        imported = min(import_time(module) for _ in range(runs))
+        spawned = min(spawn_time(module) for _ in range(runs))
+        print("{:<26} import {:7.1f} ms  spawn {:7.1f} ms".format(module, imported * 1e3, spawned * 1e3))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS)
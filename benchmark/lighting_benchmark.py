@@ -0,0 +1,30 @@
+"""
+Counts the light switches of an office on a simulated occupancy trace, with the light switched
+as soon as the occupancy changes and with the lighting state machine.
+
+Usage: python -m benchmark.lighting_benchmark [number of days]
+"""
+import sys
+from datetime import datetime, timedelta
+
+import mock.GPIO as GPIO
+from IntelligentOffice import IntelligentOffice
+from Lighting import LightingStateMachine
+from OfficeSimulator import OfficeSimulator, synthetic_trace
+
+MONDAY = datetime(2026, 10, 12)
+
+
+def main(days: int) -> None:
+    trace = synthetic_trace(MONDAY, days=days)
+    for name, lighting in (("immediate", None), ("state machine", LightingStateMachine())):
+        GPIO.cleanup()
+        simulator = OfficeSimulator(MONDAY, IntelligentOffice(lighting=lighting))
+        simulator.load_trace(trace)
+        summary = simulator.run(until=MONDAY + timedelta(days=days))
+        print("{:<14} {:5d} light switches {:7.0f} light-on minutes".format(
+            name, summary.switches["light_on"], summary.on_time["light_on"] / 60))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
@@ -0,0 +1,39 @@
+"""
+Measures the cost of an office tick without instrumentation and with OfficeInstrumentation and
+GPIO counters attached.
+
+Usage: python -m benchmark.metrics_benchmark [number of ticks]
+"""
+import sys
+import timeit
+from datetime import datetime
+from unittest.mock import patch
+
+import mock.GPIO as GPIO
+from mock.RTC import RTC
+from IntelligentOffice import IntelligentOffice
+from Metrics import MetricsRegistry, OfficeInstrumentation, instrument_gpio, uninstrument_gpio
+
+DEFAULT_TICKS = 100000
+
+
+def main(ticks: int) -> None:
+    office = IntelligentOffice()
+    GPIO.set_input(office.INFRARED_PIN, 0)
+    GPIO.set_input(office.PHOTO_PIN, 525)
+    GPIO.set_input(office.CO2_PIN, 600)
+    with patch.object(RTC, "get_current_datetime", return_value=datetime(2026, 10, 12, 22, 0)):
+        disabled = timeit.timeit(office.tick, number=ticks)
+        registry = MetricsRegistry()
+        instrumentation = OfficeInstrumentation(office, registry).attach()
+        instrument_gpio(registry)
+        enabled = timeit.timeit(office.tick, number=ticks)
+        uninstrument_gpio()
+        instrumentation.detach()
+    GPIO.cleanup()
+    print("disabled {:8.2f} us/tick".format(disabled / ticks * 1e6))
+    print("enabled  {:8.2f} us/tick".format(enabled / ticks * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TICKS)
@@ -0,0 +1,60 @@
+"""
+Counts the reads of the infrared sensor during one simulated hour of light management,
+polling it on every tick versus caching the occupancy updated by its edges.
+
+Usage: python -m benchmark.occupancy_benchmark [ticks per second]
+"""
+import random
+import sys
+from unittest.mock import patch
+
+import mock.GPIO as GPIO
+from IntelligentOffice import IntelligentOffice
+
+SECONDS_PER_HOUR = 3600
+
+
+def occupancy_trace(seed: int = 0) -> list:
+    """
+    One value of the infrared sensor per second: the worker comes and goes every few minutes.
+    """
+    rnd = random.Random(seed)
+    trace = []
+    value = 0
+    while len(trace) < SECONDS_PER_HOUR:
+        trace.extend([value] * rnd.randint(60, 600))
+        value = 1 - value
+    return trace[:SECONDS_PER_HOUR]
+
+
+def infrared_reads(event_driven: bool, ticks_per_second: int) -> int:
+    GPIO.set_input(IntelligentOffice.INFRARED_PIN, 1)
+    GPIO.set_input(IntelligentOffice.PHOTO_PIN, 450)
+    # The simulated edges happen faster than real time, so debouncing is disabled
+    with patch.object(IntelligentOffice, "OCCUPANCY_BOUNCETIME", None):
+        office = IntelligentOffice(event_driven_occupancy=event_driven)
+    reads = 0
+    real_input = GPIO.input
+
+    def counting_input(channel):
+        nonlocal reads
+        if channel == office.INFRARED_PIN:
+            reads += 1
+        return real_input(channel)
+
+    with patch.object(GPIO, "input", side_effect=counting_input):
+        for value in occupancy_trace():
+            GPIO.set_input(office.INFRARED_PIN, value)
+            for _ in range(ticks_per_second):
+                office.manage_light_level()
+    GPIO.cleanup()
+    return reads
+
+
+def main(ticks_per_second: int) -> None:
+    for name, event_driven in (("polling", False), ("event-driven", True)):
+        print("{:<13} {:8d} infrared reads/hour".format(name, infrared_reads(event_driven, ticks_per_second)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1)
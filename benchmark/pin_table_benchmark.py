@@ -0,0 +1,49 @@
+"""
+Reports the memory used by the pin state of one simulated board and the throughput of
+single and bulk reads/writes of the pin state table.
+
+Usage: python -m benchmark.pin_table_benchmark [number of operations]
+"""
+import sys
+import time
+
+import mock.GPIO as GPIO
+
+DEFAULT_OPERATIONS = 1000000
+SENSOR_PINS = (11, 22, 31)
+
+
+def table_bytes(table: GPIO.PinStateTable) -> int:
+    arrays = (table.direction, table.pull_up_down, table.output_values, table.input_values)
+    return sys.getsizeof(table) + sum(sys.getsizeof(values) for values in arrays)
+
+
+def channel_dict_bytes(pins: int) -> int:
+    # Pin state stored as a dict of Channel objects, as mock.GPIO used to do
+    config = {pin: GPIO.Channel(pin, GPIO.IN) for pin in range(pins)}
+    return sys.getsizeof(config) + sum(sys.getsizeof(channel) for channel in config.values())
+
+
+def operations_per_second(operation, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        operation()
+    return count / (time.perf_counter() - start)
+
+
+def main(count: int) -> None:
+    board = GPIO.BOARD_PINS + 1
+    table = GPIO.PinStateTable(board)
+    print("memory per board: table {} bytes, dict of Channel {} bytes".format(
+        table_bytes(table), channel_dict_bytes(board)))
+    for pin in SENSOR_PINS:
+        table.set_input(pin, 500)
+    print("read        {:12.0f} ops/s".format(operations_per_second(lambda: table.read(22), count)))
+    print("write       {:12.0f} ops/s".format(operations_per_second(lambda: table.write(29, 1), count)))
+    reads = operations_per_second(lambda: table.read_many(SENSOR_PINS), count // len(SENSOR_PINS))
+    print("read_many   {:12.0f} pins/s".format(reads * len(SENSOR_PINS)))
+    print("GPIO.input  {:12.0f} ops/s".format(operations_per_second(lambda: GPIO.input(22), count)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_OPERATIONS)
@@ -0,0 +1,61 @@
+"""
+Measures the throughput of the sensor pipeline and counts the light and fan switches caused by
+noisy readings, with and without smoothing.
+
+Usage: python -m benchmark.pipeline_benchmark [number of samples]
+"""
+import random
+import sys
+import time
+
+import mock.GPIO as GPIO
+from IntelligentOffice import IntelligentOffice
+from SensorPipeline import sample, smooth_readings, changes, drive
+
+DEFAULT_SAMPLES = 100000
+WINDOW = 5
+
+
+def noisy_readings(count: int, seed: int = 0) -> list:
+    """
+    Occupied office with light level and CO2 close to the thresholds, plus occasional spikes.
+    """
+    rnd = random.Random(seed)
+    readings = []
+    for _ in range(count):
+        light_level = 525 + rnd.randint(-20, 20) + (rnd.choice([-200, 200]) if rnd.random() < 0.05 else 0)
+        co2_level = 650 + rnd.randint(-50, 50) + (400 if rnd.random() < 0.05 else 0)
+        readings.append((True, light_level, co2_level))
+    return readings
+
+
+def switches(office: IntelligentOffice, readings) -> int:
+    count = 0
+    state = (office.light_on, office.fan_switch_on)
+    for reading in readings:
+        drive(office, [reading])
+        new_state = (office.light_on, office.fan_switch_on)
+        count += sum(a != b for a, b in zip(state, new_state))
+        state = new_state
+    return count
+
+
+def main(count: int) -> None:
+    readings = noisy_readings(count)
+    source = iter(readings)
+    start = time.perf_counter()
+    # Samples are taken back to back, to measure the cost of the pipeline itself
+    stream = sample(lambda: next(source), period=0, count=count, sleep=lambda seconds: None)
+    consumed = sum(1 for _ in changes(smooth_readings(stream, WINDOW)))
+    elapsed = time.perf_counter() - start
+    print("pipeline: {:.0f} samples/s ({} changes out of {} samples)".format(count / elapsed, consumed, count))
+
+    office = IntelligentOffice()
+    print("actuations without smoothing: {}".format(switches(office, readings)))
+    office.light_on = office.fan_switch_on = False
+    print("actuations with a {}-sample median: {}".format(WINDOW, switches(office, smooth_readings(readings, WINDOW))))
+    GPIO.cleanup()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SAMPLES)
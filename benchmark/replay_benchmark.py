@@ -0,0 +1,38 @@
+"""
+Records the GPIO traffic of simulated days of an office and replays it at max speed, reporting
+the replay throughput.
+
+Usage: python -m benchmark.replay_benchmark [number of days]
+"""
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import mock.GPIO as GPIO
+from IntelligentOffice import IntelligentOffice
+from OfficeSimulator import OfficeSimulator, synthetic_trace
+from TrafficReplay import ActionRecorder, TrafficReplayer
+
+MONDAY = datetime(2026, 10, 12)
+
+
+def main(days: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "traffic.log")
+        simulator = OfficeSimulator(MONDAY)
+        simulator.load_trace(synthetic_trace(MONDAY, days=days))
+        recorder = ActionRecorder([simulator.office]).attach()
+        GPIO.start_recording(path)
+        simulator.run(until=MONDAY + timedelta(days=days))
+        GPIO.stop_recording()
+        recorder.detach()
+        GPIO.cleanup()
+        print("log: {:.1f} MB".format(os.path.getsize(path) / 1e6))
+        stats = TrafficReplayer([IntelligentOffice()]).replay(path)
+        print(stats)
+        GPIO.cleanup()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
@@ -0,0 +1,99 @@
+"""
+Compares the light and air quality rules of IntelligentOffice, which are compiled from its thresholds
+(built-in) or from the default config of a RuleEngine (engine), with the hand-written methods they replaced.
+
+Usage: python -m benchmark.rules_benchmark [number of decisions]
+"""
+import random
+import sys
+import timeit
+
+from IntelligentOffice import IntelligentOffice
+from RuleEngine import RuleEngine
+
+DEFAULT_CALLS = 200000
+
+
+class HandWrittenOffice(IntelligentOffice):
+    """
+    The light and air quality rules as they were written before being compiled. The lighting and ventilation
+    controllers are checked for as in the office, so that only the rules differ.
+    """
+
+    def apply_light_level(self, occupied, light_level, rules=None):
+        if self.lighting is not None:
+            return super().apply_light_level(occupied, light_level, rules)
+        if occupied:
+            if light_level < self.LUX_MIN:
+                self.turn_on_light()
+            elif light_level > self.LUX_MAX:
+                self.turn_off_light()
+        else:
+            self.turn_off_light()
+
+    def apply_air_quality(self, c02_level, occupied=None, rules=None):
+        if self.ventilation is not None:
+            return super().apply_air_quality(c02_level, occupied, rules)
+        if c02_level >= self.CO2_MAX:
+            self.switch_fan(True)
+        elif c02_level < self.CO2_MIN:
+            self.switch_fan(False)
+
+
+def random_readings(calls: int) -> list:
+    """
+    Readings drawn independently of each other: the rules change their decision on most of them.
+    """
+    rng = random.Random(0)
+    return [(rng.random() < 0.7, rng.randint(400, 650), rng.randint(400, 900)) for _ in range(calls)]
+
+
+def drifting_readings(calls: int) -> list:
+    """
+    Readings that drift from one to the next, like the ones of the sensors of an office.
+    """
+    rng = random.Random(0)
+    occupied, lux, co2 = True, 525, 650
+    readings = []
+    for _ in range(calls):
+        if rng.random() < 0.01:
+            occupied = not occupied
+        lux = min(650, max(400, lux + rng.randint(-5, 5)))
+        co2 = min(900, max(400, co2 + rng.randint(-5, 5)))
+        readings.append((occupied, lux, co2))
+    return readings
+
+
+def decisions(office: IntelligentOffice, readings: list):
+    def run():
+        for occupied, lux, co2 in readings:
+            # As in tick(): the rules are read once per control cycle
+            rules = office.start_cycle()
+            office.apply_light_level(occupied, lux, rules)
+            office.apply_air_quality(co2, occupied, rules)
+    return run
+
+
+def main(calls: int) -> None:
+    for name, readings in (("random", random_readings(calls)), ("drifting", drifting_readings(calls))):
+        print("{} readings:".format(name))
+        compare(readings)
+
+
+def compare(readings: list) -> None:
+    offices = (("hand-written", HandWrittenOffice()), ("built-in", IntelligentOffice()),
+               ("engine", IntelligentOffice(rules=RuleEngine())))
+    runs = [decisions(office, readings) for _, office in offices]
+    best = [float("inf")] * len(offices)
+    repeat = 15
+    # Interleaved, so that a noisy period of the machine does not favour one of the variants
+    for _ in range(repeat):
+        for i, run in enumerate(runs):
+            best[i] = min(best[i], timeit.timeit(run, number=1))
+    for (name, office), elapsed in zip(offices, best):
+        print("  {:<12} {:8.3f} us/decision {:10.1f} writes requested per 1000 decisions".format(
+            name, elapsed / len(readings) * 1e6, office.actuators.writes_requested / (repeat * len(readings)) * 1000))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CALLS)
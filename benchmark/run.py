@@ -0,0 +1,168 @@
+"""
+Benchmark suite of IntelligentOffice and mock.GPIO.
+
+Every benchmark reports the best time per operation over a few repetitions. Results can be saved
+as a JSON baseline and later compared against it: the run fails when a benchmark is slower than
+its baseline by more than the threshold.
+
+Usage:
+    python -m benchmark.run [--only NAME ...] [--save baseline.json] [--compare baseline.json] [--threshold 0.25]
+"""
+import argparse
+import json
+import sys
+import timeit
+from datetime import datetime
+from typing import Callable, Dict, Tuple
+
+import mock.GPIO as GPIO
+from mock.Clock import SystemClock, VirtualClock
+from mock.RTC import RTC
+from BuildingController import BuildingController
+from IntelligentOffice import IntelligentOffice
+
+REPEAT = 5
+BENCHMARKS = {}  # name -> (setup returning the callable to time and its teardown, operations per repetition)
+
+
+def benchmark(name: str, number: int):
+    """
+    Registers a benchmark: the decorated function prepares what has to be measured and returns the callable
+    to time plus a teardown callable.
+    """
+    def register(setup: Callable[[], Tuple[Callable, Callable]]):
+        BENCHMARKS[name] = (setup, number)
+        return setup
+    return register
+
+
+def office_with_sensors(**pins) -> IntelligentOffice:
+    office = IntelligentOffice(**pins)
+    GPIO.set_input(office.INFRARED_PIN, 0)
+    GPIO.set_input(office.PHOTO_PIN, 525)
+    GPIO.set_input(office.CO2_PIN, 600)
+    return office
+
+
+def night_clock() -> VirtualClock:
+    # Monday at 22:00: the blinds are closed and do not move
+    return VirtualClock(datetime(2026, 10, 12, 22, 0))
+
+
+def teardown() -> None:
+    RTC.set_clock(SystemClock())
+    GPIO.cleanup()
+
+
+@benchmark("constructor_cold", number=1)
+def constructor_cold():
+    # Real-time GPIO initialisation included: catches delays added to the board setup
+    def construct():
+        GPIO.cleanup()
+        IntelligentOffice()
+    return construct, teardown
+
+
+@benchmark("constructor_shared_init", number=1000)
+def constructor_shared_init():
+    IntelligentOffice()
+    return IntelligentOffice, teardown
+
+
+def decision(method: str):
+    def setup():
+        RTC.set_clock(night_clock())
+        return getattr(office_with_sensors(), method), teardown
+    return setup
+
+
+for method in ("check_occupancy", "manage_light_level", "monitor_air_quality", "manage_blinds_based_on_time",
+               "tick"):
+    benchmark(method, number=10000)(decision(method))
+
+
+@benchmark("gpio_input", number=100000)
+def gpio_input():
+    GPIO.set_input(22, 525)
+    return lambda: GPIO.input(22), teardown
+
+
+@benchmark("gpio_output", number=100000)
+def gpio_output():
+    return lambda: GPIO.output(29, GPIO.HIGH), teardown
+
+
+@benchmark("gpio_pwm_duty_cycle", number=100000)
+def gpio_pwm_duty_cycle():
+    pwm = GPIO.PWM(18, 50)
+    pwm.start(0)
+    return lambda: pwm.ChangeDutyCycle(12), teardown
+
+
+@benchmark("building_tick_100", number=10)
+def building_tick_100():
+    RTC.set_clock(night_clock())
+    building = BuildingController()
+    for index in range(100):
+        building.offices.append(office_with_sensors(pins=BuildingController.pin_map(index)))
+
+    def close():
+        building.close()
+        teardown()
+    return building.tick, close
+
+
+def run(names=None) -> Dict[str, float]:
+    """
+    :return: the best time per operation (seconds) of each benchmark.
+    """
+    results = {}
+    for name, (setup, number) in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        function, done = setup()
+        try:
+            results[name] = min(timeit.repeat(function, number=number, repeat=REPEAT)) / number
+        finally:
+            done()
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> list:
+    """
+    :return: (name, baseline, result) of the benchmarks slower than their baseline by more than threshold
+    (e.g., 0.25 means 25% slower).
+    """
+    return [(name, baseline[name], result) for name, result in results.items()
+            if name in baseline and result > baseline[name] * (1 + threshold)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--only", nargs="*", help="benchmarks to run (all if missing)")
+    parser.add_argument("--save", help="write the results to this JSON baseline")
+    parser.add_argument("--compare", help="compare the results with this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    results = run(args.only)
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+    for name, result in results.items():
+        line = "{:<30} {:12.3f} us".format(name, result * 1e6)
+        if name in baseline:
+            line += "  ({:+.1f}% vs baseline)".format((result / baseline[name] - 1) * 100)
+        print(line)
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+    regressions = compare(results, baseline, args.threshold)
+    for name, before, after in regressions:
+        print("REGRESSION {}: {:.3f} us -> {:.3f} us".format(name, before * 1e6, after * 1e6))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
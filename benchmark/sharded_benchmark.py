@@ -0,0 +1,31 @@
+"""
+Measures the tick throughput of a sharded building as the number of worker processes grows
+from 1 to the number of CPUs.
+
+Usage: python -m benchmark.sharded_benchmark [number of offices] [number of ticks]
+"""
+import multiprocessing
+import sys
+import time
+from datetime import datetime
+
+from mock.Clock import VirtualClock
+from ShardedBuildingController import ShardedBuildingController
+
+NIGHT = VirtualClock(datetime(2026, 10, 12, 22, 0))  # Monday at 22:00: the blinds do not move
+
+
+def main(offices: int, ticks: int) -> None:
+    for workers in range(1, multiprocessing.cpu_count() + 1):
+        with ShardedBuildingController(offices, workers=workers, clock=NIGHT) as building:
+            for index in range(offices):
+                building.set_readings(index, index % 2, 400 + index % 300, 450 + index % 500)
+            building.tick()
+            start = time.perf_counter()
+            building.tick(ticks)
+            elapsed = time.perf_counter() - start
+        print("{:>3} worker(s): {:10.0f} office ticks/s".format(workers, offices * ticks / elapsed))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000, int(sys.argv[2]) if len(sys.argv) > 2 else 20)
@@ -0,0 +1,35 @@
+"""
+Saves and restores the state of every office of a building with a memory-mapped StateSnapshot.
+
+Usage: python -m benchmark.snapshot_benchmark [number of offices]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from BuildingController import BuildingController
+from StateSnapshot import StateSnapshot
+
+
+def main(offices: int) -> None:
+    with BuildingController() as building, tempfile.TemporaryDirectory() as directory:
+        for index in range(offices):
+            office = building.add_office()
+            office.blinds_open = office.light_on = index % 2 == 0
+        path = os.path.join(directory, "building.snapshot")
+        with StateSnapshot(path, offices) as snapshot:
+            start = time.perf_counter()
+            snapshot.save_all(building.offices)
+            snapshot.flush()
+            saved = time.perf_counter() - start
+        with StateSnapshot(path, offices) as snapshot:
+            start = time.perf_counter()
+            snapshot.restore_all(building.offices)
+            restored = time.perf_counter() - start
+        print("{} offices, {} bytes: save {:.2f} ms, restore {:.2f} ms".format(
+            offices, os.path.getsize(path), saved * 1e3, restored * 1e3))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,43 @@
+"""
+Measures the time needed to create the offices of a building.
+
+"per-office init" resets the board before each office, as every constructor used to call
+setmode/setwarnings; it is measured on a few offices and extrapolated, since in real time
+it costs one second per office.
+
+Usage: python -m benchmark.startup_benchmark [number of offices]
+"""
+import sys
+import time
+
+import mock.GPIO as GPIO
+from BuildingController import BuildingController
+
+DEFAULT_SIZE = 1000
+SAMPLE = 3
+
+
+def startup_time(size: int, timing_mode: int, shared_init: bool = True) -> float:
+    GPIO.set_timing(timing_mode)
+    GPIO.cleanup()
+    with BuildingController() as building:
+        start = time.perf_counter()
+        for _ in range(size):
+            if not shared_init:
+                GPIO.cleanup()
+            building.add_office()
+        elapsed = time.perf_counter() - start
+    GPIO.cleanup()
+    GPIO.set_timing(GPIO.TIMING_REALTIME)
+    return elapsed
+
+
+def main(size: int) -> None:
+    before = startup_time(SAMPLE, GPIO.TIMING_REALTIME, shared_init=False) / SAMPLE * size
+    print("per-office init, real time {:10.3f} s (estimated)".format(before))
+    print("shared init, real time     {:10.3f} s".format(startup_time(size, GPIO.TIMING_REALTIME)))
+    print("shared init, instant       {:10.3f} s".format(startup_time(size, GPIO.TIMING_INSTANT)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE)
@@ -0,0 +1,32 @@
+"""
+Compares the CO2 hysteresis with the predictive ventilation on simulated weeks, with a closed-loop
+model of the office air: fan-on minutes, fan switches and peak CO2 level. The predictive ventilation
+is run with and without its minimum on/off times, which trade fan-on minutes for fewer switches.
+
+Usage: python -m benchmark.ventilation_benchmark [number of days]
+"""
+import sys
+from datetime import datetime, timedelta
+
+import mock.GPIO as GPIO
+from IntelligentOffice import IntelligentOffice
+from OfficeSimulator import OfficeSimulator, RoomAir, synthetic_trace
+from Ventilation import PredictiveVentilation
+
+MONDAY = datetime(2026, 10, 12)
+
+
+def main(days: int) -> None:
+    trace = [event for event in synthetic_trace(MONDAY, days=days) if event[1] != "CO2_PIN"]
+    no_dwell = PredictiveVentilation(min_on=timedelta(0), min_off=timedelta(0))
+    for name, ventilation in (("hysteresis", None), ("predictive", PredictiveVentilation()), ("no dwell", no_dwell)):
+        GPIO.cleanup()
+        simulator = OfficeSimulator(MONDAY, IntelligentOffice(ventilation=ventilation), air=RoomAir())
+        simulator.load_trace(trace)
+        summary = simulator.run(until=MONDAY + timedelta(days=days))
+        print("{:<10} {:7.0f} fan-on minutes {:5d} switches  peak {:4d} ppm".format(
+            name, summary.on_time["fan_switch_on"] / 60, summary.switches["fan_switch_on"], summary.peak_co2))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
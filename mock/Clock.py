@@ -0,0 +1,39 @@
+import time
+from datetime import datetime, timedelta
+
+
+class SystemClock:
+    """
+    Wall clock of the board: real date and time, real delays.
+    """
+
+    @staticmethod
+    def now() -> datetime:
+        return datetime.now()
+
+    @staticmethod
+    def sleep(seconds: float) -> None:
+        time.sleep(seconds)
+
+
+class VirtualClock:
+    """
+    Simulated clock: time only moves forward when sleep() or advance_to() are called,
+    so hours of simulated time can elapse in a few milliseconds.
+    """
+
+    def __init__(self, start: datetime):
+        self.current = start
+
+    def now(self) -> datetime:
+        return self.current
+
+    def sleep(self, seconds: float) -> None:
+        self.current += timedelta(seconds=seconds)
+
+    def advance_to(self, moment: datetime) -> None:
+        """
+        Moves the clock to the given moment; moments in the past are ignored.
+        """
+        if moment > self.current:
+            self.current = moment
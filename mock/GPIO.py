@@ -4,30 +4,55 @@ Mock Library for RPi.GPIO
 
 import time
 import logging
+import math
+from array import array
 import os
+import struct
+import threading
+from collections.abc import Mapping
 
 logger = logging.getLogger(__name__)
 
-log_level = os.getenv('LOG_LEVEL')
-
-if log_level is not None:
-    if log_level == "Info":
-        logger.setLevel(logging.INFO)
-    if log_level == "Debug":
-        logger.setLevel(logging.DEBUG)
-    if log_level == "Warning":
-        logger.setLevel(logging.WARNING)
-    if log_level == "Error":
-        logger.setLevel(logging.ERROR)
-    if log_level == "Critical":
-        logger.setLevel(logging.CRITICAL)
-else:
-    logger.setLevel(logging.ERROR)
-
-stream_formatter = logging.Formatter('%(asctime)s:%(levelname)s: %(message)s')
-stream_handler = logging.StreamHandler()
-stream_handler.setFormatter(stream_formatter)
-logger.addHandler(stream_handler)
+# The logger is configured on first use of the board (setmode, setup, input, output, PWM, ...), not at import:
+# importing the module has no side effects, and configuring it again never adds a second handler.
+LOG_LEVELS = {"Debug": logging.DEBUG, "Info": logging.INFO, "Warning": logging.WARNING, "Error": logging.ERROR,
+              "Critical": logging.CRITICAL}
+logging_configured = False
+stream_handler = None
+
+# Checked once instead of on every call: the hot paths (setup, input, output, PWM) skip
+# logging entirely when INFO messages are disabled. Call set_log_level() to change the level later.
+info_enabled = False
+
+
+def configure_logging():
+    """
+    Applies the LOG_LEVEL environment variable (ERROR by default) and attaches the stream handler of the module,
+    unless already done.
+    """
+    global logging_configured, stream_handler, info_enabled
+    if logging_configured:
+        return
+    logging_configured = True
+    logger.setLevel(LOG_LEVELS.get(os.getenv('LOG_LEVEL'), logging.ERROR))
+    # The handler may survive a reload of the module along with the logger
+    stream_handler = next((handler for handler in logger.handlers if getattr(handler, "mock_gpio", False)), None)
+    if stream_handler is None:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter('%(asctime)s:%(levelname)s: %(message)s'))
+        stream_handler.mock_gpio = True
+        logger.addHandler(stream_handler)
+    info_enabled = logger.isEnabledFor(logging.INFO)
+
+
+def set_log_level(level):
+    """
+    Changes the level of the logger of this module and refreshes the cached level check.
+    """
+    global info_enabled
+    configure_logging()
+    logger.setLevel(level)
+    info_enabled = logger.isEnabledFor(logging.INFO)
 
 BCM = 11
 BOARD = 10
@@ -50,14 +75,50 @@ SPI = 41
 UNKNOWN = -1
 VERSION = '0.7.0'
 
-_mode = 0
+_mode = None
+
+# direction, pull up/down, output and input values of every channel, see PinStateTable
+BOARD_PINS = 40
 
-channel_config = {}
+# edge detection enabled through add_event_detect(), by channel
+event_config = {}
+event_condition = threading.Condition()
 
 #flags
 setModeDone = False
 
+# timing model of the simulated board, see set_timing()
+TIMING_REALTIME = 0  # delays last as on the real board
+TIMING_SCALED = 1    # delays are multiplied by the timing scale
+TIMING_INSTANT = 2   # delays are skipped
+timing_mode = TIMING_REALTIME
+timing_scale = 1.0
+
+# pin operations recorded by the trace
+TRACE_SETUP = 1
+TRACE_INPUT = 2
+TRACE_OUTPUT = 3
+TRACE_PWM = 4
+TRACE_SET_INPUT = 5
+# Control actions that ended, see mark(): a whole control cycle, or one of the actions run separately
+TRACE_MARK = 6
+TRACE_MARK_LIGHT = 7
+TRACE_MARK_AIR = 8
+TRACE_MARK_BLINDS = 9
+TRACE_OPERATIONS = {TRACE_SETUP: 'SETUP', TRACE_INPUT: 'INPUT', TRACE_OUTPUT: 'OUTPUT', TRACE_PWM: 'PWM',
+                    TRACE_SET_INPUT: 'SET_INPUT', TRACE_MARK: 'MARK', TRACE_MARK_LIGHT: 'MARK_LIGHT',
+                    TRACE_MARK_AIR: 'MARK_AIR', TRACE_MARK_BLINDS: 'MARK_BLINDS'}
+
+# binary record of a pin operation: time (s), channel, operation (TRACE_*) and value (NaN if missing)
+TRACE_RECORD = struct.Struct('<dIBd')
+
+# where the pin operations are recorded: a PinTrace (see enable_trace()), a TrafficRecorder
+# (see start_recording()) or None
+trace = None
+
 class Channel:
+    __slots__ = ('channel', 'direction', 'initial', 'pull_up_down')
+
     def __init__(self,channel, direction, initial=0,pull_up_down=PUD_OFF):
         self.channel = channel
         self.direction = direction
@@ -65,6 +126,294 @@ class Channel:
         self.pull_up_down = pull_up_down
 
 
+class PinStateTable:
+    """
+    Compact state of the simulated pins, indexed by channel number: directions and pull up/down settings
+    in byte arrays, values in lists, so that any value (e.g. a float light level) is kept as it is.
+    The table grows when a channel beyond its size is used, so several simulated boards can share
+    one table by using disjoint channel ranges.
+    """
+    __slots__ = ('size', 'direction', 'pull_up_down', 'output_values', 'input_values')
+
+    def __init__(self, size=BOARD_PINS + 1):
+        self.size = 0
+        self.direction = array('b')
+        self.pull_up_down = array('b')
+        self.output_values = []
+        self.input_values = []  # None for the channels that have never been given a value
+        self.grow(size)
+
+    def grow(self, size):
+        extra = size - self.size
+        if extra <= 0:
+            return
+        self.direction.extend([UNKNOWN] * extra)
+        self.pull_up_down.extend([PUD_OFF] * extra)
+        self.output_values.extend([LOW] * extra)
+        self.input_values.extend([None] * extra)
+        self.size = size
+
+    @staticmethod
+    def invalid(channel):
+        raise ValueError("The channel sent is invalid : {}".format(channel))
+
+    def ensure(self, channel):
+        if channel >= self.size:
+            self.grow(max(channel + 1, self.size * 2))
+        elif channel < 0:
+            self.invalid(channel)
+
+    def configure(self, channel, direction, initial=LOW, pull_up_down=PUD_OFF):
+        self.ensure(channel)
+        self.direction[channel] = direction
+        self.pull_up_down[channel] = pull_up_down
+        self.output_values[channel] = initial
+
+    def write(self, channel, value):
+        self.ensure(channel)
+        self.output_values[channel] = value
+
+    def write_many(self, channels, values):
+        if not channels:
+            return
+        self.ensure(max(channels))
+        if min(channels) < 0:
+            self.invalid(min(channels))
+        output_values = self.output_values
+        for channel, value in zip(channels, values):
+            output_values[channel] = value
+
+    def read(self, channel):
+        if channel < 0:
+            self.invalid(channel)
+        return self.input_values[channel] if channel < self.size else None
+
+    def read_many(self, channels):
+        return [self.read(channel) for channel in channels]
+
+    def set_input(self, channel, value):
+        self.ensure(channel)
+        self.input_values[channel] = value
+
+    def output_value(self, channel):
+        if channel < 0:
+            self.invalid(channel)
+        return self.output_values[channel] if channel < self.size else LOW
+
+    def channel(self, channel):
+        """
+        Returns the configuration of a channel as a Channel, or None if it has not been set up.
+        """
+        if not 0 <= channel < self.size or self.direction[channel] == UNKNOWN:
+            return None
+        return Channel(channel, self.direction[channel], self.output_values[channel], self.pull_up_down[channel])
+
+    def configured_channels(self):
+        return [channel for channel in range(self.size) if self.direction[channel] != UNKNOWN]
+
+    def used_channels(self):
+        return [channel for channel in range(self.size)
+                if self.direction[channel] != UNKNOWN or self.input_values[channel] is not None]
+
+    def reset(self, channel):
+        if 0 <= channel < self.size:
+            self.direction[channel] = UNKNOWN
+            self.pull_up_down[channel] = PUD_OFF
+            self.output_values[channel] = LOW
+            self.input_values[channel] = None
+
+
+class ChannelConfig(Mapping):
+    """
+    Read-only view of the channels that have been set up, by channel number, as Channel objects.
+    Kept for compatibility with the channel_config dictionary that used to hold the pin state.
+    """
+
+    def __init__(self, table):
+        self.table = table
+
+    def __getitem__(self, channel):
+        config = self.table.channel(channel) if isinstance(channel, int) else None
+        if config is None:
+            raise KeyError(channel)
+        return config
+
+    def __iter__(self):
+        return iter(self.table.configured_channels())
+
+    def __len__(self):
+        return len(self.table.configured_channels())
+
+
+pins = PinStateTable()
+channel_config = ChannelConfig(pins)
+# Incremented by every cleanup() of all the channels: caches of the pin values (e.g., ActuatorBank) compare it to know
+# they are stale. Whoever cleans up some channels only invalidates its own caches (see IntelligentOffice.cleanup)
+cleanups = 0
+
+
+class EventDetect:
+    def __init__(self, edge, bouncetime=None):
+        self.edge = edge
+        self.bouncetime = bouncetime
+        self.callbacks = []
+        self.detected = False
+        self.last_event_time = None
+        self.event_count = 0
+
+    def matches(self, edge):
+        return self.edge == BOTH or self.edge == edge
+
+    def debounced(self, now):
+        """
+        Returns True if an event at time now falls within the bouncetime of the previous one.
+        """
+        if self.bouncetime is None or self.last_event_time is None:
+            return False
+        return (now - self.last_event_time) * 1000 < self.bouncetime
+
+
+class PinTrace:
+    """
+    Fixed-size ring buffer of binary pin operation records, meant for post-mortem dumps.
+    Each record is a TRACE_RECORD.
+    """
+    RECORD = TRACE_RECORD
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.buffer = bytearray(capacity * self.RECORD.size)
+        self.count = 0
+
+    def record(self, operation, channel, value):
+        offset = (self.count % self.capacity) * self.RECORD.size
+        self.RECORD.pack_into(self.buffer, offset, time.time(), channel, operation,
+                              math.nan if value is None else value)
+        self.count += 1
+
+    def records(self):
+        """
+        Returns the recorded operations, oldest first, as (time, channel, operation name, value) tuples.
+        """
+        size = self.RECORD.size
+        first = max(0, self.count - self.capacity)
+        result = []
+        for index in range(first, self.count):
+            offset = (index % self.capacity) * size
+            timestamp, channel, operation, value = self.RECORD.unpack_from(self.buffer, offset)
+            result.append((timestamp, channel, TRACE_OPERATIONS[operation], value))
+        return result
+
+    def dump(self, path):
+        """
+        Writes the raw records, oldest first, to a binary file.
+        """
+        size = self.RECORD.size
+        start = (self.count % self.capacity) * size if self.count > self.capacity else 0
+        with open(path, 'wb') as file:
+            file.write(self.buffer[start:min(self.count, self.capacity) * size])
+            file.write(self.buffer[:start])
+
+
+def enable_trace(capacity=65536):
+    """
+    Starts recording the pin operations into a ring buffer holding the last capacity operations.
+    """
+    global trace
+    trace = PinTrace(capacity)
+    return trace
+
+def disable_trace():
+    global trace
+    trace = None
+
+
+class TrafficRecorder:
+    """
+    Appends the pin operations to a binary log of fixed-size TRACE_RECORD records, for offline replay.
+    """
+
+    def __init__(self, path, buffer_size=1 << 20):
+        self.file = open(path, 'ab', buffering=buffer_size)
+        self.count = 0
+
+    def record(self, operation, channel, value):
+        self.file.write(TRACE_RECORD.pack(time.time(), channel, operation, math.nan if value is None else value))
+        self.count += 1
+
+    def close(self):
+        self.file.close()
+
+
+def start_recording(path):
+    """
+    Starts appending the pin operations to the log at path (it replaces an enabled trace).
+    """
+    global trace
+    stop_recording()
+    trace = TrafficRecorder(path)
+    return trace
+
+def stop_recording():
+    global trace
+    if isinstance(trace, TrafficRecorder):
+        trace.close()
+        trace = None
+
+def read_log(path, chunk_records=65536):
+    """
+    Streams the records of a traffic log as (time, channel, operation, value) tuples, reading
+    chunk_records records at a time, so that logs larger than memory can be read.
+    """
+    size = TRACE_RECORD.size
+    buffer = bytearray(chunk_records * size)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as file:
+        pending = 0
+        while True:
+            read = file.readinto(view[pending:])
+            if not read:
+                break
+            available = pending + read
+            complete = available - available % size
+            yield from TRACE_RECORD.iter_unpack(view[:complete])
+            pending = available - complete
+            view[:pending] = view[complete:available]
+
+def mark(channel, moment=None, operation=TRACE_MARK):
+    """
+    Simulation only: records the end of a control action (see TrafficReplay.ActionRecorder).
+    channel   - identifies who ran the action
+    [moment]  - time of the RTC when the action started, in seconds since the epoch
+    [operation] - TRACE_MARK for a whole control cycle, or TRACE_MARK_LIGHT, TRACE_MARK_AIR, TRACE_MARK_BLINDS
+    """
+    if trace is not None:
+        trace.record(operation, channel, moment)
+
+
+def set_timing(mode, scale=1.0):
+    """
+    Simulation only: chooses how the delays of the simulated board are spent.
+    mode    - TIMING_REALTIME, TIMING_SCALED or TIMING_INSTANT
+    [scale] - factor applied to the delays in TIMING_SCALED mode
+    """
+    global timing_mode, timing_scale
+    if mode not in (TIMING_REALTIME, TIMING_SCALED, TIMING_INSTANT):
+        raise ValueError("Invalid timing mode : {}".format(mode))
+    timing_mode = mode
+    timing_scale = scale
+
+def sleep(seconds):
+    """
+    Simulation only: waits for a delay of the simulated board according to the timing model.
+    """
+    if timing_mode == TIMING_INSTANT:
+        return
+    if timing_mode == TIMING_SCALED:
+        seconds *= timing_scale
+    time.sleep(seconds)
+
+
 #GPIO LIBRARY Functions
 def setmode(mode):
     """
@@ -72,14 +421,12 @@ def setmode(mode):
     BOARD - Use Raspberry Pi board numbers
     BCM   - Use Broadcom GPIO 00..nn numbers
     """
-    # GPIO = GPIO()
-    time.sleep(1)
-    if(mode == BCM):
+    global setModeDone, _mode
+    configure_logging()
+    sleep(1)
+    if mode in (BCM, BOARD):
         setModeDone = True
         _mode = mode
-
-    elif (mode == BOARD):
-        setModeDone = True
     else:
         setModeDone = False
 
@@ -94,7 +441,8 @@ def setwarnings(flag):
     """
     Enable or disable warning messages
     """
-    logger.info("Set warnings as {}".format(flag))
+    configure_logging()
+    logger.info("Set warnings as %s", flag)
 
 def setup(channel, direction, initial=0,pull_up_down=PUD_OFF):
     """
@@ -105,9 +453,13 @@ def setup(channel, direction, initial=0,pull_up_down=PUD_OFF):
     [initial]      - Initial value for an output channel
 
     """
-    logger.info("Setup channel : {} as {} with initial :{} and pull_up_down {}".format(channel,direction,initial,pull_up_down))
-    global channel_config
-    channel_config[channel] = Channel(channel, direction, initial, pull_up_down)
+    if not logging_configured:
+        configure_logging()
+    if info_enabled:
+        logger.info("Setup channel : %s as %s with initial :%s and pull_up_down %s", channel, direction, initial, pull_up_down)
+    if trace is not None:
+        trace.record(TRACE_SETUP, channel, direction)
+    pins.configure(channel, direction, initial, pull_up_down)
 
 def output(channel, value):
     """
@@ -116,16 +468,104 @@ def output(channel, value):
     value   - 0/1 or False/True or LOW/HIGH
 
     """
-    logger.info("Output channel : {} with value : {}".format(channel, value))
+    if isinstance(channel, (list, tuple)):
+        output_many(channel, value if isinstance(value, (list, tuple)) else [value] * len(channel))
+        return
+    if not logging_configured:
+        configure_logging()
+    if info_enabled:
+        logger.info("Output channel : %s with value : %s", channel, value)
+    if trace is not None:
+        trace.record(TRACE_OUTPUT, channel, value)
+    pins.write(channel, value)
+
+def output_many(channels, values):
+    """
+    Output to many GPIO channels at once.
+    channels - sequence of channels
+    values   - sequence with the value of each channel
+    """
+    if not logging_configured:
+        configure_logging()
+    if info_enabled:
+        logger.info("Output channels : %s with values : %s", channels, values)
+    if trace is not None:
+        for channel, value in zip(channels, values):
+            trace.record(TRACE_OUTPUT, channel, value)
+    pins.write_many(channels, values)
 
 def input(channel):
     """
     Input from a GPIO channel.  Returns HIGH=1=True or LOW=0=False
     channel - either board pin number or BCM number depending on which mode is set.
     """
-    logger.info("Reading from channel {}".format(channel))
+    if not logging_configured:
+        configure_logging()
+    if info_enabled:
+        logger.info("Reading from channel %s", channel)
+    value = pins.read(channel)
+    if trace is not None:
+        trace.record(TRACE_INPUT, channel, value)
+    return value
+
+def input_many(channels):
+    """
+    Input from many GPIO channels at once.  Returns a list with the value of each channel.
+    channels - sequence of channels
+    """
+    if not logging_configured:
+        configure_logging()
+    if info_enabled:
+        logger.info("Reading from channels %s", channels)
+    values = pins.read_many(channels)
+    if trace is not None:
+        for channel, value in zip(channels, values):
+            trace.record(TRACE_INPUT, channel, value)
+    return values
+
+def output_value(channel):
+    """
+    Simulation only: returns the last value written to an output channel.
+    """
+    return pins.output_value(channel)
 
-def wait_for_edge(channel,edge,bouncetime,timeout):
+def set_input(channel, value):
+    """
+    Simulation only: changes the value read from an input channel.
+    If the logic level changes, the corresponding RISING or FALLING edge is generated:
+    callbacks registered with add_event_detect()/add_event_callback() are invoked (unless the edge falls
+    within the bouncetime of the previous one) and wait_for_edge() callers are woken up.
+    channel - either board pin number or BCM number depending on which mode is set.
+    value   - the new value of the channel
+    """
+    if not logging_configured:
+        configure_logging()
+    if info_enabled:
+        logger.info("Input channel : %s set to value : %s", channel, value)
+    if trace is not None:
+        trace.record(TRACE_SET_INPUT, channel, value)
+    previous = pins.read(channel)
+    pins.set_input(channel, value)
+    if bool(previous) == bool(value):
+        return
+    edge = RISING if value else FALLING
+    callbacks = []
+    with event_condition:
+        detect = event_config.get(channel)
+        if detect is not None and detect.matches(edge):
+            now = time.monotonic()
+            if detect.debounced(now):
+                logger.info("Edge on channel : %s ignored by bounce time", channel)
+            else:
+                detect.last_event_time = now
+                detect.detected = True
+                detect.event_count += 1
+                callbacks = list(detect.callbacks)
+        event_condition.notify_all()
+    for callback in callbacks:
+        callback(channel)
+
+def wait_for_edge(channel,edge,bouncetime=None,timeout=None):
     """
     Wait for an edge.  Returns the channel number or None on timeout.
     channel      - either board pin number or BCM number depending on which mode is set.
@@ -133,10 +573,24 @@ def wait_for_edge(channel,edge,bouncetime,timeout):
     [bouncetime] - time allowed between calls to allow for switchbounce
     [timeout]    - timeout in ms
     """
-    logger.info("Waiting for edge : {} on channel : {} with bounce time : {} and Timeout :{}".format(edge,channel,bouncetime,timeout))
-
-
-def add_event_detect(channel,edge,callback,bouncetime):
+    configure_logging()
+    logger.info("Waiting for edge : %s on channel : %s with bounce time : %s and Timeout :%s", edge, channel, bouncetime, timeout)
+    deadline = None if timeout is None else time.monotonic() + timeout / 1000
+    with event_condition:
+        level = bool(pins.read(channel))
+        while True:
+            current = bool(pins.read(channel))
+            if current != level:
+                if edge == BOTH or edge == (RISING if current else FALLING):
+                    return channel
+                level = current
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            event_condition.wait(remaining)
+
+
+def add_event_detect(channel,edge,callback=None,bouncetime=None):
     """
     Enable edge detection events for a particular GPIO channel.
     channel      - either board pin number or BCM number depending on which mode is set.
@@ -144,14 +598,28 @@ def add_event_detect(channel,edge,callback,bouncetime):
     [callback]   - A callback function for the event (optional)
     [bouncetime] - Switch bounce timeout in ms for callback
     """
-    logger.info("Event detect added for edge : {} on channel : {} with bounce time : {} and callback {}".format(edge,channel,bouncetime,callback))
+    configure_logging()
+    logger.info("Event detect added for edge : %s on channel : %s with bounce time : %s and callback %s", edge, channel, bouncetime, callback)
+    detect = EventDetect(edge, bouncetime)
+    if callback is not None:
+        detect.callbacks.append(callback)
+    with event_condition:
+        event_config[channel] = detect
 
 def event_detected(channel):
     """
     Returns True if an edge has occurred on a given GPIO.  You need to enable edge detection using add_event_detect() first.
     channel - either board pin number or BCM number depending on which mode is set.
     """
-    logger.info("Waiting for even detection on channel :{}".format(channel))
+    if not logging_configured:
+        configure_logging()
+    logger.info("Waiting for even detection on channel :%s", channel)
+    with event_condition:
+        detect = event_config.get(channel)
+        if detect is None or not detect.detected:
+            return False
+        detect.detected = False
+        return True
 
 def add_event_callback(channel,callback):
     """
@@ -159,21 +627,35 @@ def add_event_callback(channel,callback):
     channel      - either board pin number or BCM number depending on which mode is set.
     callback     - a callback function
     """
-    logger.info("Event callback : {} added for channel : {}".format(callback,channel))
+    if not logging_configured:
+        configure_logging()
+    logger.info("Event callback : %s added for channel : %s", callback, channel)
+    with event_condition:
+        if channel not in event_config:
+            raise RuntimeError("Add event detection using add_event_detect first before adding a callback")
+        event_config[channel].callbacks.append(callback)
 
 def remove_event_detect(channel):
     """
     Remove edge detection for a particular GPIO channel
     channel - either board pin number or BCM number depending on which mode is set.
     """
-    logger.info("Event detect removed for channel : {}".format(channel))
+    if not logging_configured:
+        configure_logging()
+    logger.info("Event detect removed for channel : %s", channel)
+    with event_condition:
+        event_config.pop(channel, None)
 
 def gpio_function(channel):
     """
     Return the current GPIO function (IN, OUT, PWM, SERIAL, I2C, SPI)
     channel - either board pin number or BCM number depending on which mode is set.
     """
-    logger.info("GPIO function of channel : {} is {}".format(channel,channel_config[channel].direction))
+    if not logging_configured:
+        configure_logging()
+    direction = pins.direction[channel] if channel < pins.size else UNKNOWN
+    logger.info("GPIO function of channel : %s is %s", channel, direction)
+    return direction
 
 
 class PWM:
@@ -185,9 +667,9 @@ class PWM:
         self.channel = channel
         self.frequency = frequency
         self.dutycycle = 0
-        global channel_config
-        channel_config[channel] = Channel(channel,PWM,)
-        logger.info("Initialized PWM for channel : {} at frequency : {}".format(channel,frequency))
+        pins.configure(channel, HARD_PWM)
+        configure_logging()
+        logger.info("Initialized PWM for channel : %s at frequency : %s", channel, frequency)
 
     # where dc is the duty cycle (0.0 <= dc <= 100.0)
     def start(self, dutycycle):
@@ -195,8 +677,10 @@ class PWM:
         Start software PWM
         dutycycle - the duty cycle (0.0 to 100.0)
         """
+        if not logging_configured:
+            configure_logging()
         self.dutycycle = dutycycle
-        logger.info("Start pwm on channel : {} with duty cycle : {}".format(self.channel,dutycycle))
+        logger.info("Start pwm on channel : %s with duty cycle : %s", self.channel, dutycycle)
 
     # where freq is the new frequency in Hz
     def ChangeFrequency(self, frequency):
@@ -204,7 +688,9 @@ class PWM:
         Change the frequency
         frequency - frequency in Hz (freq > 1.0)
         """
-        logger.info("Freqency changed for channel : {} from : {} -> to : {}".format(self.channel,self.frequency,frequency))
+        if not logging_configured:
+            configure_logging()
+        logger.info("Freqency changed for channel : %s from : %s -> to : %s", self.channel, self.frequency, frequency)
         self.frequency = frequency
 
     # where 0.0 <= dc <= 100.0
@@ -213,12 +699,19 @@ class PWM:
         Change the duty cycle
         dutycycle - between 0.0 and 100.0
         """
+        if not logging_configured:
+            configure_logging()
+        if info_enabled:
+            logger.info("Dutycycle changed for channel : %s from : %s -> to : %s", self.channel, self.dutycycle, dutycycle)
+        if trace is not None:
+            trace.record(TRACE_PWM, self.channel, dutycycle)
         self.dutycycle = dutycycle
-        logger.info("Dutycycle changed for channel : {} from : {} -> to : {}".format(self.channel,self.dutycycle,dutycycle))
 
     # stop PWM generation
     def stop(self):
-        logger.info("Stop PWM on channel : {} with duty cycle : {}".format(self.channel,self.dutycycle))
+        if not logging_configured:
+            configure_logging()
+        logger.info("Stop PWM on channel : %s with duty cycle : %s", self.channel, self.dutycycle)
 
 
 def cleanup(channel=None):
@@ -226,7 +719,18 @@ def cleanup(channel=None):
     Clean up by resetting all GPIO channels that have been used by this program to INPUT with no pullup/pulldown and no event detection
     [channel] - individual channel or list/tuple of channels to clean up.  Default - clean every channel that has been used.
     """
+    if not logging_configured:
+        configure_logging()
+    global setModeDone, _mode, cleanups
     if channel is not None:
-        logger.info("Cleaning up channel : {}".format(channel))
+        logger.info("Cleaning up channel : %s", channel)
+        channels = channel if isinstance(channel, (list, tuple)) else [channel]
     else:
         logger.info("Cleaning up all channels")
+        cleanups += 1
+        channels = pins.used_channels() + list(event_config)
+        setModeDone = False
+        _mode = None
+    for ch in channels:
+        pins.reset(ch)
+        remove_event_detect(ch)
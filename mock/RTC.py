@@ -1,33 +1,136 @@
-from datetime import datetime
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime
+
+from mock.Clock import SystemClock
+
+
+class Snapshot:
+    """
+    Date and time read once from the clock, with the fields used by the control rules precomputed.
+    """
+    __slots__ = ('now', 'date', 'hour', 'minute', 'weekday')
+
+    def __init__(self, now: datetime):
+        self.now = now
+        self.date = now.date()
+        self.hour = now.hour
+        self.minute = now.minute
+        self.weekday = now.weekday()
 
 
 class RTC:
+    DAYS = ('MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY')
+
+    # source of the date and time of every RTC, replaced by a VirtualClock in simulations
+    clock = SystemClock()
+    # While set, every getter answers from it instead of reading the clock. It is local to the current thread
+    # (and asyncio task), so that a tick never freezes or unfreezes the time seen by other threads.
+    snapshot = ContextVar('rtc_snapshot', default=None)
+
     def __init__(self, RTC_PIN):
         self.pin = RTC_PIN
 
+    @staticmethod
+    def set_clock(clock) -> None:
+        """
+        Replaces the source of the date and time (e.g., with a VirtualClock).
+        :param clock: an object with now() and sleep(seconds) methods.
+        """
+        RTC.clock = clock
+
+    @staticmethod
+    def take_snapshot() -> Snapshot:
+        """
+        Reads the clock once; until invalidate() is called, every getter of the current thread returns
+        the date and time of this read.
+        """
+        snapshot = Snapshot(RTC.clock.now())
+        RTC.snapshot.set(snapshot)
+        return snapshot
+
+    @staticmethod
+    def invalidate() -> None:
+        """
+        Drops the snapshot of the current thread: the getters read the clock again.
+        """
+        RTC.snapshot.set(None)
+
+    @staticmethod
+    @contextmanager
+    def frozen(snapshot: Snapshot = None):
+        """
+        Takes a snapshot for the duration of a control tick, so that all the offices and methods of the tick
+        see the same time. Nested uses share the snapshot of the outermost one.
+        :param snapshot: optional snapshot to use instead of reading the clock, e.g. the one of the thread
+        that hands the tick over to worker threads.
+        """
+        current = RTC.snapshot.get()
+        if current is not None and snapshot is None:
+            yield current
+            return
+        token = RTC.snapshot.set(snapshot if snapshot is not None else Snapshot(RTC.clock.now()))
+        try:
+            yield RTC.snapshot.get()
+        finally:
+            RTC.snapshot.reset(token)
+
+    @staticmethod
+    def read() -> Snapshot:
+        """
+        :return: the snapshot of the current thread, if any, otherwise a new reading of the clock.
+        """
+        snapshot = RTC.snapshot.get()
+        return snapshot if snapshot is not None else Snapshot(RTC.clock.now())
+
+    @staticmethod
+    def sleep(seconds: float) -> None:
+        """
+        Waits for the given number of seconds on the clock of the RTC.
+        """
+        RTC.clock.sleep(seconds)
+
     @staticmethod
     def get_current_time_string() -> str:
-        now = datetime.now()
+        now = RTC.read().now
         current_time = now.strftime("%H:%M:%S")
         return current_time
 
     @staticmethod
     def get_current_day() -> str:
-        days = {
-            1: 'MONDAY',
-            2: 'TUESDAY',
-            3: 'WEDNESDAY',
-            4: 'THURSDAY',
-            5: 'FRIDAY',
-            6: 'SATURDAY',
-            7: 'SUNDAY'
-        }
-        today = datetime.today().weekday()
-        return days.get(today + 1)
+        return RTC.DAYS[RTC.get_current_weekday()]
+
+    @staticmethod
+    def get_current_datetime() -> datetime:
+        snapshot = RTC.snapshot.get()
+        return snapshot.now if snapshot is not None else RTC.clock.now()
+
+    @staticmethod
+    def get_current_date() -> date:
+        snapshot = RTC.snapshot.get()
+        return snapshot.date if snapshot is not None else RTC.clock.now().date()
+
+    @staticmethod
+    def get_current_hour() -> int:
+        snapshot = RTC.snapshot.get()
+        return snapshot.hour if snapshot is not None else RTC.clock.now().hour
+
+    @staticmethod
+    def get_current_minute() -> int:
+        snapshot = RTC.snapshot.get()
+        return snapshot.minute if snapshot is not None else RTC.clock.now().minute
+
+    @staticmethod
+    def get_current_weekday() -> int:
+        """
+        :return: the current day of the week as a number, where MONDAY is 0 and SUNDAY is 6.
+        """
+        snapshot = RTC.snapshot.get()
+        return snapshot.weekday if snapshot is not None else RTC.clock.now().weekday()
 
 
 if __name__ == '__main__':
     time = RTC(1).get_current_time_string()
     hour = time[:time.find(':')]
     print(hour)
-    print(RTC(1).get_current_day())
\ No newline at end of file
+    print(RTC(1).get_current_day())
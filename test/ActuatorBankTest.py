@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import patch
+import mock.GPIO as GPIO
+from ActuatorBank import ActuatorBank
+from IntelligentOffice import IntelligentOffice
+
+
+class ActuatorBankTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.actuators = ActuatorBank()
+
+    def tearDown(self) -> None:
+        GPIO.cleanup()
+
+    @patch.object(GPIO, "output")
+    def test_first_write_is_issued(self, mock_output):
+        self.actuators.write(29, GPIO.LOW)
+        mock_output.assert_called_once_with(29, GPIO.LOW)
+
+    @patch.object(GPIO, "output")
+    def test_write_of_same_value_is_suppressed(self, mock_output):
+        for _ in range(5):
+            self.actuators.write(29, GPIO.HIGH)
+        mock_output.assert_called_once_with(29, GPIO.HIGH)
+        self.assertEqual((5, 1, 4), (self.actuators.writes_requested, self.actuators.writes_issued,
+                                     self.actuators.writes_suppressed))
+
+    @patch.object(GPIO, "output")
+    def test_write_of_new_value_is_issued(self, mock_output):
+        self.actuators.write(29, GPIO.HIGH)
+        self.actuators.write(29, GPIO.LOW)
+        self.assertEqual(2, mock_output.call_count)
+
+    @patch.object(GPIO, "output_many")
+    def test_batch_issues_changes_with_one_call(self, mock_output_many):
+        with self.actuators.batch():
+            self.actuators.write(29, GPIO.HIGH)
+            self.actuators.write(32, GPIO.HIGH)
+            mock_output_many.assert_not_called()
+        mock_output_many.assert_called_once_with([29, 32], [GPIO.HIGH, GPIO.HIGH])
+
+    @patch.object(GPIO, "output_many")
+    def test_batch_keeps_only_the_last_value_of_each_pin(self, mock_output_many):
+        with self.actuators.batch():
+            self.actuators.write(29, GPIO.HIGH)
+            self.actuators.write(29, GPIO.LOW)
+        mock_output_many.assert_called_once_with([29], [GPIO.LOW])
+
+    @patch.object(GPIO, "output_many")
+    def test_batch_without_changes_issues_nothing(self, mock_output_many):
+        self.actuators.write(29, GPIO.HIGH)
+        with self.actuators.batch():
+            self.actuators.write(29, GPIO.HIGH)
+        mock_output_many.assert_not_called()
+        self.assertEqual(1, self.actuators.writes_suppressed)
+
+    def test_invalidate(self):
+        self.actuators.write(29, GPIO.HIGH)
+        self.actuators.invalidate()
+        self.actuators.write(29, GPIO.HIGH)
+        self.assertEqual(2, self.actuators.writes_issued)
+
+    def test_cleanup_invalidates_the_committed_values(self):
+        GPIO.setup(29, GPIO.OUT)
+        self.actuators.write(29, GPIO.HIGH)
+        GPIO.cleanup()
+        GPIO.setup(29, GPIO.OUT)
+        self.actuators.write(29, GPIO.HIGH)
+        self.assertEqual(GPIO.HIGH, GPIO.output_value(29))
+
+
+class ActuatorBankOfficeTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        GPIO.cleanup()
+
+    @patch.object(GPIO, "input")
+    def test_light_is_switched_on_again_after_cleanup(self, mock_input):
+        office = IntelligentOffice()
+        mock_input.side_effect = [0, 450, 0, 450]  # occupied and dark
+        office.manage_light_level()
+        GPIO.cleanup()  # resets the LED pin to LOW
+        office.manage_light_level()
+        self.assertTrue(office.light_on)
+        self.assertEqual(GPIO.HIGH, GPIO.output_value(office.LED_PIN))
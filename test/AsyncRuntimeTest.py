@@ -0,0 +1,82 @@
+import asyncio
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+import mock.GPIO as GPIO
+from mock.Clock import SystemClock, VirtualClock
+from mock.RTC import RTC
+from AsyncRuntime import AsyncRuntime
+from IntelligentOffice import IntelligentOffice
+
+
+class AsyncRuntimeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.int_off = IntelligentOffice()
+        self.int_off.SERVO_MOVE_TIME = 0.2
+        GPIO.set_input(self.int_off.INFRARED_PIN, 0)
+        GPIO.set_input(self.int_off.PHOTO_PIN, 450)
+        GPIO.set_input(self.int_off.CO2_PIN, 800)
+        # Monday 8:00, the blinds have to be opened
+        RTC.set_clock(VirtualClock(datetime(2026, 10, 12, 8, 0)))
+        self.runtime = AsyncRuntime([self.int_off], light_period=0.01, air_period=0.05)
+
+    def tearDown(self) -> None:
+        RTC.set_clock(SystemClock())
+        GPIO.cleanup()
+
+    def test_light_and_air_quality_are_managed_while_blinds_are_moving(self):
+        async def scenario():
+            self.runtime.start()
+            await asyncio.sleep(0.1)
+            state = (self.int_off.blinds_open, self.int_off.light_on, self.int_off.fan_switch_on)
+            await asyncio.sleep(0.2)
+            await self.runtime.shutdown()
+            return state
+
+        self.assertEqual((False, True, True), asyncio.run(scenario()))
+        self.assertEqual(True, self.int_off.blinds_open)
+
+    def test_light_task_follows_the_sensors(self):
+        async def scenario():
+            self.runtime.start()
+            await asyncio.sleep(0.05)
+            GPIO.set_input(self.int_off.INFRARED_PIN, 1)
+            await asyncio.sleep(0.05)
+            await self.runtime.shutdown()
+
+        asyncio.run(scenario())
+        self.assertEqual(False, self.int_off.light_on)
+
+    @patch.object(GPIO, "cleanup")
+    def test_run_for_a_duration_then_shuts_down_cleanly(self, mock_cleanup):
+        with patch.object(self.int_off.pwm, "stop") as mock_stop:
+            asyncio.run(self.runtime.run(duration=0.05))
+        mock_stop.assert_called_once()
+        mock_cleanup.assert_called_once_with([11, 18, 22, 29, 31, 32])
+        self.assertEqual([], self.runtime.tasks)
+        self.assertEqual(True, self.int_off.blinds_polling)
+
+    def test_shutdown_cleans_up_the_channels_of_its_offices_only(self):
+        GPIO.setup(40, GPIO.OUT)
+        GPIO.output(40, GPIO.HIGH)  # not a channel of the offices of the runtime
+        asyncio.run(self.runtime.run(duration=0.05))
+        self.assertEqual(GPIO.HIGH, GPIO.output_value(40))
+        self.assertEqual(GPIO.LOW, GPIO.output_value(self.int_off.LED_PIN))
+        self.assertEqual(False, self.int_off.light_on)
+        # The light is switched on again, although it was on before the shutdown
+        GPIO.set_input(self.int_off.INFRARED_PIN, 0)
+        GPIO.set_input(self.int_off.PHOTO_PIN, 450)
+        self.int_off.manage_light_level()
+        self.assertEqual(GPIO.HIGH, GPIO.output_value(self.int_off.LED_PIN))
+
+    def test_stop(self):
+        async def scenario():
+            asyncio.get_running_loop().call_later(0.05, self.runtime.stop)
+            await self.runtime.run()
+
+        asyncio.run(scenario())
+        self.assertEqual([], self.runtime.tasks)
+
+    def test_periodic_tasks_record_their_lateness(self):
+        asyncio.run(self.runtime.run(duration=0.1))
+        self.assertLess(0, len(self.runtime.lateness))
@@ -0,0 +1,61 @@
+import random
+import unittest
+from unittest.mock import patch
+import mock.GPIO as GPIO
+from IntelligentOffice import IntelligentOffice
+
+try:
+    import numpy as np
+    from BatchRules import batch_light_level, batch_air_quality
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class BatchRulesTest(unittest.TestCase):
+    SAMPLES = 500
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.int_off = IntelligentOffice()
+
+    def setUp(self) -> None:
+        self.random = random.Random(1337)
+
+    def test_batch_light_level_hysteresis(self):
+        occupancy = np.array([0, 0, 0, 0, 1, 1])
+        lux = np.array([450, 600, 525, 525, 450, 525])
+        light_on = np.array([False, True, True, False, True, True])
+        result = batch_light_level(occupancy, lux, light_on)
+        self.assertEqual([True, False, True, False, False, False], result.tolist())
+
+    def test_batch_air_quality_hysteresis(self):
+        co2 = np.array([800, 400, 600, 600])
+        fan_switch_on = np.array([False, True, True, False])
+        result = batch_air_quality(co2, fan_switch_on)
+        self.assertEqual([True, False, True, False], result.tolist())
+
+    @patch.object(GPIO, "input")
+    def test_batch_light_level_agrees_with_manage_light_level(self, mock_input):
+        occupancy = [self.random.choice([0, 1, 100]) for _ in range(self.SAMPLES)]
+        lux = [self.random.randint(400, 650) for _ in range(self.SAMPLES)]
+        light_on = [self.random.choice([False, True]) for _ in range(self.SAMPLES)]
+        expected = []
+        for sample in zip(occupancy, lux, light_on):
+            self.int_off.light_on = sample[2]
+            mock_input.side_effect = [sample[0], sample[1]]
+            self.int_off.manage_light_level()
+            expected.append(self.int_off.light_on)
+        self.assertEqual(expected, batch_light_level(occupancy, lux, light_on).tolist())
+
+    @patch.object(GPIO, "input")
+    def test_batch_air_quality_agrees_with_monitor_air_quality(self, mock_input):
+        co2 = [self.random.randint(400, 900) for _ in range(self.SAMPLES)]
+        fan_switch_on = [self.random.choice([False, True]) for _ in range(self.SAMPLES)]
+        expected = []
+        for sample in zip(co2, fan_switch_on):
+            self.int_off.fan_switch_on = sample[1]
+            mock_input.return_value = sample[0]
+            self.int_off.monitor_air_quality()
+            expected.append(self.int_off.fan_switch_on)
+        self.assertEqual(expected, batch_air_quality(co2, fan_switch_on).tolist())
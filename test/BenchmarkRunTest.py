@@ -0,0 +1,12 @@
+import unittest
+from benchmark.run import compare
+
+
+class BenchmarkRunTest(unittest.TestCase):
+    def test_compare_reports_benchmarks_slower_than_threshold(self):
+        baseline = {"tick": 1.0, "gpio_input": 1.0}
+        results = {"tick": 1.3, "gpio_input": 1.1}
+        self.assertEqual([("tick", 1.0, 1.3)], compare(results, baseline, threshold=0.25))
+
+    def test_compare_ignores_benchmarks_without_baseline(self):
+        self.assertEqual([], compare({"tick": 5.0}, {}, threshold=0.25))
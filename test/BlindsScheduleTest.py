@@ -0,0 +1,131 @@
+import os
+import time as time_module
+import unittest
+from datetime import date, datetime, time, timedelta
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+from mock.RTC import RTC
+from BlindsSchedule import BlindsSchedule, BlindsScheduler
+from IntelligentOffice import IntelligentOffice
+from IntelligentOfficeError import IntelligentOfficeError
+
+
+class FakeClock:
+    def __init__(self, now: datetime):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += timedelta(seconds=seconds)
+
+
+class BlindsScheduleTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.schedule = BlindsSchedule()
+
+    def test_default_schedule_has_two_transitions_per_working_day(self):
+        self.assertEqual(10, len(self.schedule.transitions))
+        self.assertEqual((8 * 60, True), self.schedule.transitions[0])
+        self.assertEqual(sorted(self.schedule.transitions), self.schedule.transitions)
+
+    def test_action_on_working_day(self):
+        self.assertEqual(True, self.schedule.action(0, 8, 0))
+        self.assertEqual(False, self.schedule.action(0, 20, 0))
+
+    def test_open_time_after_close_time(self):
+        self.assertRaises(IntelligentOfficeError, BlindsSchedule, time(20, 0), time(8, 0))
+        self.assertRaises(IntelligentOfficeError, BlindsSchedule, time(8, 0), time(8, 0))
+
+    def test_action_on_non_working_day(self):
+        self.assertIsNone(self.schedule.action(6, 12, 0))
+
+    def test_action_at_on_holiday(self):
+        schedule = BlindsSchedule(holidays=[date(2026, 12, 25)])
+        self.assertIsNone(schedule.action_at(datetime(2026, 12, 25, 12, 0)))
+
+    def test_next_transition_on_the_same_day(self):
+        self.assertEqual((datetime(2026, 10, 12, 20, 0), False),
+                         self.schedule.next_transition(datetime(2026, 10, 12, 8, 0)))
+
+    def test_next_transition_after_the_weekend(self):
+        self.assertEqual((datetime(2026, 10, 19, 8, 0), True),
+                         self.schedule.next_transition(datetime(2026, 10, 16, 20, 30)))
+
+    def test_next_transition_skips_holidays(self):
+        schedule = BlindsSchedule(holidays=[date(2026, 12, 25)])
+        self.assertEqual((datetime(2026, 12, 28, 8, 0), True),
+                         schedule.next_transition(datetime(2026, 12, 24, 21, 0)))
+
+    def test_next_transition_with_custom_times(self):
+        schedule = BlindsSchedule(open_time=time(7, 30), close_time=time(18, 15), working_days=[5])
+        self.assertEqual((datetime(2026, 10, 17, 7, 30), True),
+                         schedule.next_transition(datetime(2026, 10, 12, 9, 0)))
+
+    def test_seconds_until_next_transition_across_dst_change(self):
+        rome = ZoneInfo("Europe/Rome")
+        # Clocks go forward by one hour on Sunday 29 March 2026
+        now = datetime(2026, 3, 27, 21, 0, tzinfo=rome)
+        when, _ = self.schedule.next_transition(now)
+        self.assertEqual(datetime(2026, 3, 30, 8, 0, tzinfo=rome), when)
+        self.assertEqual((59 - 1) * 3600, BlindsSchedule.seconds_until(now, when))
+
+    def test_seconds_until_with_naive_local_times_across_dst_change(self):
+        tz = os.environ.get("TZ")
+        os.environ["TZ"] = "Europe/Rome"
+        time_module.tzset()
+        try:
+            now = datetime(2026, 3, 27, 21, 0)
+            when, _ = self.schedule.next_transition(now)
+            self.assertEqual(datetime(2026, 3, 30, 8, 0), when)
+            self.assertEqual((59 - 1) * 3600, BlindsSchedule.seconds_until(now, when))
+        finally:
+            if tz is None:
+                del os.environ["TZ"]
+            else:
+                os.environ["TZ"] = tz
+            time_module.tzset()
+
+
+class BlindsSchedulerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.int_off = IntelligentOffice()
+
+    @patch.object(IntelligentOffice, "change_servo_angle")
+    def test_scheduler_checks_blinds_twice_per_working_day(self, mock_servo):
+        mock_servo.side_effect = lambda duty_cycle, on_done: on_done()
+        # Monday 00:00
+        clock = FakeClock(datetime(2026, 10, 12, 0, 0))
+        scheduler = BlindsScheduler(self.int_off, clock=clock, sleep=clock.sleep)
+        scheduler.run(transitions=10)
+        # Initial synchronization plus 10 transitions, from Monday 8:00 to Friday 20:00
+        self.assertEqual(11, scheduler.checks)
+        self.assertEqual(datetime(2026, 10, 16, 20, 0), clock.now)
+        self.assertEqual(10, mock_servo.call_count)
+
+    def test_scheduler_opens_the_blinds_at_8(self):
+        clock = FakeClock(datetime(2026, 10, 12, 7, 0))
+        scheduler = BlindsScheduler(self.int_off, clock=clock, sleep=clock.sleep)
+        with patch.object(IntelligentOffice, "change_servo_angle",
+                          side_effect=lambda duty_cycle, on_done: on_done()):
+            scheduler.run(transitions=1)
+        self.assertEqual([3600], clock.sleeps)
+        self.assertEqual(True, self.int_off.blinds_open)
+
+    def test_scheduler_does_not_move_blinds_on_holidays(self):
+        self.int_off.blinds_schedule = BlindsSchedule(holidays=[date(2026, 10, 13)])
+        # Monday 21:00, the next transition is on Wednesday
+        clock = FakeClock(datetime(2026, 10, 12, 21, 0))
+        scheduler = BlindsScheduler(self.int_off, clock=clock, sleep=clock.sleep)
+        scheduler.run(transitions=1)
+        self.assertEqual(datetime(2026, 10, 14, 8, 0), clock.now)
+
+    @patch.object(RTC, "get_current_datetime")
+    def test_manage_blinds_based_on_time_on_holiday(self, mock_datetime):
+        self.int_off.blinds_schedule = BlindsSchedule(holidays=[date(2026, 10, 13)])
+        mock_datetime.return_value = datetime(2026, 10, 13, 8, 0)  # TUESDAY
+        self.int_off.manage_blinds_based_on_time()
+        self.assertEqual(False, self.int_off.blinds_open)
@@ -0,0 +1,44 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+import mock.GPIO as GPIO
+from mock.RTC import RTC
+from BuildingController import BuildingController
+from IntelligentOffice import IntelligentOffice
+from IntelligentOfficeError import IntelligentOfficeError
+
+
+class BuildingControllerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.building = BuildingController(max_workers=2)
+
+    def tearDown(self) -> None:
+        self.building.close()
+        GPIO.cleanup()
+
+    def test_pin_map_of_first_office_uses_default_pins(self):
+        pins = BuildingController.pin_map(0)
+        self.assertEqual(IntelligentOffice.LED_PIN, pins["LED_PIN"])
+
+    def test_pin_map_of_other_offices_uses_their_own_board(self):
+        pins = BuildingController.pin_map(2)
+        self.assertEqual(IntelligentOffice.LED_PIN + 80, pins["LED_PIN"])
+
+    def test_office_with_unknown_pin_name(self):
+        self.assertRaises(IntelligentOfficeError, IntelligentOffice, pins={"DOOR_PIN": 3})
+
+    @patch.object(RTC, "get_current_datetime")
+    def test_tick_runs_every_office_with_its_own_pins(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 12, 22, 0)  # MONDAY
+        first = self.building.add_office()
+        second = self.building.add_office()
+        # First office: occupied, 450 lux, 800 ppm. Second office: vacant, 450 lux, 400 ppm.
+        readings = {
+            first.INFRARED_PIN: 0, first.PHOTO_PIN: 450, first.CO2_PIN: 800,
+            second.INFRARED_PIN: 1, second.PHOTO_PIN: 450, second.CO2_PIN: 400,
+        }
+        for pin, value in readings.items():
+            GPIO.set_input(pin, value)
+        self.building.tick()
+        self.assertEqual((True, True), (first.light_on, first.fan_switch_on))
+        self.assertEqual((False, False), (second.light_on, second.fan_switch_on))
@@ -0,0 +1,301 @@
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+import mock.GPIO as GPIO
+
+
+class GPIOTest(unittest.TestCase):
+    CHANNEL = 7
+
+    def setUp(self) -> None:
+        GPIO.setup(self.CHANNEL, GPIO.IN)
+        GPIO.set_input(self.CHANNEL, GPIO.LOW)
+
+    def tearDown(self) -> None:
+        GPIO.cleanup()
+
+    def test_input_returns_the_simulated_value(self):
+        GPIO.set_input(self.CHANNEL, 450)
+        self.assertEqual(450, GPIO.input(self.CHANNEL))
+
+    def test_callback_on_rising_edge(self):
+        callback = Mock()
+        GPIO.add_event_detect(self.CHANNEL, GPIO.RISING, callback=callback)
+        GPIO.set_input(self.CHANNEL, GPIO.HIGH)
+        GPIO.set_input(self.CHANNEL, GPIO.LOW)
+        callback.assert_called_once_with(self.CHANNEL)
+
+    def test_callbacks_on_both_edges(self):
+        callback = Mock()
+        GPIO.add_event_detect(self.CHANNEL, GPIO.BOTH)
+        GPIO.add_event_callback(self.CHANNEL, callback)
+        GPIO.set_input(self.CHANNEL, GPIO.HIGH)
+        GPIO.set_input(self.CHANNEL, GPIO.LOW)
+        self.assertEqual(2, callback.call_count)
+
+    def test_no_edge_if_the_logic_level_does_not_change(self):
+        callback = Mock()
+        GPIO.add_event_detect(self.CHANNEL, GPIO.BOTH, callback=callback)
+        GPIO.set_input(self.CHANNEL, 100)
+        GPIO.set_input(self.CHANNEL, 200)
+        callback.assert_called_once_with(self.CHANNEL)
+
+    @patch.object(time, "monotonic")
+    def test_edges_within_bouncetime_are_ignored(self, mock_monotonic):
+        callback = Mock()
+        GPIO.add_event_detect(self.CHANNEL, GPIO.BOTH, callback=callback, bouncetime=200)
+        mock_monotonic.side_effect = [10.0, 10.1, 10.3]
+        GPIO.set_input(self.CHANNEL, GPIO.HIGH)
+        GPIO.set_input(self.CHANNEL, GPIO.LOW)
+        GPIO.set_input(self.CHANNEL, GPIO.HIGH)
+        self.assertEqual(2, callback.call_count)
+
+    def test_event_detected(self):
+        GPIO.add_event_detect(self.CHANNEL, GPIO.FALLING)
+        GPIO.set_input(self.CHANNEL, GPIO.HIGH)
+        self.assertEqual(False, GPIO.event_detected(self.CHANNEL))
+        GPIO.set_input(self.CHANNEL, GPIO.LOW)
+        self.assertEqual(True, GPIO.event_detected(self.CHANNEL))
+        self.assertEqual(False, GPIO.event_detected(self.CHANNEL))
+
+    def test_removed_event_detect_does_not_call_back(self):
+        callback = Mock()
+        GPIO.add_event_detect(self.CHANNEL, GPIO.BOTH, callback=callback)
+        GPIO.remove_event_detect(self.CHANNEL)
+        GPIO.set_input(self.CHANNEL, GPIO.HIGH)
+        callback.assert_not_called()
+
+    def test_add_event_callback_without_event_detect(self):
+        self.assertRaises(RuntimeError, GPIO.add_event_callback, self.CHANNEL, Mock())
+
+    def test_wait_for_edge(self):
+        timer = threading.Timer(0.05, GPIO.set_input, args=(self.CHANNEL, GPIO.HIGH))
+        timer.start()
+        self.assertEqual(self.CHANNEL, GPIO.wait_for_edge(self.CHANNEL, GPIO.RISING, timeout=5000))
+        timer.join()
+
+    def test_wait_for_edge_timeout(self):
+        self.assertIsNone(GPIO.wait_for_edge(self.CHANNEL, GPIO.RISING, timeout=10))
+
+
+class GPIOTraceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.trace = GPIO.enable_trace(capacity=3)
+
+    def tearDown(self) -> None:
+        GPIO.disable_trace()
+        GPIO.cleanup()
+
+    def test_trace_records_pin_operations(self):
+        GPIO.output(29, GPIO.HIGH)
+        GPIO.set_input(22, 450)
+        GPIO.input(22)
+        records = [record[1:] for record in self.trace.records()]
+        self.assertEqual([(29, "OUTPUT", 1.0), (22, "SET_INPUT", 450.0), (22, "INPUT", 450.0)], records)
+
+    def test_trace_keeps_only_the_last_operations(self):
+        for value in range(5):
+            GPIO.output(29, value)
+        self.assertEqual([2.0, 3.0, 4.0], [record[3] for record in self.trace.records()])
+
+    def test_trace_dump(self):
+        for value in range(5):
+            GPIO.output(29, value)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.bin")
+            self.trace.dump(path)
+            with open(path, "rb") as file:
+                values = [record[3] for record in GPIO.PinTrace.RECORD.iter_unpack(file.read())]
+        self.assertEqual([2.0, 3.0, 4.0], values)
+
+
+class GPIOLoggingTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        GPIO.set_log_level(logging.ERROR)
+
+    @patch.object(GPIO.logger, "info")
+    def test_output_does_not_log_when_info_is_disabled(self, mock_info):
+        GPIO.set_log_level(logging.ERROR)
+        GPIO.output(29, GPIO.HIGH)
+        mock_info.assert_not_called()
+
+    @patch.object(GPIO.logger, "info")
+    def test_output_logs_when_info_is_enabled(self, mock_info):
+        GPIO.set_log_level(logging.INFO)
+        GPIO.output(29, GPIO.HIGH)
+        mock_info.assert_called_once_with("Output channel : %s with value : %s", 29, GPIO.HIGH)
+
+    def test_configure_logging_adds_one_handler(self):
+        GPIO.configure_logging()
+        GPIO.logging_configured = False
+        GPIO.configure_logging()
+        self.assertEqual(1, sum(getattr(handler, "mock_gpio", False) for handler in GPIO.logger.handlers))
+
+    @patch.dict(os.environ, {"LOG_LEVEL": "Info"})
+    def test_log_level_is_applied_on_first_use(self):
+        script = ("import mock.GPIO as GPIO; print(len(GPIO.logger.handlers), GPIO.info_enabled); "
+                  "GPIO.setup(7, GPIO.IN); print(len(GPIO.logger.handlers), GPIO.info_enabled)")
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(["0 False", "1 True"], result.stdout.split("\n")[:2])
+
+    @patch.dict(os.environ, {"LOG_LEVEL": "Info"})
+    def test_log_level_is_applied_without_setup(self):
+        script = ("import mock.GPIO as GPIO; GPIO.set_input(7, 1); GPIO.input(7); GPIO.output(8, GPIO.HIGH); "
+                  "print(len(GPIO.logger.handlers), GPIO.info_enabled)")
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual("1 True", result.stdout.strip())
+        self.assertIn("Reading from channel 7", result.stderr)
+
+    @patch.dict(os.environ, {"LOG_LEVEL": "Info"})
+    def test_log_level_is_applied_by_every_logging_function(self):
+        # What a call needs is set up first, then the logging is unconfigured, as the setup configures it
+        unconfigure = "; GPIO.logger.handlers.clear(); GPIO.logging_configured = GPIO.info_enabled = False; "
+        event = "GPIO.add_event_detect(8, GPIO.BOTH)" + unconfigure
+        pwm = "pwm = GPIO.PWM(7, 50)" + unconfigure + "pwm."
+        for call in ("GPIO.cleanup()", "GPIO.event_detected(7)", "GPIO.remove_event_detect(7)", "GPIO.gpio_function(7)",
+                     event + "GPIO.add_event_callback(8, print)", pwm + "start(0)", pwm + "stop()",
+                     pwm + "ChangeFrequency(60)", pwm + "ChangeDutyCycle(5)"):
+            script = "import mock.GPIO as GPIO; {}; print(len(GPIO.logger.handlers), GPIO.info_enabled)".format(call)
+            result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                                    cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            self.assertEqual("1 True", result.stdout.strip(), call)
+
+
+class ImportTest(unittest.TestCase):
+    def test_import_of_intelligent_office_is_lazy(self):
+        script = ("import sys, IntelligentOffice; "
+                  "print(sorted({'asyncio', 'concurrent.futures', 'json'} & set(sys.modules)))")
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual("[]", result.stdout.strip())
+
+
+class GPIOTimingTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        GPIO.set_timing(GPIO.TIMING_REALTIME)
+        GPIO.cleanup()
+
+    @patch.object(time, "sleep")
+    def test_realtime_sleep(self, mock_sleep):
+        GPIO.sleep(1)
+        mock_sleep.assert_called_once_with(1)
+
+    @patch.object(time, "sleep")
+    def test_scaled_sleep(self, mock_sleep):
+        GPIO.set_timing(GPIO.TIMING_SCALED, 0.01)
+        GPIO.sleep(1)
+        mock_sleep.assert_called_once_with(0.01)
+
+    @patch.object(time, "sleep")
+    def test_instant_sleep(self, mock_sleep):
+        GPIO.set_timing(GPIO.TIMING_INSTANT)
+        GPIO.sleep(1)
+        mock_sleep.assert_not_called()
+
+    def test_invalid_timing_mode(self):
+        self.assertRaises(ValueError, GPIO.set_timing, 42)
+
+    def test_setmode_is_remembered_until_cleanup(self):
+        GPIO.set_timing(GPIO.TIMING_INSTANT)
+        GPIO.setmode(GPIO.BOARD)
+        self.assertEqual(GPIO.BOARD, GPIO.getmode())
+        GPIO.cleanup()
+        self.assertIsNone(GPIO.getmode())
+
+
+class PinStateTableTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pins = GPIO.PinStateTable(size=8)
+
+    def test_unset_input_reads_none(self):
+        self.assertIsNone(self.pins.read(3))
+        self.assertIsNone(self.pins.read(100))
+
+    def test_configure_channel(self):
+        self.pins.configure(3, GPIO.OUT, GPIO.HIGH, GPIO.PUD_UP)
+        channel = self.pins.channel(3)
+        self.assertEqual((GPIO.OUT, GPIO.HIGH, GPIO.PUD_UP),
+                         (channel.direction, channel.initial, channel.pull_up_down))
+
+    def test_channel_not_set_up(self):
+        self.assertIsNone(self.pins.channel(3))
+
+    def test_table_grows_for_high_channels(self):
+        self.pins.set_input(1000, 525)
+        self.assertEqual(525, self.pins.read(1000))
+        self.assertLessEqual(1001, self.pins.size)
+
+    def test_read_and_write_many(self):
+        self.pins.write_many([1, 2, 3], [GPIO.HIGH, GPIO.LOW, GPIO.HIGH])
+        self.pins.set_input(5, 450)
+        self.assertEqual([GPIO.HIGH, GPIO.LOW, GPIO.HIGH], [self.pins.output_value(pin) for pin in (1, 2, 3)])
+        self.assertEqual([450, None], self.pins.read_many([5, 6]))
+
+    def test_values_are_kept_as_they_are(self):
+        self.pins.set_input(5, 450.5)
+        self.pins.write(2, 0.5)
+        self.assertEqual((450.5, 0.5), (self.pins.read(5), self.pins.output_value(2)))
+
+    def test_negative_channels_are_rejected(self):
+        for operation in (lambda: self.pins.read(-1), lambda: self.pins.set_input(-1, 1),
+                          lambda: self.pins.write(-1, 1), lambda: self.pins.write_many([2, -1], [1, 1]),
+                          lambda: self.pins.output_value(-1)):
+            self.assertRaises(ValueError, operation)
+
+    def test_write_many_without_channels(self):
+        self.pins.write_many([], [])
+        self.assertEqual(8, self.pins.size)
+
+    def test_reset(self):
+        self.pins.configure(3, GPIO.OUT, GPIO.HIGH)
+        self.pins.set_input(3, 1)
+        self.pins.reset(3)
+        self.assertEqual((None, None), (self.pins.channel(3), self.pins.read(3)))
+
+
+class GPIOPinStateTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        GPIO.cleanup()
+
+    def test_output_is_recorded(self):
+        GPIO.output(29, GPIO.HIGH)
+        self.assertEqual(GPIO.HIGH, GPIO.output_value(29))
+
+    def test_output_to_list_of_channels(self):
+        GPIO.output([29, 32], GPIO.HIGH)
+        self.assertEqual([GPIO.HIGH, GPIO.HIGH], [GPIO.output_value(29), GPIO.output_value(32)])
+
+    def test_input_many(self):
+        GPIO.set_input(11, 0)
+        GPIO.set_input(22, 450)
+        self.assertEqual([0, 450, None], GPIO.input_many([11, 22, 31]))
+
+    def test_float_values(self):
+        GPIO.set_input(22, 450.5)
+        GPIO.output(29, 0.5)
+        self.assertEqual((450.5, 0.5), (GPIO.input(22), GPIO.output_value(29)))
+
+    def test_negative_channel(self):
+        self.assertRaises(ValueError, GPIO.input, -1)
+
+    def test_output_to_empty_list_of_channels(self):
+        GPIO.output([], GPIO.HIGH)
+        self.assertEqual([], GPIO.pins.used_channels())
+
+    def test_channel_config_view(self):
+        GPIO.setup(11, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+        self.assertEqual([11], list(GPIO.channel_config))
+        self.assertEqual(GPIO.PUD_UP, GPIO.channel_config[11].pull_up_down)
+        self.assertNotIn(12, GPIO.channel_config)
+
+    def test_gpio_function(self):
+        GPIO.setup(11, GPIO.IN)
+        self.assertEqual(GPIO.IN, GPIO.gpio_function(11))
@@ -1,9 +1,10 @@
 import unittest
-from unittest.mock import patch
+from datetime import date, datetime
+from unittest.mock import Mock, patch
 import mock.GPIO as GPIO
 from mock.RTC import RTC
+from BlindsSchedule import BlindsSchedule
 from IntelligentOffice import IntelligentOffice
-from IntelligentOfficeError import IntelligentOfficeError
 
 
 class IntelligentOfficeTest(unittest.TestCase):
@@ -24,84 +25,67 @@ class IntelligentOfficeTest(unittest.TestCase):
         is_occupied = self.int_off.check_occupancy()
         self.assertEqual(True, is_occupied)
 
-    @patch.object(RTC, "get_current_day")
-    @patch.object(RTC, "get_current_time_string")
-    def test_manage_blinds_based_on_time_on_working_day_at_8(self, mock_time, mock_day):
-        mock_time.return_value = "08:00:00"
-        mock_day.return_value = "MONDAY"
+    @patch.object(RTC, "get_current_datetime")
+    def test_manage_blinds_based_on_time_on_working_day_at_8(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 12, 8, 0)  # MONDAY
         self.int_off.manage_blinds_based_on_time()
         self.assertEqual(True, self.int_off.blinds_open)
 
-    @patch.object(RTC, "get_current_day")
-    @patch.object(RTC, "get_current_time_string")
-    def test_manage_blinds_based_on_time_on_working_day_at_20(self, mock_time, mock_day):
-        mock_time.return_value = "20:00:00"
-        mock_day.return_value = "WEDNESDAY"
+    @patch.object(RTC, "get_current_datetime")
+    def test_manage_blinds_based_on_time_on_working_day_at_20(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 14, 20, 0)  # WEDNESDAY
         self.int_off.manage_blinds_based_on_time()
         self.assertEqual(False, self.int_off.blinds_open)
 
-    @patch.object(RTC, "get_current_day")
-    @patch.object(RTC, "get_current_time_string")
-    def test_manage_blinds_based_on_time_on_working_day_at_18(self, mock_time, mock_day):
-        mock_time.return_value = "18:00:00"
-        mock_day.return_value = "FRIDAY"
+    @patch.object(RTC, "get_current_datetime")
+    def test_manage_blinds_based_on_time_on_working_day_at_18(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 16, 18, 0)  # FRIDAY
         self.int_off.manage_blinds_based_on_time()
         self.assertEqual(True, self.int_off.blinds_open)
 
-    @patch.object(RTC, "get_current_day")
-    @patch.object(RTC, "get_current_time_string")
-    def test_manage_blinds_based_on_time_on_working_day_at_00(self, mock_time, mock_day):
-        mock_time.return_value = "00:00:00"
-        mock_day.return_value = "TUESDAY"
+    @patch.object(RTC, "get_current_datetime")
+    def test_manage_blinds_based_on_time_on_working_day_at_00(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 13, 0, 0)  # TUESDAY
         self.int_off.manage_blinds_based_on_time()
         self.assertEqual(False, self.int_off.blinds_open)
 
-    @patch.object(RTC, "get_current_day")
-    @patch.object(RTC, "get_current_time_string")
-    def test_manage_blinds_based_on_time_on_working_day_at_07_59_59(self, mock_time, mock_day):
-        mock_time.return_value = "07:59:59"
-        mock_day.return_value = "THURSDAY"
+    @patch.object(RTC, "get_current_datetime")
+    def test_manage_blinds_based_on_time_on_working_day_at_07_59_59(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 15, 7, 59, 59)  # THURSDAY
         self.int_off.manage_blinds_based_on_time()
         self.assertEqual(False, self.int_off.blinds_open)
 
-    @patch.object(RTC, "get_current_day")
-    @patch.object(RTC, "get_current_time_string")
-    def test_manage_blinds_based_on_time_on_working_day_at_19_59_59(self, mock_time, mock_day):
-        mock_time.return_value = "19:59:59"
-        mock_day.return_value = "MONDAY"
+    @patch.object(RTC, "get_current_datetime")
+    def test_manage_blinds_based_on_time_on_working_day_at_19_59_59(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 12, 19, 59, 59)  # MONDAY
         self.int_off.manage_blinds_based_on_time()
         self.assertEqual(True, self.int_off.blinds_open)
 
-    @patch.object(RTC, "get_current_day")
-    @patch.object(RTC, "get_current_time_string")
-    def test_manage_blinds_based_on_time_on_non_working_day_at_8(self, mock_time, mock_day):
-        mock_time.return_value = "08:00:00"
-        mock_day.return_value = "SUNDAY"
+    @patch.object(RTC, "get_current_datetime")
+    def test_manage_blinds_based_on_time_on_non_working_day_at_8(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 18, 8, 0)  # SUNDAY
         self.int_off.manage_blinds_based_on_time()
         self.assertEqual(False, self.int_off.blinds_open)
 
-    @patch.object(RTC, "get_current_day")
-    @patch.object(RTC, "get_current_time_string")
-    def test_manage_blinds_based_on_time_on_non_working_day_at_20(self, mock_time, mock_day):
-        mock_time.return_value = "20:00:00"
-        mock_day.return_value = "SATURDAY"
+    @patch.object(RTC, "get_current_datetime")
+    def test_manage_blinds_based_on_time_on_non_working_day_at_20(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 17, 20, 0)  # SATURDAY
         self.int_off.manage_blinds_based_on_time()
         self.assertEqual(False, self.int_off.blinds_open)
 
-    @patch.object(RTC, "get_current_day")
-    @patch.object(RTC, "get_current_time_string")
-    def test_manage_blinds_based_on_time_on_non_working_day_at_00(self, mock_time, mock_day):
-        mock_time.return_value = "00:00:00"
-        mock_day.return_value = "SATURDAY"
+    @patch.object(RTC, "get_current_datetime")
+    def test_manage_blinds_based_on_time_on_non_working_day_at_00(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 17, 0, 0)  # SATURDAY
         self.int_off.manage_blinds_based_on_time()
         self.assertEqual(False, self.int_off.blinds_open)
 
-    @patch.object(RTC, "get_current_day")
-    @patch.object(RTC, "get_current_time_string")
-    def test_manage_blinds_based_on_time_with_wrong_day(self, mock_time, mock_day):
-        mock_time.return_value = "8:00:00"
-        mock_day.return_value = "June"
-        self.assertRaises(IntelligentOfficeError, self.int_off.manage_blinds_based_on_time)
+    def test_blinds_action_reads_the_rtc_once(self):
+        self.int_off.blinds_schedule = BlindsSchedule(holidays=[date(2026, 12, 25)])
+        clock = Mock()
+        clock.now.return_value = datetime(2026, 10, 13, 8, 0)  # TUESDAY
+        with patch.object(RTC, "clock", clock):
+            self.assertTrue(self.int_off.blinds_action())
+        clock.now.assert_called_once_with()
 
     @patch.object(GPIO, "input")
     def test_manage_light_level_with_450_lux_and_office_worker(self, mock_input):
@@ -187,4 +171,155 @@ class IntelligentOfficeTest(unittest.TestCase):
         mock_input.side_effect = [800, 600]
         self.int_off.monitor_air_quality()
         self.int_off.monitor_air_quality()
-        self.assertEqual(True, self.int_off.fan_switch_on)
\ No newline at end of file
+        self.assertEqual(True, self.int_off.fan_switch_on)
+
+
+class IntelligentOfficeAsyncServoTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.int_off = IntelligentOffice(async_servo=True)
+        self.int_off.SERVO_MOVE_TIME = 0.2
+
+    @patch.object(RTC, "get_current_datetime")
+    def test_manage_blinds_based_on_time_returns_before_the_move_is_completed(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 12, 8, 0)  # MONDAY
+        move = self.int_off.manage_blinds_based_on_time()
+        self.assertEqual(False, self.int_off.blinds_open)
+        move.result(timeout=5)
+        self.assertEqual(True, self.int_off.blinds_open)
+
+    @patch.object(RTC, "get_current_datetime")
+    def test_manage_blinds_based_on_time_while_a_move_is_in_progress(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 12, 8, 0)  # MONDAY
+        first_move = self.int_off.manage_blinds_based_on_time()
+        second_move = self.int_off.manage_blinds_based_on_time()
+        self.assertIs(first_move, second_move)
+        first_move.result(timeout=5)
+        self.assertEqual(True, self.int_off.blinds_open)
+
+    def test_close_while_opening_is_queued(self):
+        opening = self.int_off.open_blinds()
+        closing = self.int_off.close_blinds()
+        self.assertIsNot(opening, closing)
+        opening.result(timeout=5)
+        self.assertEqual(True, self.int_off.blinds_open)
+        closing.result(timeout=5)
+        self.assertEqual(False, self.int_off.blinds_open)
+
+    def test_last_queued_position_wins(self):
+        opening = self.int_off.open_blinds()
+        closing = self.int_off.close_blinds()
+        self.assertIs(closing, self.int_off.open_blinds())
+        with patch.object(self.int_off, "change_servo_angle") as mock_change_servo_angle:
+            opening.result(timeout=5)
+            closing.result(timeout=5)
+        mock_change_servo_angle.assert_not_called()
+        self.assertEqual(True, self.int_off.blinds_open)
+
+    @patch.object(GPIO, "input")
+    @patch.object(RTC, "get_current_datetime")
+    def test_light_and_air_quality_are_managed_while_blinds_are_moving(self, mock_datetime, mock_input):
+        mock_datetime.return_value = datetime(2026, 10, 12, 8, 0)  # MONDAY
+        # 0 -> someone is in the office, 450 -> the light level is too low, 800 -> too much CO2
+        mock_input.side_effect = [0, 450, 800]
+        move = self.int_off.manage_blinds_based_on_time()
+        self.int_off.manage_light_level()
+        self.int_off.monitor_air_quality()
+        self.assertEqual(False, move.done())
+        self.assertEqual(True, self.int_off.light_on)
+        self.assertEqual(True, self.int_off.fan_switch_on)
+        move.result(timeout=5)
+        self.assertEqual(True, self.int_off.blinds_open)
+
+
+class IntelligentOfficeEventDrivenOccupancyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        GPIO.set_input(IntelligentOffice.INFRARED_PIN, 1)
+        # No debouncing, the edges of these tests are closer than the bounce time
+        with patch.object(IntelligentOffice, "OCCUPANCY_BOUNCETIME", None):
+            self.int_off = IntelligentOffice(event_driven_occupancy=True)
+
+    def tearDown(self) -> None:
+        GPIO.cleanup()
+
+    def test_check_occupancy_follows_the_sensor_edges(self):
+        GPIO.set_input(self.int_off.INFRARED_PIN, 0)
+        self.assertEqual(True, self.int_off.check_occupancy())
+        GPIO.set_input(self.int_off.INFRARED_PIN, 1)
+        self.assertEqual(False, self.int_off.check_occupancy())
+
+    @patch.object(GPIO, "input", wraps=GPIO.input)
+    def test_check_occupancy_does_not_read_the_sensor(self, mock_input):
+        GPIO.set_input(self.int_off.INFRARED_PIN, 0)
+        for _ in range(10):
+            self.int_off.check_occupancy()
+        # Only the edge callback reads the sensor
+        self.assertEqual(1, mock_input.call_count)
+
+    def test_manage_light_level_with_450_lux_and_office_worker(self):
+        GPIO.set_input(self.int_off.INFRARED_PIN, 0)
+        GPIO.set_input(self.int_off.PHOTO_PIN, 450)
+        self.int_off.manage_light_level()
+        self.assertEqual(True, self.int_off.light_on)
+
+    def test_manage_light_level_when_office_worker_leaves(self):
+        GPIO.set_input(self.int_off.INFRARED_PIN, 0)
+        GPIO.set_input(self.int_off.PHOTO_PIN, 450)
+        self.int_off.manage_light_level()
+        GPIO.set_input(self.int_off.INFRARED_PIN, 1)
+        self.int_off.manage_light_level()
+        self.assertEqual(False, self.int_off.light_on)
+
+
+class IntelligentOfficeConstructionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        GPIO.set_timing(GPIO.TIMING_INSTANT)
+        GPIO.cleanup()
+
+    def tearDown(self) -> None:
+        GPIO.set_timing(GPIO.TIMING_REALTIME)
+
+    @patch.object(GPIO, "setmode", wraps=GPIO.setmode)
+    def test_offices_share_the_gpio_initialisation(self, mock_setmode):
+        for _ in range(3):
+            IntelligentOffice()
+        mock_setmode.assert_called_once_with(GPIO.BOARD)
+
+
+class IntelligentOfficeTickTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.int_off = IntelligentOffice()
+
+    def tearDown(self) -> None:
+        GPIO.cleanup()
+
+    def test_read_sensors(self):
+        GPIO.set_input(self.int_off.INFRARED_PIN, 0)
+        GPIO.set_input(self.int_off.PHOTO_PIN, 450)
+        GPIO.set_input(self.int_off.CO2_PIN, 800)
+        self.assertEqual((True, 450, 800), self.int_off.read_sensors())
+
+    @patch.object(GPIO, "input_many")
+    def test_read_sensors_with_a_single_gpio_call(self, mock_input_many):
+        mock_input_many.return_value = [100, 600, 400]
+        self.assertEqual((False, 600, 400), self.int_off.read_sensors())
+        mock_input_many.assert_called_once()
+
+    @patch.object(RTC, "get_current_datetime")
+    def test_tick(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 12, 22, 0)  # MONDAY
+        GPIO.set_input(self.int_off.INFRARED_PIN, 0)
+        GPIO.set_input(self.int_off.PHOTO_PIN, 450)
+        GPIO.set_input(self.int_off.CO2_PIN, 800)
+        self.int_off.tick()
+        self.assertEqual((True, True), (self.int_off.light_on, self.int_off.fan_switch_on))
+        self.assertEqual(GPIO.HIGH, GPIO.output_value(self.int_off.LED_PIN))
+
+    @patch.object(GPIO, "output_many")
+    @patch.object(RTC, "get_current_datetime")
+    def test_tick_in_vacant_office_writes_nothing(self, mock_datetime, mock_output_many):
+        mock_datetime.return_value = datetime(2026, 10, 12, 22, 0)  # MONDAY
+        GPIO.set_input(self.int_off.INFRARED_PIN, 1)
+        GPIO.set_input(self.int_off.CO2_PIN, 600)
+        for _ in range(10):
+            self.int_off.tick()
+        mock_output_many.assert_not_called()
@@ -0,0 +1,92 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import mock.GPIO as GPIO
+from mock.RTC import RTC
+from IntelligentOffice import IntelligentOffice
+from Lighting import LightingStateMachine
+from OfficeSimulator import OfficeSimulator, synthetic_trace
+
+MONDAY = datetime(2026, 10, 12)
+
+
+def at(minute: float) -> datetime:
+    return MONDAY + timedelta(minutes=minute)
+
+
+class LightingStateMachineTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.lighting = LightingStateMachine(vacancy_timeout=timedelta(minutes=10), min_on=timedelta(minutes=5),
+                                             min_off=timedelta(minutes=1))
+
+    def test_turns_on_when_occupied_and_dark(self):
+        self.assertTrue(self.lighting.decide(at(0), True, True, False))
+        self.assertEqual(LightingStateMachine.ON, self.lighting.state)
+
+    def test_holds_during_vacancy_grace_period(self):
+        self.lighting.decide(at(0), True, True, False)
+        self.assertTrue(self.lighting.decide(at(6), False, False, True))
+        self.assertEqual(LightingStateMachine.HOLD, self.lighting.state)
+        self.assertTrue(self.lighting.decide(at(15), False, False, True))
+        self.assertFalse(self.lighting.decide(at(16), False, False, True))
+        self.assertEqual(LightingStateMachine.OFF, self.lighting.state)
+
+    def test_occupancy_during_hold_cancels_it(self):
+        self.lighting.decide(at(0), True, True, False)
+        self.lighting.decide(at(6), False, False, True)
+        self.assertTrue(self.lighting.decide(at(12), True, True, True))
+        # The vacancy timer restarts from the new vacancy
+        self.assertTrue(self.lighting.decide(at(20), False, False, True))
+
+    def test_minimum_on_time(self):
+        self.lighting.decide(at(0), True, True, False)
+        self.assertTrue(self.lighting.decide(at(2), True, False, True))  # bright, but on for 2 minutes only
+        self.assertFalse(self.lighting.decide(at(5), True, False, True))
+
+    def test_minimum_off_time(self):
+        self.lighting.decide(at(0), True, True, False)
+        self.lighting.decide(at(5), True, False, True)
+        self.assertFalse(self.lighting.decide(at(5.5), True, True, False))
+        self.assertTrue(self.lighting.decide(at(6), True, True, False))
+
+    def test_hold_ends_when_occupied_again(self):
+        self.lighting.decide(at(0), True, True, False)
+        self.lighting.decide(at(6), False, False, True)
+        self.assertEqual(LightingStateMachine.HOLD, self.lighting.state)
+        self.assertTrue(self.lighting.decide(at(7), True, True, True))
+        self.assertEqual(LightingStateMachine.ON, self.lighting.state)
+
+    def test_state_follows_a_light_switched_elsewhere(self):
+        self.assertTrue(self.lighting.decide(at(0), False, False, True))  # e.g., restored from a snapshot
+        self.assertEqual(LightingStateMachine.HOLD, self.lighting.state)
+        self.assertFalse(self.lighting.decide(at(10), False, False, True))
+        self.assertEqual(LightingStateMachine.OFF, self.lighting.state)
+
+
+class LightingOfficeTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        GPIO.cleanup()
+
+    @patch.object(RTC, "get_current_datetime")
+    @patch.object(GPIO, "input")
+    def test_manage_light_level_holds_the_light(self, mock_input, mock_datetime):
+        office = IntelligentOffice(lighting=LightingStateMachine())
+        mock_datetime.return_value = MONDAY
+        mock_input.side_effect = [0, 450]  # occupied, dark
+        office.manage_light_level()
+        self.assertTrue(office.light_on)
+        mock_datetime.return_value = at(1)
+        mock_input.side_effect = [1]  # looks vacant
+        office.manage_light_level()
+        self.assertTrue(office.light_on)
+
+    def test_fewer_switches_on_a_simulated_week(self):
+        trace = synthetic_trace(MONDAY)
+        switches = []
+        for lighting in (None, LightingStateMachine()):
+            GPIO.cleanup()
+            simulator = OfficeSimulator(MONDAY, IntelligentOffice(lighting=lighting))
+            simulator.load_trace(trace)
+            switches.append(simulator.run(until=MONDAY + timedelta(days=7)).switches["light_on"])
+        self.assertLess(switches[1], switches[0] / 2)
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+import urllib.request
+from datetime import datetime
+from unittest.mock import patch
+import mock.GPIO as GPIO
+from mock.RTC import RTC
+from IntelligentOffice import IntelligentOffice
+from Metrics import Counter, Histogram, MetricsRegistry, OfficeInstrumentation, instrument_gpio, uninstrument_gpio
+
+
+class FakeMonotonic:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class MetricsTest(unittest.TestCase):
+    def test_counter_render(self):
+        counter = Counter("events_total", "Events.")
+        counter.inc(operation="read")
+        counter.inc(2, operation="read")
+        self.assertEqual(["# HELP events_total Events.", "# TYPE events_total counter",
+                          'events_total{operation="read"} 3'], counter.render())
+
+    def test_histogram_render(self):
+        histogram = Histogram("duration_seconds", "Durations.", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(2)
+        self.assertEqual(['duration_seconds_bucket{le="0.1"} 1', 'duration_seconds_bucket{le="1.0"} 2',
+                          'duration_seconds_bucket{le="+Inf"} 3', 'duration_seconds_sum 2.55',
+                          'duration_seconds_count 3'], histogram.render()[2:])
+
+
+class OfficeInstrumentationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.int_off = IntelligentOffice()
+        self.registry = MetricsRegistry()
+        self.clock = FakeMonotonic()
+        self.instrumentation = OfficeInstrumentation(self.int_off, self.registry, name="A", clock=self.clock).attach()
+        instrument_gpio(self.registry)
+
+    def tearDown(self) -> None:
+        uninstrument_gpio()
+        self.instrumentation.detach()
+        GPIO.cleanup()
+
+    def test_counters_match_a_scripted_sequence(self):
+        # occupied with 450 lux and 800 ppm: the light and the fan are turned on
+        self.set_sensors(0, 450, 800)
+        self.int_off.manage_light_level()
+        self.int_off.monitor_air_quality()
+        # one minute later, 600 lux: the light is turned off
+        self.clock.now = 60.0
+        self.set_sensors(0, 600, 800)
+        self.int_off.manage_light_level()
+        # 30 seconds later, 400 ppm and the office is vacant: the fan is turned off, the light stays off
+        self.clock.now = 90.0
+        self.set_sensors(1, 600, 400)
+        self.int_off.monitor_air_quality()
+        self.int_off.manage_light_level()
+        self.assertEqual(7, self.registry.gpio_operations.get(operation="read"))
+        self.assertEqual(4, self.registry.gpio_operations.get(operation="write"))
+        self.assertEqual(2, self.registry.transitions.get(office="A", actuator="light_on"))
+        self.assertEqual(2, self.registry.transitions.get(office="A", actuator="fan_switch_on"))
+        self.assertEqual(60.0, self.registry.on_time.get(office="A", actuator="light_on"))
+        self.assertEqual(90.0, self.registry.on_time.get(office="A", actuator="fan_switch_on"))
+        self.assertEqual(3, self.registry.method_duration.count(office="A", method="manage_light_level"))
+        self.assertEqual(3, self.registry.method_duration.count(office="A", method="apply_light_level"))
+        self.assertEqual(3, self.registry.method_duration.count(office="A", method="check_occupancy"))
+
+    def set_sensors(self, infrared: int, light_level: int, co2_level: int) -> None:
+        GPIO.set_input(self.int_off.INFRARED_PIN, infrared)
+        GPIO.set_input(self.int_off.PHOTO_PIN, light_level)
+        GPIO.set_input(self.int_off.CO2_PIN, co2_level)
+
+    @patch.object(RTC, "get_current_datetime")
+    def test_tick_counts_bulk_reads_per_channel(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 12, 22, 0)  # MONDAY
+        GPIO.set_input(self.int_off.INFRARED_PIN, 1)
+        GPIO.set_input(self.int_off.CO2_PIN, 600)
+        self.int_off.tick()
+        self.assertEqual(3, self.registry.gpio_operations.get(operation="read"))
+        self.assertEqual(1, self.registry.method_duration.count(office="A", method="tick"))
+
+    def test_detach_restores_the_methods(self):
+        self.instrumentation.detach()
+        self.assertNotIn("tick", vars(self.int_off))
+
+    def test_write_textfile(self):
+        self.registry.transitions.inc(office="A", actuator="light_on")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "office.prom")
+            self.registry.write_textfile(path)
+            with open(path) as file:
+                self.assertIn('office_actuator_transitions_total{actuator="light_on",office="A"} 1', file.read())
+
+    def test_http_endpoint(self):
+        self.registry.transitions.inc(office="A", actuator="light_on")
+        server = self.registry.serve(port=0)
+        try:
+            url = "http://127.0.0.1:{}/metrics".format(server.server_address[1])
+            with urllib.request.urlopen(url) as response:
+                body = response.read().decode()
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertIn("# TYPE office_actuator_transitions_total counter", body)
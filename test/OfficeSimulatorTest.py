@@ -0,0 +1,85 @@
+import time
+import unittest
+from datetime import datetime, timedelta
+import mock.GPIO as GPIO
+from mock.Clock import SystemClock, VirtualClock
+from mock.RTC import RTC
+from OfficeSimulator import OfficeSimulator, synthetic_trace
+
+MONDAY = datetime(2026, 10, 12)
+
+
+class VirtualClockTest(unittest.TestCase):
+    def test_sleep_advances_the_clock(self):
+        clock = VirtualClock(MONDAY)
+        clock.sleep(90)
+        self.assertEqual(MONDAY + timedelta(seconds=90), clock.now())
+
+    def test_advance_to_never_goes_back(self):
+        clock = VirtualClock(MONDAY)
+        clock.advance_to(MONDAY - timedelta(hours=1))
+        self.assertEqual(MONDAY, clock.now())
+
+    def test_rtc_uses_the_injected_clock(self):
+        RTC.set_clock(VirtualClock(datetime(2026, 10, 17, 20, 30)))
+        try:
+            self.assertEqual(("20:30:00", "SATURDAY", 5), (RTC.get_current_time_string(), RTC.get_current_day(),
+                                                           RTC.get_current_weekday()))
+        finally:
+            RTC.set_clock(SystemClock())
+
+
+class OfficeSimulatorTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        GPIO.cleanup()
+
+    def test_light_switches_and_on_time(self):
+        simulator = OfficeSimulator(MONDAY)
+        simulator.load_trace([
+            (MONDAY + timedelta(hours=1), "INFRARED_PIN", 0),
+            (MONDAY + timedelta(hours=1), "PHOTO_PIN", 450),
+            (MONDAY + timedelta(hours=2), "INFRARED_PIN", 1),
+            (MONDAY, "CO2_PIN", 450),
+        ])
+        summary = simulator.run(until=MONDAY + timedelta(hours=3))
+        self.assertEqual(180, summary.ticks)
+        self.assertEqual(2, summary.switches["light_on"])
+        self.assertEqual(3600, summary.on_time["light_on"])
+        self.assertEqual(0, summary.switches["fan_switch_on"])
+
+    def test_blinds_move_twice_per_working_day(self):
+        simulator = OfficeSimulator(MONDAY, tick_period=timedelta(minutes=10))
+        simulator.load_trace([(MONDAY, "CO2_PIN", 450), (MONDAY, "INFRARED_PIN", 1)])
+        summary = simulator.run(until=MONDAY + timedelta(days=7))
+        self.assertEqual(10, summary.switches["blinds_open"])
+        self.assertEqual(5 * 12 * 3600, summary.on_time["blinds_open"])
+
+    def test_resumed_run_ticks_once_per_period(self):
+        trace = synthetic_trace(MONDAY, days=1, seed=42)
+        whole, _ = self.simulate(trace, days=1)
+        GPIO.cleanup()
+        simulator = OfficeSimulator(MONDAY)
+        simulator.load_trace(trace)
+        morning = simulator.run(until=MONDAY + timedelta(hours=12))
+        evening = simulator.run(until=MONDAY + timedelta(hours=24))
+        self.assertEqual((720, 720), (morning.ticks, evening.ticks))
+        for actuator in ("light_on", "blinds_open", "fan_switch_on"):
+            self.assertEqual(whole.switches[actuator], morning.switches[actuator] + evening.switches[actuator])
+            self.assertEqual(whole.on_time[actuator], morning.on_time[actuator] + evening.on_time[actuator])
+
+    def test_week_replay_is_fast_and_deterministic(self):
+        trace = synthetic_trace(MONDAY, days=7, seed=42)
+        first, elapsed = self.simulate(trace)
+        GPIO.cleanup()
+        second, _ = self.simulate(trace)
+        self.assertEqual(first, second)
+        self.assertLess(elapsed, 1)
+        self.assertEqual(7 * 24 * 60, first.ticks)
+
+    @staticmethod
+    def simulate(trace, days=7):
+        simulator = OfficeSimulator(MONDAY)
+        simulator.load_trace(trace)
+        start = time.perf_counter()
+        summary = simulator.run(until=MONDAY + timedelta(days=days))
+        return summary, time.perf_counter() - start
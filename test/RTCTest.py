@@ -0,0 +1,105 @@
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+import mock.GPIO as GPIO
+from mock.Clock import SystemClock
+from mock.RTC import RTC
+from BuildingController import BuildingController
+
+
+class CountingClock:
+    """
+    Clock that moves forward by a fixed step every time it is read.
+    """
+
+    def __init__(self, start: datetime, step: timedelta):
+        self.current = start
+        self.step = step
+        self.reads = 0
+
+    def now(self) -> datetime:
+        now = self.current
+        self.current += self.step
+        self.reads += 1
+        return now
+
+    def sleep(self, seconds: float) -> None:
+        self.current += timedelta(seconds=seconds)
+
+
+class RTCTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        RTC.invalidate()
+        RTC.set_clock(SystemClock())
+        GPIO.cleanup()
+
+    def test_readings_without_snapshot_can_straddle_midnight(self):
+        # Sunday 23:59:59.999, then Monday 00:00:00.000
+        RTC.set_clock(CountingClock(datetime(2026, 10, 18, 23, 59, 59, 999000), timedelta(milliseconds=1)))
+        self.assertEqual((6, 0), (RTC.get_current_weekday(), RTC.get_current_hour()))
+
+    def test_snapshot_is_consistent_at_midnight(self):
+        RTC.set_clock(CountingClock(datetime(2026, 10, 18, 23, 59, 59, 999000), timedelta(milliseconds=1)))
+        with RTC.frozen():
+            self.assertEqual((6, 23, 59, "SUNDAY", "23:59:59"),
+                             (RTC.get_current_weekday(), RTC.get_current_hour(), RTC.get_current_minute(),
+                              RTC.get_current_day(), RTC.get_current_time_string()))
+            self.assertEqual(datetime(2026, 10, 18).date(), RTC.get_current_date())
+        self.assertEqual(0, RTC.get_current_weekday())  # MONDAY once the snapshot is dropped
+
+    def test_snapshot_reads_the_clock_once_until_invalidated(self):
+        clock = CountingClock(datetime(2026, 10, 12, 9, 0), timedelta(minutes=1))
+        RTC.set_clock(clock)
+        RTC.take_snapshot()
+        for _ in range(5):
+            self.assertEqual(0, RTC.get_current_minute())
+        RTC.invalidate()
+        self.assertEqual(1, RTC.get_current_minute())
+        self.assertEqual(2, clock.reads)
+
+    def test_nested_frozen_shares_the_outer_snapshot(self):
+        RTC.set_clock(CountingClock(datetime(2026, 10, 12, 9, 0), timedelta(minutes=1)))
+        with RTC.frozen() as outer:
+            with RTC.frozen() as inner:
+                self.assertIs(outer, inner)
+            self.assertIs(outer, RTC.snapshot.get())
+        self.assertIsNone(RTC.snapshot.get())
+
+    def test_snapshot_is_local_to_the_thread(self):
+        clock = CountingClock(datetime(2026, 10, 12, 9, 0), timedelta(minutes=1))
+        RTC.set_clock(clock)
+        seen = []
+        with RTC.frozen():
+            thread = threading.Thread(target=lambda: seen.append((RTC.snapshot.get(), RTC.get_current_minute())))
+            thread.start()
+            thread.join()
+            self.assertEqual(0, RTC.get_current_minute())
+        self.assertEqual([(None, 1)], seen)
+
+    def test_other_threads_cannot_invalidate_the_snapshot(self):
+        RTC.set_clock(CountingClock(datetime(2026, 10, 12, 9, 0), timedelta(minutes=1)))
+        with RTC.frozen() as snapshot:
+            thread = threading.Thread(target=lambda: [RTC.take_snapshot(), RTC.invalidate()])
+            thread.start()
+            thread.join()
+            self.assertIs(snapshot, RTC.snapshot.get())
+
+    def test_frozen_installs_a_given_snapshot(self):
+        RTC.set_clock(CountingClock(datetime(2026, 10, 12, 9, 0), timedelta(minutes=1)))
+        snapshot = RTC.read()
+        with RTC.frozen():
+            with RTC.frozen(snapshot) as installed:
+                self.assertIs(snapshot, installed)
+            self.assertIsNot(snapshot, RTC.snapshot.get())
+
+    def test_building_tick_reads_the_clock_once(self):
+        clock = CountingClock(datetime(2026, 10, 12, 22, 0), timedelta(minutes=1))
+        RTC.set_clock(clock)
+        with BuildingController(max_workers=2) as building:
+            for _ in range(10):
+                office = building.add_office()
+                GPIO.set_input(office.INFRARED_PIN, 1)
+                GPIO.set_input(office.CO2_PIN, 600)
+            building.tick(chunk_size=3)
+        self.assertEqual(1, clock.reads)
@@ -0,0 +1,155 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import PropertyMock, patch
+
+import mock.GPIO as GPIO
+from mock.RTC import RTC
+from BlindsSchedule import BlindsScheduler
+from IntelligentOffice import IntelligentOffice
+from IntelligentOfficeError import IntelligentOfficeError
+from RuleEngine import RuleEngine, compile_rules
+
+
+class RuleEngineTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "rules.json")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        GPIO.cleanup()
+
+    def write_config(self, config: dict) -> None:
+        with open(self.path, "w") as file:
+            json.dump(config, file)
+        # Make sure the modification time changes even on coarse-grained file systems
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+    def test_default_rules_match_built_in_rules(self):
+        rules = compile_rules({})
+        for occupied in (False, True):
+            for lux in (499, 500, 525, 550, 551):
+                for light_on in (False, True):
+                    office = IntelligentOffice()
+                    office.light_on = light_on
+                    office.apply_light_level(occupied, lux)
+                    self.assertEqual(office.light_on, rules.light(occupied, lux, light_on))
+        for co2 in (499, 500, 650, 799, 800):
+            for fan_switch_on in (False, True):
+                office = IntelligentOffice()
+                office.fan_switch_on = fan_switch_on
+                office.apply_air_quality(co2)
+                self.assertEqual(office.fan_switch_on, rules.air_quality(co2, fan_switch_on))
+
+    def test_partial_config_keeps_defaults(self):
+        rules = compile_rules({"light": {"lux_min": 300}})
+        self.assertEqual({"lux_min": 300, "lux_max": 550}, rules.config["light"])
+        self.assertEqual(800, rules.config["air_quality"]["co2_on"])
+
+    def test_invalid_configs(self):
+        for config in ({"light": {"lux_min": 600, "lux_max": 550}}, {"air_quality": {"co2_on": 400}},
+                       {"blinds": {"open": "8h"}}, {"blinds": {"days": ["FUNDAY"]}}, {"heating": {}},
+                       {"blinds": {"open": "20:00", "close": "08:00"}}, {"blinds": {"open": "12:00", "close": "12:00"}}):
+            self.assertRaises(IntelligentOfficeError, compile_rules, config)
+
+    @patch.object(GPIO, "input")
+    def test_office_uses_engine_rules(self, mock_input):
+        self.write_config({"light": {"lux_min": 300, "lux_max": 350}})
+        office = IntelligentOffice(rules=RuleEngine(self.path))
+        mock_input.side_effect = [0, 400]  # occupied, 400 lux: above the configured band
+        office.light_on = True
+        office.manage_light_level()
+        self.assertFalse(office.light_on)
+
+    @patch.object(RTC, "get_current_datetime")
+    def test_blinds_use_engine_schedule(self, mock_datetime):
+        self.write_config({"blinds": {"open": "07:00", "days": ["SATURDAY"]}})
+        office = IntelligentOffice(rules=RuleEngine(self.path))
+        mock_datetime.return_value = datetime(2026, 10, 17, 7, 30)
+        self.assertTrue(office.blinds_action())
+
+    def test_hot_reload_swaps_rules(self):
+        self.write_config({"air_quality": {"co2_on": 700}})
+        engine = RuleEngine(self.path)
+        office = IntelligentOffice(rules=engine)
+        office.apply_air_quality(750)
+        self.assertTrue(office.fan_switch_on)
+        self.assertFalse(engine.reload_if_changed())
+
+        self.write_config({"air_quality": {"co2_on": 900, "co2_off": 760}})
+        self.assertTrue(engine.reload_if_changed())
+        office.apply_air_quality(750)
+        self.assertFalse(office.fan_switch_on)
+
+    def test_invalid_reload_keeps_current_rules(self):
+        self.write_config({"air_quality": {"co2_on": 700}})
+        engine = RuleEngine(self.path)
+        rules = engine.current
+        self.write_config({"air_quality": {"co2_on": 100}})
+        self.assertRaises(IntelligentOfficeError, engine.reload)
+        self.assertIs(rules, engine.current)
+
+    def test_malformed_configs_raise_intelligent_office_error(self):
+        for config in ({"light": {"lux_min": "300"}}, {"light": []}, {"blinds": {"holidays": 5}},
+                       {"blinds": {"open": 8}}, {"blinds": {"days": "MONDAY"}}, {"light": {"lux_min": True}},
+                       {"light": {"lux": 300}}, [], {"air_quality": None}):
+            self.assertRaises(IntelligentOfficeError, compile_rules, config)
+
+    def test_malformed_reload_keeps_current_rules(self):
+        self.write_config({"air_quality": {"co2_on": 700}})
+        engine = RuleEngine(self.path)
+        rules = engine.current
+        for config in ({"light": {"lux_min": "300"}}, {"light": []}, {"blinds": {"holidays": 5}},
+                       {"blinds": {"open": 8}}):
+            self.write_config(config)
+            self.assertRaises(IntelligentOfficeError, engine.reload_if_changed)
+            self.assertIs(rules, engine.current)
+        with open(self.path, "w") as file:
+            file.write("{not json")
+        self.assertRaises(IntelligentOfficeError, engine.reload)
+        self.assertIs(rules, engine.current)
+
+    def test_watcher_survives_malformed_configs(self):
+        self.write_config({"air_quality": {"co2_on": 700}})
+        engine = RuleEngine(self.path)
+        rules = engine.current
+        engine.watch(period=0.01)
+        try:
+            self.write_config({"light": {"lux_min": "300"}})
+            time.sleep(0.1)
+            self.assertIs(rules, engine.current)
+            self.assertTrue(engine.watcher.is_alive())
+            self.write_config({"air_quality": {"co2_on": 900}})
+            deadline = time.monotonic() + 5
+            while engine.current is rules and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(900, engine.current.config["air_quality"]["co2_on"])
+        finally:
+            engine.stop_watching()
+
+    @patch.object(RTC, "get_current_datetime")
+    def test_tick_reads_the_rules_once(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 12, 8, 0)  # MONDAY
+        engine = RuleEngine()
+        office = IntelligentOffice(rules=engine)
+        GPIO.set_input(office.INFRARED_PIN, 0)
+        GPIO.set_input(office.PHOTO_PIN, 450)
+        GPIO.set_input(office.CO2_PIN, 800)
+        with patch.object(RuleEngine, "current", new_callable=PropertyMock, create=True,
+                          return_value=engine.current) as mock_current:
+            office.tick()
+        mock_current.assert_called_once_with()
+        self.assertEqual((True, True, True), (office.light_on, office.blinds_open, office.fan_switch_on))
+
+    @patch.object(IntelligentOffice, "open_blinds")
+    def test_blinds_scheduler_uses_engine_schedule(self, mock_open_blinds):
+        self.write_config({"blinds": {"open": "07:00", "days": ["SATURDAY"]}})
+        office = IntelligentOffice(rules=RuleEngine(self.path))
+        self.assertIs(office.rules.current.blinds, office.effective_blinds_schedule)
+        BlindsScheduler(office).apply(datetime(2026, 10, 17, 7, 30))  # Saturday
+        mock_open_blinds.assert_called_once_with()
@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import Mock, patch
+import mock.GPIO as GPIO
+from IntelligentOffice import IntelligentOffice
+from SensorPipeline import RingBuffer, sample, rolling_mean, rolling_median, changes, smooth_readings, drive
+from Ventilation import PredictiveVentilation
+
+
+class SensorPipelineTest(unittest.TestCase):
+    def test_ring_buffer_keeps_the_last_values(self):
+        window = RingBuffer(3)
+        for value in [10, 20, 30, 40]:
+            window.append(value)
+        self.assertEqual((30, 30), (window.mean(), window.median()))
+
+    def test_ring_buffer_with_invalid_size(self):
+        self.assertRaises(ValueError, RingBuffer, 0)
+
+    def test_sample_at_the_given_rate(self):
+        sleep = Mock()
+        values = iter([1, 2, 3])
+        self.assertEqual([1, 2, 3], list(sample(lambda: next(values), period=0.5, count=3, sleep=sleep)))
+        self.assertEqual(2, sleep.call_count)
+        sleep.assert_called_with(0.5)
+
+    def test_rolling_mean(self):
+        self.assertEqual([10, 15, 20, 30], list(rolling_mean([10, 20, 30, 40], 3)))
+
+    def test_rolling_median_ignores_spikes(self):
+        self.assertEqual([500, 500, 500, 510], list(rolling_median([500, 500, 900, 510], 3)))
+
+    def test_changes(self):
+        self.assertEqual([1, 2, 1], list(changes([1, 1, 2, 2, 2, 1])))
+
+    def test_smooth_readings(self):
+        readings = [(True, 450, 700), (True, 900, 700), (True, 460, 1500)]
+        self.assertEqual((True, 460, 700), list(smooth_readings(readings, 3))[-1])
+
+    def test_smooth_readings_with_unknown_statistic(self):
+        self.assertRaises(ValueError, list, smooth_readings([(True, 450, 700)], 3, statistic="mode"))
+
+
+class SensorPipelineDriveTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.int_off = IntelligentOffice()
+
+    def tearDown(self) -> None:
+        GPIO.cleanup()
+
+    def test_spike_does_not_switch_the_light_off(self):
+        readings = [(True, 450, 600), (True, 450, 600), (True, 900, 600), (True, 540, 600)]
+        drive(self.int_off, smooth_readings(readings, 3))
+        self.assertEqual(True, self.int_off.light_on)
+
+    def test_spike_switches_the_light_off_without_smoothing(self):
+        readings = [(True, 450, 600), (True, 450, 600), (True, 900, 600), (True, 540, 600)]
+        drive(self.int_off, readings)
+        self.assertEqual(False, self.int_off.light_on)
+
+    def test_pipeline_reads_the_gpio(self):
+        GPIO.set_input(self.int_off.INFRARED_PIN, 0)
+        GPIO.set_input(self.int_off.PHOTO_PIN, 450)
+        GPIO.set_input(self.int_off.CO2_PIN, 900)
+        readings = sample(self.int_off.read_sensors, period=1, count=5, sleep=Mock())
+        self.assertEqual(1, drive(self.int_off, changes(smooth_readings(readings, 3))))
+        self.assertEqual((True, True), (self.int_off.light_on, self.int_off.fan_switch_on))
+
+    def test_readings_give_the_occupancy_to_the_ventilation(self):
+        self.int_off.ventilation = PredictiveVentilation()
+        readings = [(True, 450, 740), (True, 450, 750)]
+        with patch.object(self.int_off, "check_occupancy") as mock_check_occupancy:
+            drive(self.int_off, readings)
+        mock_check_occupancy.assert_not_called()
@@ -0,0 +1,107 @@
+import unittest
+from datetime import datetime
+from multiprocessing import shared_memory
+from unittest.mock import Mock, patch
+
+import mock.GPIO as GPIO
+from mock.Clock import VirtualClock
+from IntelligentOfficeError import IntelligentOfficeError
+from ShardedBuildingController import ShardedBuildingController, office_arguments, run_shard, FIELDS, LIGHT_ON, \
+    FAN_ON, BLINDS_OPEN
+from Ventilation import PredictiveVentilation
+
+NIGHT = VirtualClock(datetime(2026, 10, 12, 22, 0))  # Monday at 22:00
+MORNING = VirtualClock(datetime(2026, 10, 12, 9, 0))
+
+
+def broken_ventilation():
+    raise IntelligentOfficeError("No CO2 sensor")
+
+
+class ShardedBuildingControllerTest(unittest.TestCase):
+    def test_workers_tick_their_own_offices(self):
+        with ShardedBuildingController(5, workers=2, clock=NIGHT) as building:
+            self.assertEqual(2, len(building.workers))
+            building.set_readings(0, GPIO.LOW, 450, 800)  # occupied, dark, stale air
+            building.set_readings(4, GPIO.HIGH, 450, 400)  # vacant
+            building.tick()
+            self.assertEqual((GPIO.LOW, 450, 800, True, True, False), building.office_state(0))
+            self.assertEqual((False, False), building.office_state(4)[LIGHT_ON:BLINDS_OPEN])
+
+    def test_status_counts_actuators_of_all_offices(self):
+        with ShardedBuildingController(4, workers=2, clock=MORNING) as building:
+            for index in range(3):
+                building.set_readings(index, GPIO.LOW, 450, 400)
+            building.tick(ticks=3)
+            self.assertEqual({"light_on": 3, "fan_on": 0, "blinds_open": 4}, building.status())
+
+    def test_office_state_is_a_copy(self):
+        building = ShardedBuildingController(1, workers=1, clock=NIGHT)
+        row = building.office_state(0)
+        self.assertEqual(FIELDS, len(row))
+        building.set_readings(0, GPIO.LOW, 450, 900)
+        building.tick()
+        self.assertEqual(0, row[FAN_ON])
+        self.assertEqual(1, building.office_state(0)[FAN_ON])
+        building.close()  # the copy does not keep the block from being closed
+        self.assertRaises(FileNotFoundError, shared_memory.SharedMemory, name=building.block.name)
+
+    def test_close_unlinks_the_block_when_a_worker_died(self):
+        building = ShardedBuildingController(2, workers=2, clock=NIGHT)
+        name = building.block.name
+        building.workers[0][0].kill()
+        building.workers[0][0].join()
+        building.close()
+        building.close()
+        self.assertRaises(FileNotFoundError, shared_memory.SharedMemory, name=name)
+
+    def test_failed_start_unlinks_the_block(self):
+        names = []
+        create = shared_memory.SharedMemory
+
+        def record(*args, **kwargs):
+            block = create(*args, **kwargs)
+            names.append(block.name)
+            return block
+
+        # Worker start fails: the offices cannot be built
+        with patch.object(shared_memory, "SharedMemory", side_effect=record):
+            self.assertRaises(EOFError, ShardedBuildingController, 2, workers=2, clock=NIGHT,
+                              ventilation=broken_ventilation)
+        self.assertRaises(FileNotFoundError, create, name=names[0])
+
+    def test_failed_office_releases_the_block_in_the_worker(self):
+        blocks = []
+        attach = shared_memory.SharedMemory
+
+        def record(*args, **kwargs):
+            block = attach(*args, **kwargs)
+            blocks.append(block)
+            return block
+
+        owner = attach(create=True, size=FIELDS * 4)
+        try:
+            with patch.object(shared_memory, "SharedMemory", side_effect=record), patch.object(GPIO, "set_timing"):
+                self.assertRaises(IntelligentOfficeError, run_shard, owner.name, 0, 1, None,
+                                  {"ventilation": broken_ventilation}, Mock())
+            self.assertIsNone(blocks[0].buf)
+        finally:
+            owner.close()
+            owner.unlink()
+
+    def test_pins_are_rejected(self):
+        self.assertRaises(IntelligentOfficeError, ShardedBuildingController, 2, workers=1, pins={"LED_PIN": 40})
+
+    def test_stateful_collaborators_are_built_per_office(self):
+        self.assertRaises(IntelligentOfficeError, ShardedBuildingController, 2, workers=1,
+                          ventilation=PredictiveVentilation())
+        arguments = [office_arguments({"ventilation": PredictiveVentilation, "async_servo": False})
+                     for _ in range(2)]
+        self.assertIsNot(arguments[0]["ventilation"], arguments[1]["ventilation"])
+        self.assertFalse(arguments[0]["async_servo"])
+        with ShardedBuildingController(2, workers=1, clock=NIGHT, ventilation=PredictiveVentilation) as building:
+            building.tick()
+
+    def test_workers_are_limited_to_the_number_of_offices(self):
+        with ShardedBuildingController(1, workers=4, clock=NIGHT) as building:
+            self.assertEqual(1, len(building.workers))
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import mock.GPIO as GPIO
+from mock.RTC import RTC
+from IntelligentOffice import IntelligentOffice
+from IntelligentOfficeError import IntelligentOfficeError
+from BuildingController import BuildingController
+from StateSnapshot import StateSnapshot, HEADER, RECORD
+
+
+class StateSnapshotTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "building.snapshot")
+        self.offices = [IntelligentOffice(pins=BuildingController.pin_map(index)) for index in range(3)]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        GPIO.cleanup()
+
+    def test_file_has_fixed_layout(self):
+        StateSnapshot(self.path, 3).close()
+        self.assertEqual(HEADER.size + 3 * RECORD.size, os.path.getsize(self.path))
+
+    def test_restore_after_restart(self):
+        self.offices[1].blinds_open = True
+        self.offices[1].light_on = True
+        self.offices[2].fan_switch_on = True
+        with StateSnapshot(self.path, 3) as snapshot:
+            snapshot.save_all(self.offices)
+        GPIO.cleanup()
+        restarted = [IntelligentOffice(pins=BuildingController.pin_map(index)) for index in range(3)]
+        with StateSnapshot(self.path, 3) as snapshot:
+            self.assertEqual(3, snapshot.restore_all(restarted))
+        self.assertEqual([(False, False, False), (True, True, False), (False, False, True)],
+                         [(office.blinds_open, office.light_on, office.fan_switch_on) for office in restarted])
+        self.assertEqual(GPIO.HIGH, GPIO.output_value(restarted[1].LED_PIN))
+        self.assertEqual(GPIO.HIGH, GPIO.output_value(restarted[2].FAN_PIN))
+
+    def test_offices_never_saved_are_not_restored(self):
+        with StateSnapshot(self.path, 3) as snapshot:
+            snapshot.save(2, self.offices[2])
+            self.assertEqual(1, snapshot.restore_all(self.offices))
+
+    @patch.object(RTC, "get_current_datetime")
+    def test_restored_blinds_are_not_moved_again(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 12, 9, 0)
+        self.offices[0].blinds_open = True
+        with StateSnapshot(self.path, 3) as snapshot:
+            snapshot.save(0, self.offices[0])
+            office = IntelligentOffice()
+            snapshot.restore_all([office])
+        with patch.object(office.pwm, "ChangeDutyCycle") as mock_duty_cycle:
+            office.manage_blinds_based_on_time()
+        mock_duty_cycle.assert_not_called()
+
+    def test_out_of_range_index_is_rejected(self):
+        with StateSnapshot(self.path, 3) as snapshot:
+            for index in (-1, 3):
+                self.assertRaises(IntelligentOfficeError, snapshot.save, index, self.offices[0])
+            self.assertRaises(IntelligentOfficeError, snapshot.save_all, self.offices * 2)
+        StateSnapshot(self.path, 3).close()  # the header is intact
+
+    def test_failed_restore_closes_the_snapshot(self):
+        snapshot = StateSnapshot(self.path, 3)
+        snapshot.save(0, self.offices[0])
+        with patch.object(self.offices[0], "restore_state", side_effect=RuntimeError("restore failed")):
+            with self.assertRaisesRegex(RuntimeError, "restore failed"):
+                with snapshot:
+                    snapshot.restore_all(self.offices)
+        self.assertTrue(snapshot.map.closed)
+
+    @patch.object(RTC, "get_current_datetime")
+    def test_stale_states_are_not_restored(self, mock_datetime):
+        mock_datetime.return_value = datetime(2026, 10, 12, 9, 0)
+        with StateSnapshot(self.path, 3) as snapshot:
+            snapshot.save(0, self.offices[0])
+            mock_datetime.return_value = datetime(2026, 10, 12, 10, 0)
+            snapshot.save(1, self.offices[1])
+            mock_datetime.return_value = datetime(2026, 10, 12, 10, 30)
+            self.assertEqual(1, snapshot.restore_all(self.offices, max_age=timedelta(hours=1)))
+            self.assertEqual(2, snapshot.restore_all(self.offices))
+
+    def test_mismatching_file_is_rejected(self):
+        StateSnapshot(self.path, 3).close()
+        self.assertRaises(IntelligentOfficeError, StateSnapshot, self.path, 4)
+        with open(self.path, "r+b") as file:
+            file.write(b"JUNK")
+        self.assertRaises(IntelligentOfficeError, StateSnapshot, self.path, 3)
@@ -0,0 +1,162 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import Mock
+import mock.GPIO as GPIO
+from mock.Clock import SystemClock, VirtualClock
+from mock.RTC import RTC
+from IntelligentOffice import IntelligentOffice
+from TrafficReplay import ActionRecorder, TrafficReplayer
+
+
+class TrafficRecorderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "traffic.log")
+
+    def tearDown(self) -> None:
+        GPIO.stop_recording()
+        GPIO.cleanup()
+        self.directory.cleanup()
+
+    def test_recorded_events_are_read_back(self):
+        GPIO.start_recording(self.path)
+        GPIO.set_input(22, 450)
+        GPIO.input(22)
+        GPIO.output(29, GPIO.HIGH)
+        GPIO.mark(11)
+        GPIO.stop_recording()
+        records = [(channel, operation, value) for _, channel, operation, value in GPIO.read_log(self.path)]
+        self.assertEqual([(22, GPIO.TRACE_SET_INPUT, 450), (22, GPIO.TRACE_INPUT, 450),
+                          (29, GPIO.TRACE_OUTPUT, 1)], records[:3])
+        self.assertEqual((11, GPIO.TRACE_MARK), records[3][:2])
+
+    def test_log_is_read_in_chunks(self):
+        GPIO.start_recording(self.path)
+        for value in range(1000):
+            GPIO.output(29, value % 2)
+        GPIO.stop_recording()
+        values = [value for _, _, _, value in GPIO.read_log(self.path, chunk_records=7)]
+        self.assertEqual([value % 2 for value in range(1000)], values)
+
+    def test_log_size(self):
+        GPIO.start_recording(self.path)
+        GPIO.output(29, GPIO.HIGH)
+        GPIO.stop_recording()
+        self.assertEqual(GPIO.TRACE_RECORD.size, os.path.getsize(self.path))
+
+
+class TrafficReplayerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "traffic.log")
+        self.int_off = IntelligentOffice()
+
+    def tearDown(self) -> None:
+        GPIO.stop_recording()
+        GPIO.cleanup()
+        RTC.set_clock(SystemClock())
+        self.directory.cleanup()
+
+    def test_replay_reproduces_the_recorded_decisions(self):
+        RTC.set_clock(VirtualClock(datetime(2026, 10, 12, 22, 0)))  # MONDAY
+        recorder = ActionRecorder([self.int_off]).attach()
+        GPIO.start_recording(self.path)
+        for infrared, light_level, co2_level in [(0, 450, 800), (0, 600, 600), (0, 450, 400)]:
+            GPIO.set_input(self.int_off.INFRARED_PIN, infrared)
+            GPIO.set_input(self.int_off.PHOTO_PIN, light_level)
+            GPIO.set_input(self.int_off.CO2_PIN, co2_level)
+            self.int_off.tick()
+        GPIO.stop_recording()
+        recorder.detach()
+        recorded = (self.int_off.light_on, self.int_off.fan_switch_on)
+        GPIO.cleanup()
+        RTC.set_clock(SystemClock())
+
+        replayed_office = IntelligentOffice()
+        stats = TrafficReplayer([replayed_office]).replay(self.path)
+        self.assertEqual(3, stats.ticks)
+        self.assertEqual(recorded, (replayed_office.light_on, replayed_office.fan_switch_on))
+        self.assertEqual((True, False), recorded)
+        self.assertFalse(replayed_office.blinds_open)
+        self.assertIsInstance(RTC.clock, SystemClock)
+
+    def test_replay_runs_the_actions_at_the_recorded_time(self):
+        clock = VirtualClock(datetime(2026, 10, 12, 7, 59))  # MONDAY
+        RTC.set_clock(clock)
+        recorder = ActionRecorder([self.int_off]).attach()
+        GPIO.start_recording(self.path)
+        self.int_off.manage_blinds_based_on_time()
+        clock.advance_to(datetime(2026, 10, 12, 8, 0))
+        self.int_off.manage_blinds_based_on_time()
+        GPIO.stop_recording()
+        recorder.detach()
+        RTC.set_clock(SystemClock())
+        marks = [(operation, datetime.fromtimestamp(value)) for _, _, operation, value in GPIO.read_log(self.path)
+                 if operation == GPIO.TRACE_MARK_BLINDS]
+        self.assertEqual([(GPIO.TRACE_MARK_BLINDS, datetime(2026, 10, 12, 7, 59)),
+                          (GPIO.TRACE_MARK_BLINDS, datetime(2026, 10, 12, 8, 0))], marks)
+
+        replayed_office = IntelligentOffice()
+        replayed_office.manage_blinds_based_on_time = Mock(side_effect=lambda: times.append(RTC.get_current_datetime()))
+        times = []
+        TrafficReplayer([replayed_office]).replay(self.path)
+        self.assertEqual([datetime(2026, 10, 12, 7, 59), datetime(2026, 10, 12, 8, 0)], times)
+
+    def test_actions_run_by_a_tick_are_not_marked(self):
+        GPIO.set_input(self.int_off.PHOTO_PIN, 450)
+        GPIO.set_input(self.int_off.CO2_PIN, 600)
+        recorder = ActionRecorder([self.int_off]).attach()
+        GPIO.start_recording(self.path)
+        self.int_off.tick()
+        GPIO.stop_recording()
+        recorder.detach()
+        marks = [operation for _, _, operation, _ in GPIO.read_log(self.path) if operation in TrafficReplayer.MARKS]
+        self.assertEqual([GPIO.TRACE_MARK], marks)
+        self.assertNotIn("tick", self.int_off.__dict__)
+
+    def test_replay_of_async_runtime_actions(self):
+        RTC.set_clock(VirtualClock(datetime(2026, 10, 12, 9, 0)))  # MONDAY
+        recorder = ActionRecorder([self.int_off]).attach()
+        GPIO.start_recording(self.path)
+        GPIO.set_input(self.int_off.INFRARED_PIN, 0)
+        GPIO.set_input(self.int_off.PHOTO_PIN, 450)
+        GPIO.set_input(self.int_off.CO2_PIN, 900)
+
+        async def run():
+            # The actions AsyncRuntime runs as separate tasks
+            self.int_off.manage_light_level()
+            self.int_off.monitor_air_quality()
+            await self.int_off.manage_blinds_async(asyncio.sleep)
+        asyncio.run(run())
+        GPIO.stop_recording()
+        recorder.detach()
+        GPIO.cleanup()
+        RTC.set_clock(SystemClock())
+
+        replayed_office = IntelligentOffice()
+        stats = TrafficReplayer([replayed_office]).replay(self.path)
+        self.assertEqual(3, stats.ticks)
+        self.assertEqual((True, True, True), (replayed_office.light_on, replayed_office.fan_switch_on,
+                                              replayed_office.blinds_open))
+
+    def test_replayed_values_are_not_truncated(self):
+        with open(self.path, "wb") as file:
+            file.write(GPIO.TRACE_RECORD.pack(100.0, 22, GPIO.TRACE_SET_INPUT, 450.5))
+            file.write(GPIO.TRACE_RECORD.pack(100.0, 29, GPIO.TRACE_SET_INPUT, 1))
+        TrafficReplayer([self.int_off]).replay(self.path)
+        self.assertEqual(450.5, GPIO.input(22))
+        self.assertEqual(1, GPIO.input(29))
+        self.assertIsInstance(GPIO.input(29), int)
+
+    def test_replay_with_original_timing(self):
+        with open(self.path, "wb") as file:
+            file.write(GPIO.TRACE_RECORD.pack(100.0, 22, GPIO.TRACE_SET_INPUT, 450))
+            file.write(GPIO.TRACE_RECORD.pack(102.5, 22, GPIO.TRACE_SET_INPUT, 600))
+        sleep = Mock()
+        stats = TrafficReplayer([self.int_off], realtime=True, sleep=sleep).replay(self.path)
+        self.assertEqual(2, stats.events)
+        self.assertAlmostEqual(2.5, sleep.call_args[0][0], places=1)
+        self.assertEqual(600, GPIO.input(22))
@@ -0,0 +1,118 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import mock.GPIO as GPIO
+from mock.RTC import RTC
+from IntelligentOffice import IntelligentOffice
+from RuleEngine import RuleEngine, compile_rules
+from OfficeSimulator import OfficeSimulator, RoomAir, synthetic_trace
+from Ventilation import PredictiveVentilation
+
+MONDAY = datetime(2026, 10, 12)
+
+
+class PredictiveVentilationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ventilation = PredictiveVentilation()
+
+    def feed(self, readings, occupied, fan_switch_on=False):
+        decision = None
+        for minute, co2 in readings:
+            decision = self.ventilation.decide(MONDAY + timedelta(minutes=minute), co2, occupied, fan_switch_on,
+                                               IntelligentOffice.CO2_MAX, IntelligentOffice.CO2_MIN)
+        return decision
+
+    def test_starts_early_when_occupied(self):
+        # 760 ppm rising by 5 ppm per minute reaches 800 ppm within the 10 minute horizon
+        self.assertTrue(self.feed([(0, 740), (2, 750), (4, 760)], occupied=True))
+
+    def test_stays_off_when_co2_is_stable(self):
+        self.assertFalse(self.feed([(0, 760), (2, 760), (4, 760)], occupied=False))
+
+    def test_falls_back_without_history_when_vacant(self):
+        self.assertIsNone(self.feed([(0, 700)], occupied=False))
+
+    def test_always_on_at_co2_max(self):
+        self.assertTrue(self.feed([(0, 800)], occupied=False))
+
+    def test_burst_stops_at_target(self):
+        self.assertTrue(self.feed([(0, 700)], occupied=True, fan_switch_on=True))
+        self.assertFalse(self.feed([(1, 650)], occupied=True, fan_switch_on=True))
+
+    def test_falls_back_when_clock_goes_backwards(self):
+        self.feed([(5, 700)], occupied=True)
+        self.assertIsNone(self.feed([(0, 700)], occupied=True))
+
+    def test_thresholds_default_to_the_ones_of_the_office(self):
+        self.assertEqual((800, 650), self.ventilation.thresholds(800, 500))
+        self.assertEqual((600, 600), PredictiveVentilation(co2_max=600).thresholds(800, 500))
+
+    def test_fan_is_kept_on_for_min_on(self):
+        self.feed([(0, 700)], occupied=False)
+        self.assertTrue(self.feed([(1, 700)], occupied=False, fan_switch_on=True))
+        self.assertTrue(self.feed([(2, 600)], occupied=False, fan_switch_on=True))
+        self.assertFalse(self.feed([(16, 600)], occupied=False, fan_switch_on=True))
+
+    def test_fan_is_kept_off_for_min_off_below_co2_max(self):
+        self.feed([(0, 700)], occupied=True, fan_switch_on=True)
+        self.assertFalse(self.feed([(1, 790)], occupied=True))
+        self.assertTrue(self.feed([(2, 800)], occupied=True))
+
+    def test_rate_is_the_least_squares_slope(self):
+        self.feed([(0, 500), (1, 503), (2, 504), (3, 509)], occupied=False)
+        self.assertAlmostEqual(2.8, self.ventilation.rate())
+
+
+class PredictiveVentilationOfficeTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        GPIO.cleanup()
+
+    @patch.object(GPIO, "input")
+    def test_monitor_air_quality_checks_occupancy(self, mock_input):
+        office = IntelligentOffice(ventilation=PredictiveVentilation())
+        mock_input.side_effect = [780, 0]  # CO2, then infrared: occupied
+        office.monitor_air_quality()
+        self.assertTrue(office.fan_switch_on)
+
+    @patch.object(RTC, "get_current_datetime")
+    def test_burst_ends_below_the_target(self, mock_datetime):
+        office = IntelligentOffice(ventilation=PredictiveVentilation())
+        mock_datetime.return_value = MONDAY
+        office.fan_switch_on = True
+        office.apply_air_quality(450, occupied=False)
+        self.assertFalse(office.fan_switch_on)
+
+    @patch.object(RTC, "get_current_datetime")
+    def test_hysteresis_is_the_fallback(self, mock_datetime):
+        office = IntelligentOffice(ventilation=PredictiveVentilation())
+        mock_datetime.return_value = MONDAY
+        office.apply_air_quality(700, occupied=False)
+        self.assertFalse(office.fan_switch_on)  # no prediction: hysteresis keeps the fan off between thresholds
+        office.apply_air_quality(800, occupied=False)
+        self.assertTrue(office.fan_switch_on)
+
+    @patch.object(RTC, "get_current_datetime")
+    def test_thresholds_of_the_rule_engine_are_used(self, mock_datetime):
+        rules = RuleEngine()
+        rules.current = compile_rules({"air_quality": {"co2_on": 1000, "co2_off": 600}})
+        office = IntelligentOffice(rules=rules, ventilation=PredictiveVentilation())
+        mock_datetime.return_value = MONDAY
+        office.apply_air_quality(850, occupied=False)
+        self.assertFalse(office.fan_switch_on)  # would be on with the threshold of the office
+        office.apply_air_quality(1000, occupied=False)
+        self.assertTrue(office.fan_switch_on)
+        self.assertEqual((1000, 800), office.ventilation.thresholds(*office.effective_co2_thresholds))
+
+    def test_predictive_ventilation_runs_the_fan_less_on_a_simulated_week(self):
+        trace = [event for event in synthetic_trace(MONDAY) if event[1] != "CO2_PIN"]
+        summaries = []
+        for ventilation in (None, PredictiveVentilation()):
+            GPIO.cleanup()
+            simulator = OfficeSimulator(MONDAY, IntelligentOffice(ventilation=ventilation), air=RoomAir())
+            simulator.load_trace(trace)
+            summaries.append(simulator.run(until=MONDAY + timedelta(days=7)))
+        hysteresis, predictive = summaries
+        self.assertLess(predictive.on_time["fan_switch_on"], hysteresis.on_time["fan_switch_on"])
+        self.assertLess(predictive.peak_co2, hysteresis.peak_co2)
+        self.assertLess(predictive.peak_co2, IntelligentOffice.CO2_MAX)